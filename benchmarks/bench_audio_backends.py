@@ -0,0 +1,90 @@
+"""
+Audio backend startup benchmark.
+
+Opens each available backend in a fresh interpreter and reports the time
+to import and open it, the latency of the first play (load plus play) and
+the peak resident memory of the process::
+
+    SDL_AUDIODRIVER=dummy python -m benchmarks.bench_audio_backends --output backends.json
+
+Qt is measured with an offscreen ``QApplication``, which the GUI already
+pays for; its import time therefore includes PyQt6 itself.
+"""
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.harness import BenchmarkRun, finish, make_parser
+
+CHILD_SCRIPT = r"""
+import json, os, resource, sys, time
+name, path = sys.argv[1], sys.argv[2]
+start = time.perf_counter()
+if name == "qt":
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication([])
+from pomodoro.audio_backends import BACKENDS
+backend = BACKENDS[name]()
+backend.open()
+opened = time.perf_counter()
+backend.play(backend.load(path, 0.5))
+played = time.perf_counter()
+backend.close()
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"open": opened - start, "first_play": played - opened, "rss_kb": rss_kb}))
+"""
+
+
+def measure_backend(name, path):
+    """
+    Measure one backend in a child interpreter.
+
+    Returns:
+        dict | None: ``open``/``first_play`` seconds and ``rss_kb``, or None
+        if the backend could not be opened
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, name, path],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        print(f"{name}: unavailable ({error[0]})", file=sys.stderr)
+        return None
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    from pomodoro.audio_backends import BACKEND_NAMES, BACKENDS
+    from pomodoro.config import DEFAULT_CONFIG
+    from pomodoro.utils import get_resource_path
+
+    parser = make_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--backend",
+        action="append",
+        choices=BACKEND_NAMES,
+        help="Backend to measure (repeatable, default: all available)",
+    )
+    args = parser.parse_args(argv)
+
+    path = get_resource_path(DEFAULT_CONFIG["sounds"]["focus_end"]["file"])
+    run = BenchmarkRun("audio_backends")
+    for name in args.backend or BACKEND_NAMES:
+        if not BACKENDS[name].available():
+            print(f"{name}: not installed", file=sys.stderr)
+            continue
+        stats = measure_backend(name, path)
+        if stats is None:
+            continue
+        run.record(f"open[{name}]", stats["open"], rss_kb=stats["rss_kb"])
+        run.record(f"first_play[{name}]", stats["first_play"])
+    return finish(run, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Benchmarks for the session and configuration data layer.
+
+Generates synthetic session logs and times the hot paths of
+``SessionManager`` and ``Config``::
+
+    python -m benchmarks.bench_data_layer --sizes 10k,1M --output results.json
+    python -m benchmarks.bench_data_layer --baseline results.json --threshold 0.2
+"""
+import datetime
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+from benchmarks.harness import BenchmarkRun, finish, make_parser
+from pomodoro.config import Config
+from pomodoro.session import SessionManager
+
+SIZES = {"10k": 10_000, "1M": 1_000_000, "10M": 10_000_000}
+
+# One in five generated lines is a completed session, the rest are events
+SESSION_RATIO = 5
+EVENTS = ["Started Rest", "Paused Focus", "Continued Focus: Task", "Started Focus: Task"]
+
+
+def generate_log(path, lines, seed=0):
+    """
+    Write a synthetic sessions log whose last entries fall on today.
+
+    Args:
+        path: Output file
+        lines: Number of lines
+        seed: Random seed for reproducible content
+    """
+    rng = random.Random(seed)
+    gap = 180
+    start = datetime.datetime.now() - datetime.timedelta(seconds=gap * lines)
+    epoch = start.timestamp()
+    number = 0
+    with open(path, "w") as file:
+        buffer = []
+        for i in range(lines):
+            epoch += rng.randint(1, 2 * gap - 1)
+            ts = datetime.datetime.fromtimestamp(min(epoch, datetime.datetime.now().timestamp()))
+            stamp = ts.strftime("%Y-%m-%d %H:%M:%S")
+            if i % SESSION_RATIO == 0:
+                number += 1
+                status = "success" if rng.random() < 0.8 else "failed"
+                buffer.append(f"Session {number} completed at {stamp} - Task {rng.randint(0, 40)} - {status}\n")
+            else:
+                buffer.append(f"Event at {stamp} - {EVENTS[i % len(EVENTS)]}\n")
+            if len(buffer) >= 10_000:
+                file.writelines(buffer)
+                buffer = []
+        file.writelines(buffer)
+
+
+def _remove_sidecars(log_file):
+    for suffix in (".idx", ".rollup.json"):
+        try:
+            os.remove(log_file + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def bench_history(run, label, log_file):
+    """Time startup and stats for one history size."""
+    run.measure(
+        f"session_init_cold[{label}]",
+        lambda: SessionManager(log_file).close(),
+        setup=lambda: _remove_sidecars(log_file),
+    )
+    run.measure(f"session_init_warm[{label}]", lambda: SessionManager(log_file).close())
+
+    def first_stats():
+        manager = SessionManager(log_file)
+        manager.get_daily_stats()
+        manager.close()
+
+    run.measure(f"daily_stats_first[{label}]", first_stats)
+    manager = SessionManager(log_file)
+    manager.get_daily_stats()
+    run.measure(f"daily_stats[{label}]", manager.get_daily_stats, number=100)
+    manager.close()
+
+
+def bench_log_session(run, work_dir, count=2000):
+    """Time log_session throughput with synchronous and write-behind writes."""
+    for policy in (None, "batch"):
+        log_file = os.path.join(work_dir, f"append-{policy}.log")
+
+        def setup():
+            for path in (log_file, log_file + ".idx", log_file + ".rollup.json"):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        def append():
+            manager = SessionManager(log_file, flush_policy=policy)
+            for i in range(count):
+                manager.log_session(f"Task {i}", success=True)
+            manager.close()
+
+        run.measure(f"log_session[{policy or 'sync'}]", append, setup=setup, ops=count)
+
+
+def bench_config(run, work_dir, count=200):
+    """Time Config load/save round trips."""
+    config_path = os.path.join(work_dir, "config.json")
+
+    def round_trip():
+        for i in range(count):
+            config = Config(config_path)
+            config.set_focus_period(25 + i % 2)
+
+    run.measure("config_round_trip", round_trip, ops=count)
+
+
+def main(argv=None):
+    parser = make_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="10k,1M,10M",
+        help="Comma-separated history sizes to generate (default: 10k,1M,10M)",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=os.path.join(tempfile.gettempdir(), "pomodoro-bench"),
+        help="Directory for generated logs, reused between runs",
+    )
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    run = BenchmarkRun("data_layer")
+    for label in args.sizes.split(","):
+        lines = SIZES[label]
+        log_file = os.path.join(args.data_dir, f"sessions-{label}.log")
+        if not os.path.exists(log_file):
+            print(f"Generating {lines} lines into {log_file}", flush=True)
+            generate_log(log_file, lines)
+        bench_history(run, label, log_file)
+
+    work_dir = tempfile.mkdtemp(prefix="pomodoro-bench-")
+    try:
+        bench_log_session(run, work_dir)
+        bench_config(run, work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return finish(run, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Obsidian session sink benchmark.
+
+Measures the per-event cost of ``NotesManager.record_pomodoro_session``
+with the debounce disabled, for the Advanced URI backend and for direct
+writes into a local vault folder::
+
+    python -m benchmarks.bench_notes --output notes.json
+
+The URI backend is measured up to the process spawn: ``true`` is launched
+in place of ``xdg-open``, so the time Obsidian and the Advanced URI plugin
+take on top of that is not included and the real gap is larger.
+
+``ui_open_url[popen]`` and ``ui_open_url[launcher]`` compare the time the
+calling (UI) thread spends per URL when it spawns the opener itself versus
+handing the URL to the background ``UrlLauncher``.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.harness import BenchmarkRun, finish, make_parser
+from pomodoro.config import Config
+from pomodoro.launcher import UrlLauncher
+from pomodoro.notes import NotesManager
+
+
+def make_manager(tmp, vault_path=""):
+    config = Config(os.path.join(tmp, "config.json"))
+    config.set_values(
+        "obsidian",
+        {"enabled": True, "vault_name": "bench", "append_debounce_seconds": 0, "vault_path": vault_path},
+    )
+    manager = NotesManager(config)
+    manager.enabled = True
+    return manager
+
+
+def main(argv=None):
+    parser = make_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=200, help="Events per measurement round")
+    args = parser.parse_args(argv)
+
+    true_path = shutil.which("true")
+    run = BenchmarkRun("notes")
+    with tempfile.TemporaryDirectory() as tmp:
+
+        def record_events(manager):
+            for i in range(args.events):
+                manager.record_pomodoro_session(focus_text=f"Task {i}", success=True, planned_minutes=25)
+
+        if true_path:
+            uri_manager = make_manager(tmp)
+            uri_manager._open_obsidian_url = lambda url: subprocess.Popen([true_path, url]).wait()
+            run.measure("record[uri]", lambda: record_events(uri_manager), repeat=1, ops=args.events)
+            uri_manager.close()
+
+            processes = []
+            run.measure(
+                "ui_open_url[popen]",
+                lambda: processes.append(subprocess.Popen([true_path, "obsidian://adv-uri"])),
+                number=args.events,
+            )
+            for process in processes:
+                process.wait()
+            launcher = UrlLauncher(command=[true_path], max_concurrent=4)
+            run.measure(
+                "ui_open_url[launcher]",
+                lambda: launcher.submit("obsidian://adv-uri"),
+                number=args.events,
+            )
+            launcher.close(timeout=60)
+        else:
+            print("record[uri]: skipped, no 'true' executable", file=sys.stderr)
+
+        vault = os.path.join(tmp, "vault")
+        direct_manager = make_manager(tmp, vault)
+        run.measure("record[direct]", lambda: record_events(direct_manager), ops=args.events)
+        direct_manager.close()
+    return finish(run, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
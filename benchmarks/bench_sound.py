@@ -0,0 +1,61 @@
+"""
+Alert sound latency benchmark.
+
+Compares the time from "play" to the sound being queued on the mixer for
+the old load-and-play path (``pygame.mixer.music.load`` + ``play``) and
+the cached in-memory ``Sound`` played on a reserved channel::
+
+    SDL_AUDIODRIVER=dummy python -m benchmarks.bench_sound --output sound.json
+"""
+import os
+import sys
+import tempfile
+
+from benchmarks.harness import BenchmarkRun, finish, make_parser
+from pomodoro.audio_backends import PygameBackend
+from pomodoro.config import Config
+from pomodoro.sound import SoundManager
+from pomodoro.utils import get_resource_path
+
+
+def main(argv=None):
+    parser = make_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument("--plays", type=int, default=50, help="Plays per measurement round")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = Config(os.path.join(tmp, "config.json"))
+        manager = SoundManager(config)
+        # Drive the backend on this thread rather than through the audio worker
+        backend = manager._backend = PygameBackend()
+        try:
+            backend.open()
+        except Exception as e:
+            print(f"No audio device ({e}); try SDL_AUDIODRIVER=dummy", file=sys.stderr)
+            return 2
+        pygame = backend._pygame
+        sound_file = config.get_focus_sound()
+        volume = config.get_focus_volume()
+        path = get_resource_path(sound_file)
+
+        run = BenchmarkRun("sound")
+
+        def load_and_play():
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play()
+            pygame.mixer.music.stop()
+
+        def cached_play():
+            manager._play_sound(sound_file, volume)
+            backend._channel.stop()
+
+        run.measure("alert[load_and_play]", load_and_play, number=args.plays)
+        manager.warm_cache()
+        run.measure("alert[cached]", cached_play, number=args.plays)
+        backend.close()
+    return finish(run, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Shared helpers for the benchmark scripts.
+Collects timings, writes them to a JSON results file and compares them
+against a stored baseline.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+
+class BenchmarkRun:
+    """A set of named measurements from one benchmark run."""
+
+    def __init__(self, suite):
+        """
+        Initialize the run.
+
+        Args:
+            suite: Name of the benchmark suite
+        """
+        self.suite = suite
+        self.results = {}
+
+    def measure(self, name, func, repeat=3, number=1, setup=None, ops=1):
+        """
+        Time ``func`` and record the best per-call duration.
+
+        Args:
+            name: Result name
+            func: Callable to time
+            repeat: Number of timing rounds; the fastest round is kept
+            number: Calls per round
+            setup: Optional callable run before every round (not timed)
+            ops: Operations performed by one call; when greater than one the
+                result is reported per operation together with a rate
+
+        Returns:
+            float: Best seconds per call (per operation if ``ops`` is given)
+        """
+        best = float("inf")
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            best = min(best, (time.perf_counter() - start) / number)
+        if ops > 1:
+            best /= ops
+            self.record(name, best, per_second=round(1 / best))
+        else:
+            self.record(name, best)
+        return best
+
+    def record(self, name, seconds, **extra):
+        """Record a measurement in seconds, with optional extra fields."""
+        self.results[name] = {"seconds": seconds, **extra}
+        details = "".join(f" {key}={value}" for key, value in extra.items())
+        print(f"{name:<50} {seconds * 1000:12.3f} ms{details}", flush=True)
+
+    def to_dict(self):
+        """Return the run as a JSON-serialisable dictionary."""
+        return {
+            "suite": self.suite,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": self.results,
+        }
+
+    def write(self, path):
+        """Write the results file."""
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: ``results`` mapping of the current run
+        baseline: ``results`` mapping of the baseline run
+        threshold: Allowed relative slowdown (0.2 means 20%)
+
+    Returns:
+        list[tuple[str, float, float]]: ``(name, baseline, current)`` for
+        every measurement slower than the threshold allows
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["seconds"] > previous["seconds"] * (1 + threshold):
+            regressions.append((name, previous["seconds"], current["seconds"]))
+    return regressions
+
+
+def add_output_arguments(parser):
+    """Add the common ``--output``/``--baseline``/``--threshold`` options."""
+    parser.add_argument("--output", metavar="FILE", help="Write results as JSON to FILE")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against a previous results file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative slowdown against the baseline (default: 0.2)",
+    )
+
+
+def finish(run, args):
+    """
+    Write results and check them against the baseline.
+
+    Returns:
+        int: Process exit code, 1 if any measurement regressed
+    """
+    if args.output:
+        run.write(args.output)
+    if not args.baseline:
+        return 0
+    with open(args.baseline, "r") as file:
+        baseline = json.load(file)["results"]
+    regressions = compare(run.results, baseline, args.threshold)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms", file=sys.stderr)
+    if not regressions:
+        print(f"No regressions against {args.baseline} (threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+def make_parser(description):
+    """Create an argument parser with the common output options."""
+    parser = argparse.ArgumentParser(description=description)
+    add_output_arguments(parser)
+    return parser
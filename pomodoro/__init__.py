@@ -1,7 +1,30 @@
 """
 Module initialization file for the Pomodoro Timer application.
+
+The public classes are imported lazily on first access so that lightweight
+entry points (``pomodoro --help``, ``pomodoro stats``) do not pay for Qt or
+pygame.
 """
-from pomodoro.config import Config
-from pomodoro.sound import SoundManager
-from pomodoro.notes import NotesManager
-from pomodoro.session import SessionManager
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    "Config": "pomodoro.config",
+    "SoundManager": "pomodoro.sound",
+    "NotesManager": "pomodoro.notes",
+    "SessionManager": "pomodoro.session",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
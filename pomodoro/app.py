@@ -2,33 +2,25 @@
 import os
 import sys
 import logging
-import importlib.resources
-import shutil
-from PyQt6.QtWidgets import QApplication
-
-try:
-    import appdirs
-    user_data_dir = appdirs.user_data_dir("pomodoro-timer", "pomodoro")
-    os.makedirs(user_data_dir, exist_ok=True)
-    log_file = os.path.join(user_data_dir, "pomodoro.log")
-except ImportError:
-    user_data_dir = os.path.expanduser("~/.pomodoro-timer")
-    os.makedirs(user_data_dir, exist_ok=True)
-    log_file = os.path.join(user_data_dir, "pomodoro.log")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()
-    ]
-)
+from .utils import get_user_data_dir
 
 logger = logging.getLogger(__name__)
 
 
+def _configure_logging(user_data_dir):
+    """Log to ``pomodoro.log`` in the user data directory and to the console."""
+    log_file = os.path.join(user_data_dir, "pomodoro.log")
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+
 def main(focus=None, rest=None):
     """Launch the Pomodoro Timer application.
 
@@ -39,69 +31,76 @@ def main(focus=None, rest=None):
     rest : int | None
         Override rest period duration in minutes.
     """
+    user_data_dir = get_user_data_dir()
+    _configure_logging(user_data_dir)
     try:
+        from PyQt6.QtCore import QTimer
+        from PyQt6.QtWidgets import QApplication
+
         from .config import Config
+        from .control import AlreadyRunningError, ControlServer, control_supported
         from .sound import SoundManager
         from .notes import NotesManager
         from .session import SessionManager
         from .ui import PomodoroTimer
-        from .utils import get_resource_path
-
-        try:
-            import appdirs
-            user_config_dir = appdirs.user_config_dir("pomodoro-timer", "pomodoro")
-        except ImportError:
-            user_config_dir = os.path.expanduser("~/.pomodoro-timer/config")
-        
-        os.makedirs(user_config_dir, exist_ok=True)
-        
-        # User config file path
-        user_config_path = os.path.join(user_config_dir, "config.json")
-        
-        # Default config file path (in package)
-        default_config_path = get_resource_path("config.json")
-        
-        # If user config doesn't exist, but default does, copy it
-        if not os.path.exists(user_config_path) and os.path.exists(default_config_path):
-            shutil.copy2(default_config_path, user_config_path)
-        
-        # Use user config if it exists, otherwise fall back to package config
-        config_path = user_config_path if os.path.exists(user_config_path) else default_config_path
-        config = Config(config_path)
+        from .ui.control_notifier import ControlNotifier
+        from .resources import sync_resources_in_background
+        from .utils import get_config_path
 
+        config_path = get_config_path()
+        # Coalesce setting changes into at most one write per second
+        config = Config(config_path, save_delay=1.0)
+
+        # Command-line durations apply to this run only and are never saved
+        overrides = {}
         if focus is not None:
-            config.config["timer"]["focus_period_minutes"] = focus
+            overrides["focus_period_minutes"] = focus
         if rest is not None:
-            config.config["timer"]["rest_period_minutes"] = rest
+            overrides["rest_period_minutes"] = rest
+        if overrides:
+            config.set_cli_overrides({"timer": overrides})
 
         sound_manager = SoundManager(config)
         notes_manager = NotesManager(config)
-        session_manager = SessionManager(os.path.join(user_data_dir, "pomodoro_sessions.log"))
+        session_manager = SessionManager.from_settings(config.get_session_settings(), user_data_dir)
 
         app = QApplication(sys.argv)
         app.setApplicationName("Pomodoro Timer")
 
-        # Make sure icon and sound directories exist in the user data directory
-        user_icons_dir = os.path.join(user_data_dir, "icons")
-        os.makedirs(user_icons_dir, exist_ok=True)
-        
-        user_sounds_dir = os.path.join(user_data_dir, "sounds")
-        os.makedirs(user_sounds_dir, exist_ok=True)
-        
-        # Copy default resources to user directory if they don't exist
-        for resource_dir, user_dir in [("icons", user_icons_dir), ("sounds", user_sounds_dir)]:
-            pkg_resource_dir = get_resource_path(resource_dir)
-            if os.path.exists(pkg_resource_dir) and os.path.isdir(pkg_resource_dir):
-                for filename in os.listdir(pkg_resource_dir):
-                    src_path = os.path.join(pkg_resource_dir, filename)
-                    dst_path = os.path.join(user_dir, filename)
-                    if not os.path.exists(dst_path) and os.path.isfile(src_path):
-                        shutil.copy2(src_path, dst_path)
-
         window = PomodoroTimer(config, sound_manager, notes_manager, session_manager)
+
+        # Own the control socket so later invocations drive this instance
+        control = None
+        if control_supported():
+            server = ControlServer(window.engine, show=window.bring_to_front)
+            try:
+                server.listen()
+                control = ControlNotifier(server, window)
+            except AlreadyRunningError as e:
+                logger.error(f"Pomodoro Timer is already running: {e}")
+                session_manager.close()
+                sys.exit(1)
+            except OSError as e:
+                logger.warning(f"Control socket unavailable: {e}")
+
         window.show()
 
-        sys.exit(app.exec())
+        # Open the audio device once the event loop is running so a slow
+        # audio stack never delays the first paint
+        QTimer.singleShot(0, sound_manager.start)
+
+        # Copy default icons and sounds to the user data directory; the stamp
+        # check and the copy both run off the UI thread
+        sync_resources_in_background(user_data_dir)
+
+        exit_code = app.exec()
+        if control is not None:
+            control.close()
+        sound_manager.close()
+        notes_manager.close()
+        session_manager.close()
+        config.flush()
+        sys.exit(exit_code)
     except Exception as e:
         logger.exception(f"Application error: {e}")
         sys.exit(1)
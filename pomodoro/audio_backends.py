@@ -0,0 +1,321 @@
+"""
+Audio playback backends for the Pomodoro Timer application.
+
+Each backend wraps one way of playing a short alert sound. Only the module
+of the selected backend is imported, so users who do not need pygame never
+pay for loading it.
+"""
+import importlib.util
+import logging
+import os
+import shutil
+import subprocess
+import sys
+
+logger = logging.getLogger(__name__)
+
+BACKEND_NAMES = ("qt", "pygame", "subprocess", "null")
+
+
+class AudioBackend:
+    """Base class for audio backends.
+
+    ``load`` prepares a sound once and returns a handle that ``play`` can
+    start repeatedly; all methods are called from the audio worker thread.
+    """
+
+    name = "base"
+
+    @classmethod
+    def available(cls):
+        """Cheaply check whether the backend can be used, without importing it."""
+        return True
+
+    def open(self):
+        """
+        Open the audio device.
+
+        Returns:
+            bool: True if the backend is ready to play sounds
+        """
+        return True
+
+    def load(self, path, volume):
+        """
+        Prepare a sound file for playback.
+
+        Args:
+            path: Absolute path to the sound file
+            volume: Volume level (0.0 to 1.0)
+
+        Returns:
+            object | None: A handle for ``play``, or None if the file cannot be used
+        """
+        return (path, volume)
+
+    def play(self, handle):
+        """Start playing a handle returned by ``load``."""
+
+    def close(self):
+        """Release the audio device."""
+
+
+class NullBackend(AudioBackend):
+    """Backend that plays nothing, used when no audio output is available."""
+
+    name = "null"
+
+
+class PygameBackend(AudioBackend):
+    """Decode sounds into ``pygame.mixer.Sound`` buffers and play them on a reserved channel."""
+
+    name = "pygame"
+
+    def __init__(self):
+        self._pygame = None
+        self._channel = None
+
+    @classmethod
+    def available(cls):
+        return importlib.util.find_spec("pygame") is not None
+
+    def open(self):
+        # Suppress the default pygame support message
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        import pygame
+
+        pygame.mixer.init()
+        # Keep one channel for alerts so other sounds can never take it
+        pygame.mixer.set_reserved(1)
+        self._pygame = pygame
+        self._channel = pygame.mixer.Channel(0)
+        return True
+
+    def load(self, path, volume):
+        try:
+            sound = self._pygame.mixer.Sound(path)
+            sound.set_volume(volume)
+            return sound
+        except Exception as e:
+            # Formats the decoder rejects may still stream through the music player
+            logger.warning(f"Cannot decode {path} into memory, streaming instead: {e}")
+            return (path, volume)
+
+    def play(self, handle):
+        if isinstance(handle, tuple):
+            path, volume = handle
+            self._pygame.mixer.music.load(path)
+            self._pygame.mixer.music.set_volume(volume)
+            self._pygame.mixer.music.play()
+        else:
+            self._channel.play(handle)
+
+    def close(self):
+        if self._pygame is not None:
+            self._pygame.mixer.quit()
+
+
+def _make_player_factory(thread):
+    """Create a QObject on ``thread`` that builds ``QMediaPlayer`` objects there."""
+    from PyQt6.QtCore import QObject, QUrl, pyqtSlot
+    from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
+
+    class PlayerFactory(QObject):
+        def __init__(self):
+            super().__init__()
+            self.player = None
+
+        @pyqtSlot(str, float)
+        def create(self, path, volume):
+            player = QMediaPlayer()
+            output = QAudioOutput(player)
+            output.setVolume(volume)
+            player.setAudioOutput(output)
+            player.setSource(QUrl.fromLocalFile(path))
+            self.player = player
+
+    factory = PlayerFactory()
+    # A bare QObject without children or timers can safely change threads
+    factory.moveToThread(thread)
+    return factory
+
+
+class QtMultimediaBackend(AudioBackend):
+    """Play sounds with ``QMediaPlayer`` on the running Qt application's thread.
+
+    Only chosen automatically when Qt is already loaded by the GUI, so it
+    adds no import cost of its own. Players are created and driven on the
+    GUI thread through queued calls, since the audio worker has no event
+    loop of its own.
+    """
+
+    name = "qt"
+
+    def __init__(self):
+        self._players = []
+        self._app_thread = None
+        self._factory = None
+
+    @classmethod
+    def available(cls):
+        return importlib.util.find_spec("PyQt6.QtMultimedia") is not None
+
+    def open(self):
+        from PyQt6.QtCore import QCoreApplication
+        from PyQt6 import QtMultimedia  # noqa: F401 - fails early without a multimedia stack
+
+        app = QCoreApplication.instance()
+        if app is None:
+            raise RuntimeError("no running Qt application")
+        self._app_thread = app.thread()
+        self._factory = _make_player_factory(self._app_thread)
+        return True
+
+    def load(self, path, volume):
+        from PyQt6.QtCore import Q_ARG, QMetaObject, Qt, QThread
+
+        if self._factory is None:
+            raise RuntimeError("Qt audio backend used before open()")
+        if QThread.currentThread() == self._app_thread:
+            self._factory.create(path, float(volume))
+        else:
+            # Block the worker until the GUI thread has built the player
+            QMetaObject.invokeMethod(
+                self._factory,
+                "create",
+                Qt.ConnectionType.BlockingQueuedConnection,
+                Q_ARG(str, path),
+                Q_ARG(float, float(volume)),
+            )
+        player, self._factory.player = self._factory.player, None
+        if player is None:
+            raise RuntimeError(f"could not create a media player for {path}")
+        self._players.append(player)
+        return player
+
+    def play(self, handle):
+        from PyQt6.QtCore import QMetaObject, Qt
+
+        QMetaObject.invokeMethod(handle, "play", Qt.ConnectionType.QueuedConnection)
+
+    def close(self):
+        for player in self._players:
+            player.deleteLater()
+        self._players = []
+        if self._factory is not None:
+            self._factory.deleteLater()
+            self._factory = None
+
+
+class SubprocessBackend(AudioBackend):
+    """Play sounds by launching a command-line player such as ``paplay`` or ``aplay``."""
+
+    name = "subprocess"
+
+    # Player command and how it takes a 0.0-1.0 volume (None if it cannot)
+    PLAYERS = (
+        ("paplay", lambda volume: [f"--volume={int(volume * 65536)}"]),
+        ("pw-play", lambda volume: [f"--volume={volume:.2f}"]),
+        ("aplay", None),
+    )
+
+    def __init__(self):
+        self._player = None
+        self._processes = []
+
+    @classmethod
+    def _find_player(cls):
+        for command, volume_args in cls.PLAYERS:
+            path = shutil.which(command)
+            if path:
+                return path, volume_args
+        return None
+
+    @classmethod
+    def available(cls):
+        return cls._find_player() is not None
+
+    def open(self):
+        self._player = self._find_player()
+        return self._player is not None
+
+    def load(self, path, volume):
+        command, volume_args = self._player
+        args = [command]
+        if volume_args is not None:
+            args.extend(volume_args(volume))
+        args.append(path)
+        return args
+
+    def play(self, handle):
+        # Reap players that already finished
+        self._processes = [process for process in self._processes if process.poll() is None]
+        self._processes.append(
+            subprocess.Popen(handle, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        )
+
+    def close(self):
+        for process in self._processes:
+            if process.poll() is None:
+                process.terminate()
+        self._processes = []
+
+
+BACKENDS = {
+    "qt": QtMultimediaBackend,
+    "pygame": PygameBackend,
+    "subprocess": SubprocessBackend,
+    "null": NullBackend,
+}
+
+
+def candidate_backends(name="auto", headless=False):
+    """
+    List the backend classes to try, in order.
+
+    With ``"auto"`` pygame is tried first, then Qt when the GUI has
+    already loaded it, then a command-line player. Headless, ``"auto"``
+    only tries the command-line player, so pygame and SDL are loaded only
+    when configured explicitly. The null backend is always the last resort.
+
+    Args:
+        name: Backend name from the ``sounds.backend`` setting
+        headless: Whether the timer runs without a window
+
+    Returns:
+        list[type[AudioBackend]]: Backend classes to try
+    """
+    if name in BACKENDS:
+        names = [name]
+    else:
+        if name != "auto":
+            logger.warning(f"Unknown audio backend {name!r}, choosing automatically")
+        names = ["subprocess"] if headless else ["pygame", "subprocess"]
+        if not headless and "PyQt6.QtWidgets" in sys.modules:
+            names.insert(1, "qt")
+    candidates = [BACKENDS[backend] for backend in names if BACKENDS[backend].available()]
+    if NullBackend not in candidates:
+        candidates.append(NullBackend)
+    return candidates
+
+
+def open_backend(name="auto", headless=False):
+    """
+    Open the first usable backend.
+
+    Args:
+        name: Backend name or ``"auto"``
+        headless: Whether the timer runs without a window
+
+    Returns:
+        AudioBackend: An opened backend, the null backend if nothing else works
+    """
+    for backend_class in candidate_backends(name, headless):
+        backend = backend_class()
+        try:
+            if backend.open():
+                logger.info(f"Using {backend.name} audio backend")
+                return backend
+        except Exception as e:
+            logger.warning(f"Audio backend {backend_class.name} unavailable: {e}")
+    return NullBackend()
@@ -2,9 +2,24 @@
 from __future__ import annotations
 
 import argparse
-import importlib.metadata
+import os
+import sys
 
-from .app import main as run_app
+
+class _VersionAction(argparse.Action):
+    """Print the installed package version, looked up only when requested."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        import importlib.metadata
+
+        try:
+            pkg_version = importlib.metadata.version("pomodoro-timer")
+        except importlib.metadata.PackageNotFoundError:
+            pkg_version = "unknown"
+        parser.exit(message=f"pomodoro {pkg_version}\n")
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -26,22 +41,314 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         help="Rest period duration in minutes",
     )
 
-    try:
-        pkg_version = importlib.metadata.version("pomodoro-timer")
-    except importlib.metadata.PackageNotFoundError:
-        pkg_version = "unknown"
-
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"pomodoro {pkg_version}",
+        action=_VersionAction,
+        help="show program's version number and exit",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="Show session statistics without starting the GUI",
+        description="Summarise the session history",
+    )
+    stats_parser.add_argument(
+        "--period",
+        choices=["day", "week", "month"],
+        default="day",
+        help="Granularity of the per-period totals (default: day)",
+    )
+    stats_parser.add_argument(
+        "--limit",
+        type=int,
+        default=7,
+        metavar="N",
+        help="Number of most recent periods to show, 0 for all (default: 7)",
+    )
+    stats_parser.add_argument("--since", metavar="YYYY-MM-DD", help="First date to include")
+    stats_parser.add_argument("--until", metavar="YYYY-MM-DD", help="Last date to include")
+    stats_parser.add_argument(
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format (default: table)",
+    )
+
+    notes_parser = subparsers.add_parser(
+        "notes",
+        help="Manage the Obsidian session notes",
+        description="Manage the Obsidian session notes",
+    )
+    notes_subparsers = notes_parser.add_subparsers(dest="notes_command", metavar="ACTION", required=True)
+    backfill_parser = notes_subparsers.add_parser(
+        "backfill",
+        help="Write logged sessions into the dated Obsidian sessions notes",
+        description=(
+            "Write sessions from the session log into the dated sessions notes "
+            "of the vault folder set in obsidian.vault_path. Lines already in a "
+            "note are skipped, so the command can be run repeatedly."
+        ),
+    )
+    backfill_parser.add_argument("--since", metavar="YYYY-MM-DD", help="First date to include")
+    backfill_parser.add_argument("--until", metavar="YYYY-MM-DD", help="Last date to include")
+
+    run_parser = subparsers.add_parser(
+        "run",
+        help="Run the timer",
+        description="Run the timer, with the window or headless in the terminal",
+    )
+    run_parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run without a window, printing timer events to stdout",
+    )
+    run_parser.add_argument("--text", default="", help="What the focus session is about (headless)")
+    run_parser.add_argument(
+        "--cycles",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of focus/rest cycles to run before exiting (headless, default: 1)",
+    )
+    # SUPPRESS keeps the top-level --focus/--rest values when given before the command
+    run_parser.add_argument(
+        "--focus", type=int, metavar="MINUTES", default=argparse.SUPPRESS, help="Focus period duration in minutes"
+    )
+    run_parser.add_argument(
+        "--rest", type=int, metavar="MINUTES", default=argparse.SUPPRESS, help="Rest period duration in minutes"
+    )
+
+    start_parser = subparsers.add_parser(
+        "start",
+        help="Start a focus session in the running timer",
+        description="Start a focus session in the running timer",
+    )
+    start_parser.add_argument("text", nargs="?", default="", help="What the focus session is about")
+    # SUPPRESS keeps the top-level --focus/--rest values when given before the command
+    start_parser.add_argument(
+        "--focus", type=int, metavar="MINUTES", default=argparse.SUPPRESS, help="Focus period duration in minutes"
+    )
+    start_parser.add_argument(
+        "--rest", type=int, metavar="MINUTES", default=argparse.SUPPRESS, help="Rest period duration in minutes"
+    )
+    subparsers.add_parser(
+        "pause",
+        help="Pause or resume the running timer",
+        description="Pause or resume the running timer, like the Pause button",
+    )
+    subparsers.add_parser(
+        "rest",
+        help="Start a rest period in the running timer",
+        description="Start a rest period in the running timer",
+    )
+    status_parser = subparsers.add_parser(
+        "status",
+        help="Show the state of the running timer",
+        description="Show the state of the running timer",
+    )
+    status_parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+
+    simulate_parser = subparsers.add_parser(
+        "simulate",
+        help="Run timer cycles on a virtual clock and measure the session, notes and sound sinks",
+        description=(
+            "Drive the timer through focus/rest/pause/exit cycles on a virtual "
+            "clock against a fresh configuration, session log and Obsidian vault "
+            "folder, and report the throughput and latency of the sinks."
+        ),
+    )
+    simulate_parser.add_argument(
+        "--cycles",
+        type=int,
+        default=1000,
+        metavar="N",
+        help="Number of focus cycles to simulate (default: 1000)",
+    )
+    simulate_parser.add_argument("--seed", type=int, default=0, help="Seed for the simulated session outcomes")
+    simulate_parser.add_argument(
+        "--qt",
+        action="store_true",
+        help="Drive the full window on the Qt offscreen platform instead of the bare engine",
+    )
+    simulate_parser.add_argument(
+        "--sound-backend",
+        default="null",
+        metavar="NAME",
+        help="Audio backend for the sound manager (default: null)",
+    )
+    simulate_parser.add_argument(
+        "--data-dir",
+        metavar="DIR",
+        help="Keep the configuration, session log and vault in DIR instead of a temporary directory",
+    )
+    simulate_parser.add_argument(
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format (default: table)",
     )
 
     return parser.parse_args(argv)
 
 
+def run_stats(args: argparse.Namespace) -> None:
+    """Print session statistics."""
+    from .config import Config
+    from .records import KIND_SESSION
+    from .session import SessionManager
+    from .stats import compute_stats, format_json, format_table
+    from .utils import get_config_path, get_user_data_dir
+
+    config = Config(get_config_path())
+    # Read-only: no session count scan, index rebuild or segment roll
+    session_manager = SessionManager.from_settings(
+        config.get_session_settings(), get_user_data_dir(), flush_policy=None, read_only=True
+    )
+    try:
+        records = session_manager.iter_records(args.since, args.until, KIND_SESSION)
+        stats = compute_stats(records, args.period, args.limit or None)
+    finally:
+        session_manager.close()
+
+    output = format_json(stats) if args.format == "json" else format_table(stats)
+    sys.stdout.write(output + "\n")
+
+
+def run_notes_backfill(args: argparse.Namespace) -> int:
+    """Backfill the Obsidian sessions notes from the session log."""
+    from .config import Config
+    from .notes import backfill_sessions
+    from .records import KIND_SESSION
+    from .session import SessionManager
+    from .utils import get_config_path, get_user_data_dir
+
+    config = Config(get_config_path())
+    settings = config.get_obsidian_settings()
+    vault_path = settings.get("vault_path") or ""
+    if not vault_path:
+        sys.stderr.write("pomodoro: set obsidian.vault_path to the vault folder to backfill notes\n")
+        return 2
+
+    session_manager = SessionManager.from_settings(
+        config.get_session_settings(), get_user_data_dir(), flush_policy=None, read_only=True
+    )
+    try:
+        records = session_manager.iter_records(args.since, args.until, KIND_SESSION)
+        notes, lines = backfill_sessions(records, vault_path, settings.get("sessions_notes_path") or "")
+    finally:
+        session_manager.close()
+
+    sys.stdout.write(f"Added {lines} line(s) to {notes} note(s) in {vault_path}\n")
+    return 0
+
+
+def run_simulate(args: argparse.Namespace) -> None:
+    """Run the virtual-time simulation and print its report."""
+    from .simulate import format_report, run_simulation
+
+    if args.data_dir:
+        os.makedirs(args.data_dir, exist_ok=True)
+    report = run_simulation(
+        cycles=args.cycles,
+        data_dir=args.data_dir,
+        sound_backend=args.sound_backend,
+        qt=args.qt,
+        seed=args.seed,
+    )
+    sys.stdout.write(format_report(report, args.format) + "\n")
+
+
+def format_status(status: dict) -> str:
+    """Render a status reply from the running instance as one line."""
+    mins, secs = divmod(status["time_left"], 60)
+    remaining = f"{mins:02d}:{secs:02d}"
+    if status["state"] == "focus":
+        text = f": {status['focus_text']}" if status["focus_text"] else ""
+        return f"Focus{text}, {remaining} left"
+    if status["state"] == "rest":
+        return f"Rest, {remaining} left"
+    if status["state"] == "paused":
+        return f"Paused ({status['period']}), {remaining} left"
+    return "Idle"
+
+
+def run_control(args: argparse.Namespace) -> int:
+    """Send a command to the running instance over the control socket."""
+    import json
+
+    from .control import send_command
+
+    arguments = {}
+    if args.command == "start":
+        arguments = {"text": args.text, "focus": args.focus, "rest": args.rest}
+    try:
+        reply = send_command(args.command, **arguments)
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"pomodoro: cannot reach the running timer: {e}\n")
+        return 1
+    if reply is None:
+        sys.stderr.write("pomodoro: no running timer; start one with 'pomodoro'\n")
+        return 1
+    if not reply.get("ok"):
+        sys.stderr.write(f"pomodoro: {reply.get('error', 'command failed')}\n")
+        return 1
+    if args.command == "status" and args.format == "json":
+        sys.stdout.write(json.dumps(reply["status"]) + "\n")
+    else:
+        sys.stdout.write(format_status(reply["status"]) + "\n")
+    return 0
+
+
+def _show_running_instance() -> bool:
+    """Bring an already running instance to the front. Returns True if there is one."""
+    from .control import send_command
+
+    try:
+        reply = send_command("show")
+    except TimeoutError:
+        # The owner is alive but busy, e.g. showing a prompt
+        sys.stderr.write("pomodoro: already running but not responding\n")
+        return True
+    except (OSError, ValueError):
+        return False
+    if reply is None:
+        return False
+    sys.stderr.write(
+        f"pomodoro: already running (pid {reply['status']['pid']}); "
+        "use 'pomodoro start', 'pause', 'rest' or 'status' to control it\n"
+    )
+    return True
+
+
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
+    if args.command == "stats":
+        run_stats(args)
+        return
+    if args.command == "notes":
+        sys.exit(run_notes_backfill(args))
+    if args.command == "simulate":
+        run_simulate(args)
+        return
+    if args.command in ("start", "pause", "rest", "status"):
+        sys.exit(run_control(args))
+    # One timer per user: a second launch hands over to the running instance
+    if _show_running_instance():
+        sys.exit(1 if args.command == "run" and args.headless else 0)
+    if args.command == "run" and args.headless:
+        from .headless import run_headless
+
+        sys.exit(run_headless(args.text, focus=args.focus, rest=args.rest, cycles=args.cycles))
+
+    from .app import main as run_app
+
     run_app(focus=args.focus, rest=args.rest)
 
 
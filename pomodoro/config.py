@@ -2,11 +2,17 @@
 Configuration module for the Pomodoro Timer application.
 Handles loading, parsing, and accessing configuration values.
 """
+import atexit
+import copy
+import hashlib
 import json
 import os
+import threading
 from pathlib import Path
 import logging
 
+from .utils import invalidate_resource_path
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG = {
@@ -22,14 +28,25 @@ DEFAULT_CONFIG = {
         "rest_end": {
             "file": "sounds/rest_end.mp3",
             "volume": 0.8
-        }
+        },
+        "backend": "auto"
     },
     "obsidian": {
         "enabled": True,
         "vault_name": "memory",
         "daily_notes_path": "Personal/Notes/Daily Notes",
         "weekly_notes_path": "Personal/Notes/Weekly Notes",
-        "sessions_notes_path": "Personal/Notes/Daily Notes"
+        "sessions_notes_path": "Personal/Notes/Daily Notes",
+        "append_debounce_seconds": 2.0,
+        "vault_path": ""
+    },
+    "sessions": {
+        "backend": "text",
+        "format": "text",
+        "flush_policy": "batch",
+        "flush_interval_seconds": 1.0,
+        "fsync_policy": "never",
+        "segmented": False
     },
     "ui": {
         "show_focus_text": True,
@@ -45,16 +62,156 @@ DEFAULT_CONFIG = {
     }
 }
 
+
+# Environment variables overriding settings for the running process
+ENV_OVERRIDES = {
+    "POMODORO_FOCUS_MINUTES": (("timer", "focus_period_minutes"), int),
+    "POMODORO_REST_MINUTES": (("timer", "rest_period_minutes"), int),
+    "POMODORO_SOUND_BACKEND": (("sounds", "backend"), str),
+    "POMODORO_OBSIDIAN_ENABLED": (("obsidian", "enabled"), lambda value: value.lower() in ("1", "true", "yes", "on")),
+    "POMODORO_VAULT_PATH": (("obsidian", "vault_path"), str),
+    "POMODORO_SESSIONS_BACKEND": (("sessions", "backend"), str),
+}
+
+
+def env_overrides(environ=None):
+    """
+    Read setting overrides from environment variables (see ``ENV_OVERRIDES``).
+
+    Args:
+        environ: Mapping to read instead of ``os.environ``
+
+    Returns:
+        dict: Nested overrides, e.g. ``{"timer": {"focus_period_minutes": 50}}``
+    """
+    environ = os.environ if environ is None else environ
+    overrides = {}
+    for name, (path, parse) in ENV_OVERRIDES.items():
+        raw = environ.get(name)
+        if raw is None or raw == "":
+            continue
+        try:
+            value = parse(raw)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {name}={raw!r}")
+            continue
+        node = overrides
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return overrides
+
+
+def _deep_merge(base, override):
+    """Merge ``override`` into ``base`` in place, recursing into nested dicts."""
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _deep_merge(base[key], value)
+        else:
+            base[key] = copy.deepcopy(value)
+
+
+def _pop_path(tree, path):
+    """Remove a key path from nested dicts, dropping parents left empty."""
+    node = tree.get(path[0])
+    if len(path) == 1:
+        tree.pop(path[0], None)
+    elif isinstance(node, dict):
+        _pop_path(node, path[1:])
+        if not node:
+            del tree[path[0]]
+
+
+class ConfigSnapshot:
+    """Immutable view of the effective configuration.
+
+    The values read on hot paths are plain attributes; everything else is
+    available through ``get`` and ``section``.
+    """
+
+    __slots__ = (
+        "focus_period",
+        "rest_period",
+        "focus_sound",
+        "focus_volume",
+        "rest_sound",
+        "rest_volume",
+        "sound_backend",
+        "obsidian_enabled",
+        "_data",
+    )
+
+    def __init__(self, data):
+        """
+        Initialize the snapshot.
+
+        Args:
+            data: Fully merged configuration; the snapshot takes ownership
+        """
+        timer, sounds = data["timer"], data["sounds"]
+        values = {
+            "focus_period": timer["focus_period_minutes"],
+            "rest_period": timer["rest_period_minutes"],
+            "focus_sound": sounds["focus_end"]["file"],
+            "focus_volume": sounds["focus_end"]["volume"],
+            "rest_sound": sounds["rest_end"]["file"],
+            "rest_volume": sounds["rest_end"]["volume"],
+            "sound_backend": sounds.get("backend", "auto"),
+            "obsidian_enabled": data["obsidian"]["enabled"],
+            "_data": data,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ConfigSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ConfigSnapshot is immutable")
+
+    def get(self, *path, default=None):
+        """Return the value at a key path such as ``("ui", "always_on_top")``."""
+        node = self._data
+        for key in path:
+            if not isinstance(node, dict) or key not in node:
+                return default
+            node = node[key]
+        return copy.deepcopy(node) if isinstance(node, dict) else node
+
+    def section(self, name):
+        """Return a copy of one configuration section."""
+        return copy.deepcopy(self._data.get(name, {}))
+
+
+def _serialize(config):
+    return json.dumps(config, indent=2)
+
+
+def _content_hash(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 class Config:
     """Configuration manager for the Pomodoro Timer application."""
 
-    def __init__(self, config_path=None):
+    def __init__(self, config_path=None, save_delay=0.0, environ=None):
         """Initialize the configuration manager.
 
         If ``config_path`` is not provided a directory ``~/.pomodoro`` is
         created and the configuration is stored there.  This avoids issues when
         the application is installed system wide and the package directory is
         read only.
+
+        Saves are skipped when the serialized configuration is unchanged. With
+        a positive ``save_delay`` (seconds), changes are written once after the
+        delay instead of on every setter call; ``flush()`` writes pending
+        changes immediately and runs automatically at exit.
+
+        Settings are resolved from layers: defaults, the user's file,
+        environment variables (``ENV_OVERRIDES``, read from ``environ`` or
+        ``os.environ``) and command-line overrides (``set_cli_overrides``).
+        Getters read the immutable ``snapshot``; only the user layer, kept in
+        ``config``, is saved.
         """
         if config_path is None:
             config_dir = Path.home() / ".pomodoro"
@@ -63,39 +220,68 @@ class Config:
         else:
             self.config_path = config_path
             Path(os.path.dirname(self.config_path)).mkdir(parents=True, exist_ok=True)
+        self.save_delay = save_delay
+        self._saved_hash = None
+        self._file_stat = None
+        self._pending = None
+        self._save_timer = None
+        self._save_lock = threading.Lock()
         self.config = self._load_config()
+        self._env_overrides = env_overrides(environ)
+        self._cli_overrides = {}
+        self._rebuild_snapshot()
         self._batch_mode = False
+        self._listeners = []
 
     def _load_config(self):
         """Load configuration from file or create default if not exists."""
         try:
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r') as file:
-                    config = json.load(file)
-                    # Ensure all default keys exist
-                    self._ensure_defaults(config)
-                    return config
+                    content = file.read()
+                config = json.loads(content)
+                self._saved_hash = _content_hash(content)
+                self._file_stat = self._stat_file()
+                # Ensure all default keys exist
+                self._ensure_defaults(config)
+                return config
             else:
                 # Create default configuration file if not exists
-                os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-                with open(self.config_path, 'w') as file:
-                    json.dump(DEFAULT_CONFIG, file, indent=2)
+                config = copy.deepcopy(DEFAULT_CONFIG)
+                self._write(_serialize(config))
                 logger.info(f"Created default configuration file: {self.config_path}")
-                return DEFAULT_CONFIG
+                return config
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
-            return DEFAULT_CONFIG
+            return copy.deepcopy(DEFAULT_CONFIG)
 
     def _ensure_defaults(self, config):
         """Ensure all default keys exist in the configuration."""
         for key, value in DEFAULT_CONFIG.items():
             if key not in config:
-                config[key] = value
+                config[key] = copy.deepcopy(value)
             elif isinstance(value, dict):
                 for sub_key, sub_value in value.items():
                     if sub_key not in config[key]:
-                        config[key][sub_key] = sub_value
+                        config[key][sub_key] = copy.deepcopy(sub_value)
     
+    def add_listener(self, callback):
+        """Register ``callback(section)`` to be called when a section changes."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Unregister a change listener."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, section):
+        """Tell listeners that a configuration section changed."""
+        for callback in list(self._listeners):
+            try:
+                callback(section)
+            except Exception as e:
+                logger.error(f"Error in configuration listener: {e}")
+
     def start_batch(self):
         """Start batching configuration changes."""
         self._batch_mode = True
@@ -106,78 +292,247 @@ class Config:
         self.save()
 
     def save(self):
-        """Save current configuration to file."""
+        """Save current configuration to file if it changed."""
         if self._batch_mode:
             return  # Skip saving in batch mode
-            
+
+        # Serialize on the caller's thread so a delayed write never races a setter
         try:
-            with open(self.config_path, 'w') as file:
-                json.dump(self.config, file, indent=2)
-            logger.info(f"Configuration saved to: {self.config_path}")
+            content = _serialize(self.config)
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
+            return
+        with self._save_lock:
+            if self._pending is None:
+                current_hash = self._saved_hash
+            else:
+                current_hash = _content_hash(self._pending)
+            if _content_hash(content) == current_hash:
+                return  # Nothing changed
+            self._pending = content
+            if self.save_delay > 0:
+                if self._save_timer is None:
+                    self._save_timer = threading.Timer(self.save_delay, self.flush)
+                    self._save_timer.daemon = True
+                    self._save_timer.start()
+                    atexit.register(self.flush)
+                return
+        self.flush()
+
+    def flush(self):
+        """Write pending configuration changes now."""
+        with self._save_lock:
+            content, self._pending = self._pending, None
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+                atexit.unregister(self.flush)
+            if content is None or _content_hash(content) == self._saved_hash:
+                return
+            try:
+                self._write(content)
+                logger.info(f"Configuration saved to: {self.config_path}")
+            except Exception as e:
+                logger.error(f"Error saving configuration: {e}")
+
+    def _write(self, content):
+        """Replace the configuration file atomically with ``content``."""
+        tmp_path = f"{self.config_path}.tmp"
+        with open(tmp_path, 'w') as file:
+            file.write(content)
+        os.replace(tmp_path, self.config_path)
+        self._saved_hash = _content_hash(content)
+        self._file_stat = self._stat_file()
+
+    def _stat_file(self):
+        """Return the ``(mtime_ns, size)`` of the configuration file, or None."""
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def reload(self):
+        """
+        Re-read the configuration file after it was changed externally.
+
+        Returns immediately when the file's mtime and size are unchanged or
+        its content is what this instance last wrote. Otherwise only the
+        sections that differ are replaced, and listeners are notified for
+        each of them.
+
+        Returns:
+            list[str]: Names of the sections that changed
+        """
+        file_stat = self._stat_file()
+        if file_stat is None or file_stat == self._file_stat:
+            return []
+        try:
+            with open(self.config_path, 'r') as file:
+                content = file.read()
+            content_hash = _content_hash(content)
+            self._file_stat = file_stat
+            if content_hash == self._saved_hash:
+                return []  # Our own write
+            config = json.loads(content)
+            if not isinstance(config, dict):
+                raise ValueError("configuration must be a JSON object")
+            self._ensure_defaults(config)
+        except Exception as e:
+            logger.error(f"Error reloading configuration, keeping current settings: {e}")
+            return []
+
+        changed = [key for key, value in config.items() if self.config.get(key) != value]
+        with self._save_lock:
+            self._saved_hash = content_hash
+            # Unsaved local changes are re-serialized on top of the new file
+            had_pending, self._pending = self._pending is not None, None
+        for key in changed:
+            self.config[key] = config[key]
+        if changed:
+            self._rebuild_snapshot()
+            logger.info(f"Reloaded configuration sections: {', '.join(changed)}")
+        for key in changed:
+            self._notify(key)
+        if had_pending:
+            self.save()
+        return changed
+
+    # Layers and snapshots
+
+    def _rebuild_snapshot(self):
+        """Merge the layers and publish a new snapshot."""
+        merged = copy.deepcopy(DEFAULT_CONFIG)
+        for layer in (self.config, self._env_overrides, self._cli_overrides):
+            _deep_merge(merged, layer)
+        # A single assignment, so readers always see one complete snapshot
+        self.snapshot = ConfigSnapshot(merged)
+
+    def set_cli_overrides(self, overrides):
+        """
+        Set command-line overrides, e.g. ``{"timer": {"focus_period_minutes": 50}}``.
+
+        Overrides apply to the running application only and are never saved.
+        """
+        self._cli_overrides = copy.deepcopy(overrides)
+        self._rebuild_snapshot()
+        for section in overrides:
+            self._notify(section)
+
+    def _set_value(self, path, value):
+        """
+        Set one user setting, given as a key path such as ``("timer", "focus_period_minutes")``.
+
+        Setting a key to its current effective value does nothing, so a value
+        that only comes from an environment or command-line override is not
+        written to the user's file. Any other value is stored in the user
+        layer and replaces the override for that key.
+
+        Returns:
+            bool: True if the effective value changed
+        """
+        if self.snapshot.get(*path) == value:
+            return False
+        node = self.config
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+        for layer in (self._env_overrides, self._cli_overrides):
+            _pop_path(layer, path)
+        self._rebuild_snapshot()
+        return True
+
+    def set_values(self, section, values):
+        """
+        Set several keys of one section and save once.
+
+        Args:
+            section: Section name, e.g. ``"obsidian"``
+            values: Mapping of key to new value
+        """
+        changed = [self._set_value((section, key), value) for key, value in values.items()]
+        if any(changed):
+            self.save()
+            self._notify(section)
 
     def get_focus_period(self):
         """Get the focus period duration in minutes."""
-        return self.config["timer"]["focus_period_minutes"]
+        return self.snapshot.focus_period
 
     def get_rest_period(self):
         """Get the rest period duration in minutes."""
-        return self.config["timer"]["rest_period_minutes"]
+        return self.snapshot.rest_period
 
     def get_focus_sound(self):
         """Get the focus end sound file path."""
-        return self.config["sounds"]["focus_end"]["file"]
+        return self.snapshot.focus_sound
 
     def get_focus_volume(self):
         """Get the focus end sound volume."""
-        return self.config["sounds"]["focus_end"]["volume"]
+        return self.snapshot.focus_volume
 
     def get_rest_sound(self):
         """Get the rest end sound file path."""
-        return self.config["sounds"]["rest_end"]["file"]
+        return self.snapshot.rest_sound
 
     def get_rest_volume(self):
         """Get the rest end sound volume."""
-        return self.config["sounds"]["rest_end"]["volume"]
+        return self.snapshot.rest_volume
+
+    def get_sound_backend(self):
+        """Get the audio backend name (``auto``, ``qt``, ``pygame``, ``subprocess`` or ``null``)."""
+        return self.snapshot.sound_backend
 
     def is_obsidian_enabled(self):
         """Check if Obsidian integration is enabled."""
-        return self.config["obsidian"]["enabled"]
+        return self.snapshot.obsidian_enabled
 
     def get_obsidian_settings(self):
-        """Get the Obsidian settings."""
-        return self.config["obsidian"]
+        """Get a copy of the effective Obsidian settings."""
+        return self.snapshot.section("obsidian")
+
+    def get_session_settings(self):
+        """Get a copy of the effective session log settings."""
+        return self.snapshot.section("sessions")
 
     def get_ui_settings(self):
-        """Get the UI settings."""
-        return self.config["ui"]
+        """Get a copy of the effective UI settings."""
+        return self.snapshot.section("ui")
 
     def set_focus_period(self, minutes):
         """Set the focus period duration in minutes."""
-        self.config["timer"]["focus_period_minutes"] = minutes
-        self.save()
+        if self._set_value(("timer", "focus_period_minutes"), minutes):
+            self.save()
+            self._notify("timer")
 
     def set_rest_period(self, minutes):
         """Set the rest period duration in minutes."""
-        self.config["timer"]["rest_period_minutes"] = minutes
-        self.save()
+        if self._set_value(("timer", "rest_period_minutes"), minutes):
+            self.save()
+            self._notify("timer")
 
     def set_sound_settings(self, sound_type, file_path=None, volume=None):
         """Set sound settings for a specific type (focus_end or rest_end)."""
         if sound_type not in ["focus_end", "rest_end"]:
             raise ValueError("sound_type must be 'focus_end' or 'rest_end'")
 
+        changed = False
         if file_path:
-            self.config["sounds"][sound_type]["file"] = file_path
+            old_file = self.snapshot.get("sounds", sound_type, "file")
+            if self._set_value(("sounds", sound_type, "file"), file_path):
+                # Make sure the resource resolver picks up the new file
+                invalidate_resource_path(old_file)
+                invalidate_resource_path(file_path)
+                changed = True
         if volume is not None:
-            self.config["sounds"][sound_type]["volume"] = max(0.0, min(1.0, volume))
-        self.save()
+            changed |= self._set_value(("sounds", sound_type, "volume"), max(0.0, min(1.0, volume)))
+        if changed:
+            self.save()
+            self._notify("sounds")
 
     def set_obsidian_enabled(self, enabled):
         """Set whether Obsidian integration is enabled."""
-        self.config["obsidian"]["enabled"] = enabled
-        self.save()
+        self.set_values("obsidian", {"enabled": enabled})
 
     def update_obsidian_settings(
         self,
@@ -185,14 +540,21 @@ class Config:
         daily_path=None,
         weekly_path=None,
         sessions_path=None,
+        vault_path=None,
     ):
         """Update Obsidian settings."""
-        if vault_name is not None:
-            self.config["obsidian"]["vault_name"] = vault_name
-        if daily_path is not None:
-            self.config["obsidian"]["daily_notes_path"] = daily_path
-        if weekly_path is not None:
-            self.config["obsidian"]["weekly_notes_path"] = weekly_path
-        if sessions_path is not None:
-            self.config["obsidian"]["sessions_notes_path"] = sessions_path
-        self.save()
+        values = {
+            "vault_name": vault_name,
+            "daily_notes_path": daily_path,
+            "weekly_notes_path": weekly_path,
+            "sessions_notes_path": sessions_path,
+            "vault_path": vault_path,
+        }
+        self.set_values("obsidian", {key: value for key, value in values.items() if value is not None})
+
+    def set_window_geometry(self, x, y, width, height):
+        """Remember the window position and size for the next start."""
+        changed = self._set_value(("ui", "start_position"), {"x": x, "y": y})
+        changed |= self._set_value(("ui", "window_size"), {"width": width, "height": height})
+        if changed:
+            self.save()
@@ -0,0 +1,296 @@
+"""
+Control socket for the Pomodoro Timer application.
+The running instance listens on a Unix domain socket for JSON-line commands,
+so later ``pomodoro start``/``pause``/``rest``/``status`` invocations talk to
+it instead of starting a second timer. Nothing here imports Qt.
+"""
+import errno
+import json
+import logging
+import os
+import socket
+
+logger = logging.getLogger(__name__)
+
+SOCKET_NAME = "pomodoro-timer.sock"
+
+# Largest request accepted from a client, in bytes
+MAX_REQUEST_SIZE = 64 * 1024
+
+COMMANDS = ("start", "pause", "rest", "status", "show")
+
+
+class AlreadyRunningError(RuntimeError):
+    """Another instance already owns the control socket."""
+
+
+def control_supported():
+    """Whether this platform has Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def control_socket_path():
+    """
+    Get the path of the control socket.
+
+    Returns:
+        str: ``pomodoro-timer.sock`` in ``$XDG_RUNTIME_DIR``, or in the user
+        data directory when that is not set
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, SOCKET_NAME)
+    from .utils import get_user_data_dir
+
+    return os.path.join(get_user_data_dir(), SOCKET_NAME)
+
+
+def send_command(command, path=None, timeout=2.0, **arguments):
+    """
+    Send a command to the running instance.
+
+    Args:
+        command: One of ``COMMANDS``
+        path: Socket path (defaults to ``control_socket_path()``)
+        timeout: Seconds to wait for the reply
+        **arguments: Command arguments, e.g. ``text``, ``focus`` and ``rest`` for ``start``
+
+    Returns:
+        dict | None: The reply, or None if no instance is running
+    """
+    if not control_supported():
+        return None
+    path = path or control_socket_path()
+    if not os.path.exists(path):
+        return None
+    request = {"command": command, **{key: value for key, value in arguments.items() if value is not None}}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(path)
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            data = b""
+            while not data.endswith(b"\n"):
+                chunk = client.recv(4096)
+                if not chunk:
+                    break
+                data += chunk
+    except (FileNotFoundError, ConnectionRefusedError):
+        # Stale socket left behind by an instance that did not exit cleanly
+        return None
+    return json.loads(data.decode("utf-8"))
+
+
+def engine_status(engine):
+    """
+    Describe the timer state.
+
+    Args:
+        engine: The timer engine
+
+    Returns:
+        dict: ``state`` (``"focus"``, ``"rest"``, ``"paused"`` or ``"idle"``),
+        ``period``, ``focus_text``, ``time_left`` and ``pid``
+    """
+    period = "rest" if engine.is_rest_period else "focus"
+    if engine.running:
+        state = period
+    elif engine.paused:
+        state = "paused"
+    else:
+        state = "idle"
+    return {
+        "state": state,
+        "period": period,
+        "focus_text": engine.focus_text,
+        "time_left": engine.time_left,
+        "pid": os.getpid(),
+    }
+
+
+def handle_request(engine, request, show=None):
+    """
+    Run a control command against the timer engine.
+
+    Args:
+        engine: The timer engine
+        request: Decoded request, ``{"command": ..., **arguments}``
+        show: Callable raising the window for the ``show`` command
+
+    Returns:
+        dict: ``{"ok": True, "status": ...}`` or ``{"ok": False, "error": ...}``.
+        Commands that change the timer are refused while it is finishing a
+        period.
+    """
+    command = request.get("command") if isinstance(request, dict) else None
+    if command not in COMMANDS:
+        return {"ok": False, "error": f"unknown command: {command!r}"}
+    if engine.finishing and command in ("start", "pause", "rest"):
+        # update() is waiting on "was the session successful?"; changing
+        # the period now would log the old session under the new one
+        return {
+            "ok": False,
+            "error": "the timer is finishing a period; answer the prompt and try again",
+            "status": engine_status(engine),
+        }
+    try:
+        if command == "start":
+            focus = int(request.get("focus") or engine.pomodoro_time // 60)
+            rest = int(request.get("rest") or engine.rest_time // 60)
+            # Durations given on the command line apply to this session only
+            engine.start_focus(str(request.get("text") or ""), focus, rest, remember=False)
+        elif command == "pause":
+            # Pause or resume, like the Pause button
+            if not engine.running and not engine.paused:
+                return {"ok": False, "error": "the timer is not running", "status": engine_status(engine)}
+            engine.pause()
+        elif command == "rest":
+            engine.start_rest()
+        elif command == "show" and show is not None:
+            show()
+    except (TypeError, ValueError) as e:
+        return {"ok": False, "error": f"invalid arguments: {e}"}
+    return {"ok": True, "status": engine_status(engine)}
+
+
+class ControlServer:
+    """Non-blocking Unix socket server for control commands.
+
+    The server does no waiting of its own: the owner watches ``fileno()``
+    and every connection returned by ``accept()`` with its event loop
+    (``QSocketNotifier`` in the window, ``add_reader`` headless) and calls
+    ``accept()`` or ``read(conn)`` when they become readable.
+    """
+
+    def __init__(self, engine, path=None, show=None):
+        """
+        Initialize the server without binding.
+
+        Args:
+            engine: The timer engine commands are applied to
+            path: Socket path (defaults to ``control_socket_path()``)
+            show: Callable raising the window for the ``show`` command
+        """
+        self.engine = engine
+        self.path = path or control_socket_path()
+        self.show = show
+        self._socket = None
+        self._buffers = {}
+
+    def listen(self):
+        """
+        Bind the control socket, replacing a stale one.
+
+        Raises:
+            AlreadyRunningError: If another instance owns the socket, even
+                one too busy to answer
+        """
+        if os.path.exists(self.path):
+            if self._owner_alive():
+                raise AlreadyRunningError(f"another instance is listening on {self.path}")
+            os.unlink(self.path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.path)
+            os.chmod(self.path, 0o600)
+            server.listen(8)
+            server.setblocking(False)
+        except OSError as e:
+            server.close()
+            if e.errno == errno.EADDRINUSE:
+                # Another instance bound it between the check and here
+                raise AlreadyRunningError(f"another instance is listening on {self.path}") from e
+            raise
+        self._socket = server
+
+    def _owner_alive(self):
+        """Whether a process is accepting connections on the socket, even if it is too busy to answer."""
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.settimeout(1.0)
+            probe.connect(self.path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+        except OSError:
+            # Timed out or otherwise unusable, but not provably stale
+            return True
+        finally:
+            probe.close()
+        return True
+
+    def fileno(self):
+        """File descriptor of the listening socket."""
+        return self._socket.fileno()
+
+    def accept(self):
+        """
+        Accept a pending connection.
+
+        Returns:
+            socket.socket | None: The connection to watch, or None if none was pending
+        """
+        try:
+            conn, _ = self._socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return None
+        conn.setblocking(False)
+        self._buffers[conn] = b""
+        return conn
+
+    def read(self, conn):
+        """
+        Read from a connection and answer once a full request line arrived.
+
+        Args:
+            conn: Connection returned by ``accept()``
+
+        Returns:
+            bool: True when the connection is finished and was closed
+        """
+        try:
+            chunk = conn.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return False
+        except OSError:
+            chunk = b""
+        data = self._buffers.get(conn, b"") + chunk
+        if chunk and b"\n" not in data and len(data) < MAX_REQUEST_SIZE:
+            self._buffers[conn] = data
+            return False
+
+        if data.strip():
+            try:
+                request = json.loads(data.split(b"\n", 1)[0].decode("utf-8"))
+                reply = handle_request(self.engine, request, self.show)
+            except ValueError:
+                reply = {"ok": False, "error": "malformed request"}
+            except Exception as e:
+                logger.error(f"Error handling control command: {e}")
+                reply = {"ok": False, "error": str(e)}
+            try:
+                conn.setblocking(True)
+                conn.settimeout(1.0)
+                conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+            except OSError as e:
+                logger.warning(f"Error answering control command: {e}")
+        self._drop(conn)
+        return True
+
+    def _drop(self, conn):
+        self._buffers.pop(conn, None)
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+    def close(self):
+        """Close all connections and remove the socket file."""
+        for conn in list(self._buffers):
+            self._drop(conn)
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
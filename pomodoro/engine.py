@@ -0,0 +1,354 @@
+"""
+Timer engine for the Pomodoro Timer application.
+Keeps time against a monotonic deadline instead of counting ticks, so the
+countdown cannot drift when wakeups are late, skipped or suspended.
+"""
+import math
+import time
+
+# Coarse OS timers may fire up to this fraction of the interval early
+COARSE_TIMER_SLACK = 0.05
+
+
+class Countdown:
+    """A pausable countdown measured against a monotonic clock.
+
+    While running only the deadline is stored; the remaining time is always
+    derived from the clock, so late or missed wakeups never add up to drift.
+    """
+
+    def __init__(self, seconds=0, clock=time.monotonic):
+        """
+        Initialize a stopped countdown.
+
+        Args:
+            seconds: Initial duration in seconds
+            clock: Monotonic clock returning seconds (injectable for tests)
+        """
+        self._clock = clock
+        self._remaining = float(seconds)
+        self._deadline = None
+
+    @property
+    def running(self):
+        """Whether the countdown is currently running."""
+        return self._deadline is not None
+
+    def reset(self, seconds):
+        """Stop the countdown and set its duration."""
+        self._remaining = float(seconds)
+        self._deadline = None
+
+    def start(self):
+        """Start or resume the countdown."""
+        if self._deadline is None:
+            self._deadline = self._clock() + self._remaining
+
+    def pause(self):
+        """Pause the countdown, keeping the remaining time."""
+        if self._deadline is not None:
+            self._remaining = max(0.0, self._deadline - self._clock())
+            self._deadline = None
+
+    def remaining(self):
+        """
+        Get the exact remaining time.
+
+        Returns:
+            float: Seconds left, never negative
+        """
+        if self._deadline is None:
+            return self._remaining
+        return max(0.0, self._deadline - self._clock())
+
+    def remaining_seconds(self):
+        """
+        Get the remaining time as shown on the display.
+
+        Returns:
+            int: Whole seconds left, rounded up so ``00:00`` means finished
+        """
+        # Round first so floating point noise never shows an extra second
+        return math.ceil(round(self.remaining(), 6))
+
+    def expired(self):
+        """Whether the countdown has reached zero."""
+        return self.remaining_seconds() == 0
+
+    def until_display_change(self):
+        """
+        Get the time until ``remaining_seconds()`` changes.
+
+        Returns:
+            float: Seconds until the displayed value ticks down (0 if expired)
+        """
+        remaining = self.remaining()
+        shown = self.remaining_seconds()
+        if shown == 0:
+            return 0.0
+        return max(0.0, remaining - (shown - 1))
+
+    def next_wakeup(self, visible=True):
+        """
+        Get the delay until the caller needs to wake up again.
+
+        When the countdown is visible that is just after the displayed second
+        changes, stretched so an early coarse timer never fires before the
+        change. When nothing is shown it is the deadline itself.
+
+        Args:
+            visible: Whether the remaining time is being displayed
+
+        Returns:
+            float: Delay in seconds
+        """
+        if not visible:
+            return self.remaining()
+        return min(self.until_display_change() / (1 - COARSE_TIMER_SLACK), self.remaining())
+
+
+class TimerEngine:
+    """The focus/rest state machine, independent of any UI toolkit.
+
+    The engine drives the session log, the notes integration and the sound
+    alerts, and tells listeners about every state change with
+    ``callback(event, **data)``. Events are ``"focus_started"``,
+    ``"rest_started"``, ``"paused"``, ``"resumed"``, ``"focus_finished"``
+    (with ``success``), ``"rest_finished"`` and ``"changed"`` for setting
+    updates. The owner wakes the engine by calling ``update()`` after
+    ``next_wakeup()`` seconds.
+    """
+
+    def __init__(self, config, sound_manager, notes_manager, session_manager, clock=time.monotonic, ask_success=None):
+        """
+        Initialize an idle engine.
+
+        Args:
+            config: Application configuration
+            sound_manager: Sound manager instance
+            notes_manager: Notes manager instance
+            session_manager: Session manager instance
+            clock: Monotonic clock returning seconds (injectable for tests)
+            ask_success: Callable returning whether a finished focus session
+                succeeded; defaults to always successful
+        """
+        self.config = config
+        self.sound_manager = sound_manager
+        self.notes_manager = notes_manager
+        self.session_manager = session_manager
+        self.ask_success = ask_success or (lambda: True)
+
+        self.pomodoro_time = config.get_focus_period() * 60  # minutes to seconds
+        self.rest_time = config.get_rest_period() * 60  # minutes to seconds
+        self.countdown = Countdown(self.pomodoro_time, clock=clock)
+        self.running = False
+        self.paused = False
+        self.is_rest_period = False
+        self.focus_text = ""
+        # True while update() finishes a period (e.g. waiting on ask_success)
+        self.finishing = False
+        self._listeners = []
+        config.add_listener(self._on_config_changed)
+
+    def add_listener(self, callback):
+        """Register ``callback(event, **data)`` for engine events."""
+        self._listeners.append(callback)
+
+    def _emit(self, event, **data):
+        for callback in list(self._listeners):
+            callback(event, **data)
+
+    @property
+    def time_left(self):
+        """Remaining seconds of the current period, derived from the countdown deadline."""
+        return self.countdown.remaining_seconds()
+
+    @time_left.setter
+    def time_left(self, seconds):
+        running = self.countdown.running
+        self.countdown.reset(seconds)
+        if running:
+            self.countdown.start()
+
+    def next_wakeup(self, visible=True):
+        """Delay in seconds until ``update()`` should be called, or None when idle."""
+        if not self.running:
+            return None
+        return self.countdown.next_wakeup(visible)
+
+    def _record_event(self, label, planned_minutes=None):
+        """Record an event in Obsidian and mirror it in the sessions log."""
+        if self.notes_manager.is_enabled():
+            self.notes_manager.record_pomodoro_session(
+                focus_text=label,
+                success=None,
+                planned_minutes=planned_minutes,
+            )
+        try:
+            self.session_manager.log_event(label)
+        except Exception:
+            pass
+
+    def _on_config_changed(self, section):
+        if section == "timer":
+            self.pomodoro_time = self.config.get_focus_period() * 60
+            self.rest_time = self.config.get_rest_period() * 60
+            # Reset the idle countdown to the new duration
+            if not self.running:
+                self.time_left = self.pomodoro_time if not self.is_rest_period else self.rest_time
+            self._emit("changed")
+
+    def start_focus(self, text, focus_minutes, rest_minutes, remember=True):
+        """
+        Start a focus session.
+
+        Args:
+            text: What the session is about
+            focus_minutes: Focus duration
+            rest_minutes: Rest duration
+            remember: Save the durations as the new defaults, as the focus
+                dialog does; when False they apply to this session only
+        """
+        self.focus_text = text
+        # Update config and internal timers
+        if remember:
+            self.config.set_focus_period(focus_minutes)
+            self.config.set_rest_period(rest_minutes)
+        self.pomodoro_time = focus_minutes * 60
+        self.rest_time = rest_minutes * 60
+
+        self.time_left = self.pomodoro_time
+        self.is_rest_period = False
+        self._start()
+        self._record_event(f"Started Focus: {self.focus_text}", planned_minutes=focus_minutes)
+        self._emit("focus_started", text=text)
+
+    def start_rest(self):
+        """Start a rest session."""
+        self.focus_text = ""
+        self.time_left = self.rest_time
+        self.is_rest_period = True
+        self._start()
+        self._record_event("Started Rest", planned_minutes=self.rest_time // 60)
+        self._emit("rest_started")
+
+    def _start(self):
+        if not self.running:
+            self.running = True
+            self.paused = False
+            self.countdown.start()
+
+    def pause(self):
+        """Pause or resume the timer."""
+        if self.running:
+            self.running = False
+            self.paused = True
+            self.countdown.pause()
+            self._record_event("Paused Focus" if not self.is_rest_period else "Paused Rest")
+            self._emit("paused")
+        else:
+            self.running = True
+            self.paused = False
+            self.countdown.start()
+            self._record_event(
+                f"Continued Focus: {self.focus_text}" if not self.is_rest_period else "Continued Rest"
+            )
+            self._emit("resumed")
+
+    def update(self):
+        """Handle a wakeup: finish the current period if its deadline has passed.
+
+        Returns:
+            bool: True if a period finished
+        """
+        if not self.running or not self.countdown.expired():
+            return False
+        self.running = False
+        self.countdown.pause()
+        self.finishing = True
+        try:
+            self._finish_period()
+        finally:
+            self.finishing = False
+        return True
+
+    def _finish_period(self):
+        if not self.is_rest_period:
+            # Focus period ended
+            self.sound_manager.play_focus_end()
+            success = self.ask_success()
+            planned = self.pomodoro_time // 60
+            self.session_manager.log_session(
+                self.focus_text,
+                success,
+                planned_minutes=planned,
+                actual_minutes=planned,
+            )
+            # Record to Obsidian vault if enabled
+            if self.notes_manager.is_enabled():
+                self.notes_manager.record_pomodoro_session(
+                    focus_text=self.focus_text,
+                    success=bool(success),
+                    early=False,
+                    planned_minutes=planned,
+                    actual_minutes=planned,
+                )
+            self._emit("focus_finished", success=success)
+            self.start_rest_period()
+        else:
+            # Rest period ended
+            self.sound_manager.play_rest_end()
+            self.reset()
+            self._emit("rest_finished")
+
+    def start_rest_period(self):
+        """Start the rest period after a focus period."""
+        self.is_rest_period = True
+        self.time_left = self.rest_time
+        self.running = True
+        self.countdown.start()
+        self._emit("rest_started")
+
+    def reset(self):
+        """Reset the timer, logging an early stop if a focus was in progress."""
+        self.running = False
+        self.paused = False
+        self.countdown.pause()
+        if not self.is_rest_period and self.focus_text and self.time_left > 0:
+            planned = self.pomodoro_time // 60
+            actual = (self.pomodoro_time - self.time_left) // 60
+            self.session_manager.log_session(
+                self.focus_text,
+                False,
+                planned_minutes=planned,
+                actual_minutes=int(actual),
+            )
+            if self.notes_manager.is_enabled():
+                self.notes_manager.record_pomodoro_session(
+                    focus_text=self.focus_text,
+                    success=False,
+                    early=True,
+                    planned_minutes=planned,
+                    actual_minutes=int(actual),
+                )
+        self.time_left = self.pomodoro_time if not self.is_rest_period else self.rest_time
+
+    def record_exit(self):
+        """Log that the application is exiting, with the running period and remaining time."""
+        try:
+            if self.running:
+                if self.is_rest_period:
+                    label = "Exited during Rest"
+                else:
+                    mins = int(self.time_left // 60)
+                    if self.focus_text:
+                        label = f"Exited during Focus: {self.focus_text} (remaining {mins}m)"
+                    else:
+                        label = f"Exited during Focus (remaining {mins}m)"
+            else:
+                label = "Exited application"
+            self.session_manager.log_event(label)
+            if self.notes_manager.is_enabled():
+                self.notes_manager.record_pomodoro_session(focus_text=label, success=None)
+        except Exception:
+            pass
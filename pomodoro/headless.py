@@ -0,0 +1,174 @@
+"""
+Headless runner for the Pomodoro Timer application.
+Drives the ``TimerEngine`` from an asyncio event loop without loading Qt,
+for servers, terminals and tiling window manager setups.
+"""
+import asyncio
+import datetime
+import logging
+import signal
+import sys
+
+from .engine import TimerEngine
+
+logger = logging.getLogger(__name__)
+
+
+class HeadlessRunner:
+    """Run focus/rest cycles on an asyncio loop and print engine events."""
+
+    def __init__(self, engine, cycles=1, output=None, control=None):
+        """
+        Initialize the runner.
+
+        Args:
+            engine: The timer engine to drive
+            cycles: Number of focus/rest cycles to run before exiting
+            output: Stream for progress lines (defaults to stdout)
+            control: Listening ``ControlServer`` to serve on the loop
+        """
+        self.engine = engine
+        self.cycles = cycles
+        self.output = output or sys.stdout
+        self.control = control
+        self._completed = 0
+        self._done = None
+        self._wakeup = None
+        engine.add_listener(self._on_event)
+
+    def _on_event(self, event, **data):
+        if event == "rest_finished":
+            self._completed += 1
+        details = "".join(f" {key}={value}" for key, value in data.items())
+        mins, secs = divmod(self.engine.time_left, 60)
+        stamp = datetime.datetime.now().strftime("%H:%M:%S")
+        self.output.write(f"{stamp} {event}{details} [{mins:02d}:{secs:02d}]\n")
+        self.output.flush()
+        if event in ("focus_started", "rest_started", "paused", "resumed") and self._done is not None:
+            # Control commands change the state between wakeups
+            self._schedule()
+
+    def _accept(self):
+        conn = self.control.accept()
+        if conn is not None:
+            loop = asyncio.get_running_loop()
+            loop.add_reader(conn.fileno(), self._read, conn)
+
+    def _read(self, conn):
+        loop = asyncio.get_running_loop()
+        fd = conn.fileno()
+        if self.control.read(conn):
+            loop.remove_reader(fd)
+
+    def _schedule(self):
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        delay = self.engine.next_wakeup(visible=False)
+        if delay is not None:
+            self._wakeup = asyncio.get_running_loop().call_later(delay, self._tick)
+
+    def _tick(self):
+        self._wakeup = None
+        self.engine.update()
+        if not self.engine.running and not self.engine.paused:
+            if self._completed >= self.cycles:
+                self._done.set()
+                return
+            self.engine.start_focus(
+                self._focus_text,
+                self.engine.pomodoro_time // 60,
+                self.engine.rest_time // 60,
+            )
+        self._schedule()
+
+    async def run(self, focus_text, focus_minutes, rest_minutes):
+        """
+        Run the configured number of cycles.
+
+        Args:
+            focus_text: What the focus sessions are about
+            focus_minutes: Focus duration
+            rest_minutes: Rest duration
+        """
+        loop = asyncio.get_running_loop()
+        self._done = asyncio.Event()
+        self._focus_text = focus_text
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._done.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Not supported on this platform
+        if self.control is not None:
+            loop.add_reader(self.control.fileno(), self._accept)
+        self.engine.start_focus(focus_text, focus_minutes, rest_minutes)
+        self._schedule()
+        try:
+            await self._done.wait()
+        finally:
+            if self._wakeup is not None:
+                self._wakeup.cancel()
+            if self.control is not None:
+                loop.remove_reader(self.control.fileno())
+            self.engine.record_exit()
+
+
+def run_headless(focus_text="", focus=None, rest=None, cycles=1):
+    """
+    Run the timer without a GUI using the regular session, notes and sound managers.
+
+    Args:
+        focus_text: What the focus sessions are about
+        focus: Focus duration in minutes (defaults to the configured one)
+        rest: Rest duration in minutes (defaults to the configured one)
+        cycles: Number of focus/rest cycles to run
+
+    Returns:
+        int: Process exit code
+    """
+    from .config import Config
+    from .control import AlreadyRunningError, ControlServer, control_supported
+    from .notes import NotesManager
+    from .session import SessionManager
+    from .sound import SoundManager
+    from .utils import get_config_path, get_user_data_dir
+
+    user_data_dir = get_user_data_dir()
+    config = Config(get_config_path())
+    overrides = {}
+    if focus is not None:
+        overrides["focus_period_minutes"] = focus
+    if rest is not None:
+        overrides["rest_period_minutes"] = rest
+    if overrides:
+        config.set_cli_overrides({"timer": overrides})
+
+    sound_manager = SoundManager(config, headless=True)
+    notes_manager = NotesManager(config)
+    session_manager = SessionManager.from_settings(config.get_session_settings(), user_data_dir)
+    sound_manager.start()
+    engine = TimerEngine(config, sound_manager, notes_manager, session_manager)
+    control = None
+    if control_supported():
+        control = ControlServer(engine)
+        try:
+            control.listen()
+        except AlreadyRunningError as e:
+            sys.stderr.write(f"pomodoro: already running ({e})\n")
+            sound_manager.close()
+            session_manager.close()
+            return 1
+        except OSError as e:
+            logger.warning(f"Control socket unavailable: {e}")
+            control = None
+    runner = HeadlessRunner(engine, cycles=cycles, control=control)
+    try:
+        asyncio.run(runner.run(focus_text, config.get_focus_period(), config.get_rest_period()))
+    finally:
+        if control is not None:
+            control.close()
+        sound_manager.close()
+        notes_manager.close()
+        session_manager.close()
+        config.flush()
+    return 0
@@ -0,0 +1,199 @@
+"""
+Background URL launcher for the Pomodoro Timer application.
+Opens ``obsidian://`` URLs from a long-lived worker thread so the UI thread
+never forks the (large) Qt process itself.
+"""
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import webbrowser
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def default_open_command():
+    """Return the command used to open a URL on this platform, or None on Windows."""
+    if sys.platform.startswith("win"):
+        return None
+    if sys.platform == "darwin":
+        return ["open"]
+    return ["xdg-open"]
+
+
+def _open_url_windows(url):
+    """Open a URL on Windows without inheriting the console when possible.
+
+    Prefer ShellExecute via os.startfile or a detached process to avoid
+    Obsidian (Electron) updater logs appearing in our console.
+    """
+    try:
+        os.startfile(url)  # type: ignore[attr-defined]
+    except Exception:
+        creationflags = 0x00000008 | 0x00000010  # DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
+        with open(os.devnull, "w") as devnull:
+            subprocess.Popen(
+                ["cmd", "/c", "start", "", url],
+                stdout=devnull,
+                stderr=devnull,
+                creationflags=creationflags,
+            )
+
+
+class UrlLauncher:
+    """Open URLs asynchronously on a worker thread with bounded concurrency.
+
+    Openers are started detached, in a session of their own, and are never
+    killed: helpers such as ``xdg-open`` may exec into (or stay attached
+    to) the application that handles the URL.
+    """
+
+    def __init__(self, command=None, max_concurrent=2, timeout=10.0):
+        """
+        Start the launcher thread.
+
+        Args:
+            command: Opener command the URL is appended to (defaults to
+                ``xdg-open`` or ``open``; None on Windows uses ShellExecute)
+            max_concurrent: Most opener processes allowed to run at once
+            timeout: Seconds after which a still-running opener stops
+                counting against ``max_concurrent``; it is left running
+        """
+        self.command = command if command is not None else default_open_command()
+        self.max_concurrent = max(1, max_concurrent)
+        self.timeout = timeout
+        self._queue = queue.SimpleQueue()
+        self._running = {}
+        self._lingering = set()
+        self._launched = 0
+        self._timed_out = 0
+        self._closed = False
+        self._drained = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="pomodoro-url-launcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, url):
+        """Queue a URL to be opened. Returns immediately."""
+        if self._closed:
+            raise ValueError("submit to closed UrlLauncher")
+        self._queue.put(url)
+
+    def close(self, timeout=1.0):
+        """
+        Hand the URLs still queued to openers without waiting for the openers.
+
+        The worker keeps reaping openers that are still running in the
+        background, so closing never holds up application exit on them.
+
+        Args:
+            timeout: Seconds to wait for the queued URLs to be launched
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._drained.wait(timeout)
+
+    def get_stats(self):
+        """
+        Get launcher counters.
+
+        Returns:
+            dict: ``launched`` openers, ``timed_out`` openers that outlived
+            the timeout and currently ``running`` ones
+        """
+        return {
+            "launched": self._launched,
+            "timed_out": self._timed_out,
+            "running": len(self._running) + len(self._lingering),
+        }
+
+    def _run(self):
+        while True:
+            # Only block on the queue when there are no openers to supervise
+            try:
+                busy = self._running or self._lingering
+                url = self._queue.get(timeout=0.05 if busy else None)
+            except queue.Empty:
+                self._reap()
+                continue
+            if url is _STOP:
+                break
+            self._wait_for_slot()
+            try:
+                self._spawn(url)
+            except Exception as e:
+                # Fall back to webbrowser if the platform opener is unavailable
+                logger.warning(f"Error launching URL opener, using webbrowser: {e}")
+                try:
+                    webbrowser.open(url)
+                except Exception as e:
+                    logger.error(f"Error opening URL: {e}")
+        self._drained.set()
+        # Keep reaping so finished openers do not linger as zombies
+        while self._running or self._lingering:
+            self._reap()
+            time.sleep(0.05)
+
+    def _wait_for_slot(self):
+        self._reap()
+        while len(self._running) >= self.max_concurrent:
+            time.sleep(0.01)
+            self._reap()
+
+    def _spawn(self, url):
+        if self.command is None:
+            _open_url_windows(url)
+            self._launched += 1
+            return
+        argv = [*self.command, url]
+        if hasattr(os, "posix_spawnp"):
+            # posix_spawn uses vfork/clone where possible, which stays cheap
+            # even when the parent has a large address space
+            devnull = os.devnull
+            pid = os.posix_spawnp(
+                argv[0],
+                argv,
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_OPEN, 2, devnull, os.O_WRONLY, 0),
+                ],
+                setsid=True,
+            )
+        else:
+            with open(os.devnull, "w") as devnull:
+                pid = subprocess.Popen(argv, stdout=devnull, stderr=devnull, start_new_session=True)
+        # Keyed by pid, or by the Popen object where posix_spawn is missing
+        self._running[pid] = time.monotonic()
+        self._launched += 1
+
+    @staticmethod
+    def _exited(pid):
+        if isinstance(pid, subprocess.Popen):
+            return pid.poll() is not None
+        try:
+            return os.waitpid(pid, os.WNOHANG)[0] != 0
+        except ChildProcessError:
+            return True
+
+    def _reap(self):
+        now = time.monotonic()
+        for pid, started in list(self._running.items()):
+            if self._exited(pid):
+                del self._running[pid]
+            elif now - started > self.timeout:
+                # Free the slot but leave the opener alone: it may have
+                # become the application handling the URL
+                logger.warning(f"URL opener still running after {self.timeout}s, no longer waiting for it")
+                self._timed_out += 1
+                del self._running[pid]
+                self._lingering.add(pid)
+        for pid in list(self._lingering):
+            if self._exited(pid):
+                self._lingering.discard(pid)
@@ -0,0 +1,145 @@
+"""
+Write-behind log writer for the Pomodoro Timer application.
+Appends lines to a file from a background thread through a persistent
+handle, so callers on the UI thread never wait for the disk.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+FLUSH_POLICIES = ("entry", "batch", "close")
+FSYNC_POLICIES = ("never", "flush", "close")
+
+_STOP = object()
+
+
+class _FlushRequest:
+    __slots__ = ("done",)
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class BufferedLogWriter:
+    """Append-only file writer fed through a queue on a background thread."""
+
+    def __init__(self, path, flush_policy="batch", flush_interval=1.0, fsync_policy="never"):
+        """
+        Open the file and start the writer thread.
+
+        Args:
+            path: File to append to
+            flush_policy: When buffered data is flushed to the OS: after every
+                entry (``"entry"``), at most every ``flush_interval`` seconds
+                (``"batch"``) or only when the writer is closed (``"close"``)
+            flush_interval: Batch window in seconds for the ``"batch"`` policy
+            fsync_policy: When data is forced to disk: ``"never"``, on every
+                flush (``"flush"``) or once on close (``"close"``)
+        """
+        if flush_policy not in FLUSH_POLICIES:
+            raise ValueError(f"flush_policy must be one of {FLUSH_POLICIES}")
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"fsync_policy must be one of {FSYNC_POLICIES}")
+        self.path = path
+        self.flush_policy = flush_policy
+        self.flush_interval = flush_interval
+        self.fsync_policy = fsync_policy
+        self._file = open(path, "ab")
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="pomodoro-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, data):
+        """
+        Queue bytes for appending. Returns immediately.
+
+        Args:
+            data: Encoded bytes, including the trailing newline
+        """
+        if self._closed:
+            raise ValueError("write to closed BufferedLogWriter")
+        self._queue.put(data)
+
+    def flush(self, timeout=None):
+        """
+        Block until everything queued so far has been written and flushed.
+
+        Returns:
+            bool: True if the flush completed within ``timeout``
+        """
+        if self._closed:
+            return True
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def close(self):
+        """Flush outstanding entries, stop the thread and close the file."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        try:
+            atexit.unregister(self.close)
+        except Exception:
+            pass
+
+    def _run(self):
+        pending = False
+        deadline = None
+        while True:
+            timeout = None
+            if pending and self.flush_policy == "batch":
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush()
+                pending = False
+                continue
+
+            if item is _STOP:
+                self._flush()
+                if self.fsync_policy == "close":
+                    self._fsync()
+                self._file.close()
+                return
+            if isinstance(item, _FlushRequest):
+                self._flush()
+                pending = False
+                item.done.set()
+                continue
+
+            try:
+                self._file.write(item)
+            except Exception as e:
+                logger.error(f"Error writing to {self.path}: {e}")
+            if self.flush_policy == "entry":
+                self._flush()
+            elif not pending:
+                pending = True
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self):
+        try:
+            self._file.flush()
+            if self.fsync_policy == "flush":
+                self._fsync()
+        except Exception as e:
+            logger.error(f"Error flushing {self.path}: {e}")
+
+    def _fsync(self):
+        try:
+            os.fsync(self._file.fileno())
+        except Exception as e:
+            logger.error(f"Error syncing {self.path}: {e}")
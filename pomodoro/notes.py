@@ -2,16 +2,181 @@
 Notes integration module for the Pomodoro Timer application.
 Handles integration with Obsidian and other note-taking systems.
 """
+import atexit
 import datetime
 import logging
 import os
-import sys
-import subprocess
+import re
+import threading
 import urllib.parse
-import webbrowser
+from collections import Counter
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# Default window in seconds for batching session lines into one append
+DEFAULT_APPEND_DEBOUNCE = 2.0
+
+# Trailing "(planned Nm, actual Nm)" details of a session line
+_MINUTES_SUFFIX = re.compile(r" \((?:planned \d+m|actual \d+m)(?:, actual \d+m)?\)$")
+
+
+def format_session_line(
+    time_str: str,
+    focus_text: str,
+    success: bool | None,
+    early: bool = False,
+    planned_minutes: int | None = None,
+    actual_minutes: int | None = None,
+    status: str | None = None,
+) -> str:
+    """Format one Markdown list item for the dated sessions note.
+
+    Args:
+        time_str: Time of the entry as ``HH:MM``
+        focus_text: What the session was about
+        success: Whether the session succeeded, or None for plain events
+        early: Whether an unsuccessful session was stopped early
+        planned_minutes: Planned duration, if known
+        actual_minutes: Actual duration, if known
+        status: Explicit status text overriding ``success``/``early``
+
+    Returns:
+        str: The line without a trailing newline
+    """
+    if status is None:
+        if success is None:
+            status_str = ""
+        else:
+            status_str = "success" if success else ("early stop" if early else "failed")
+    else:
+        status_str = status
+    details: list[str] = []
+    if planned_minutes is not None:
+        details.append(f"planned {planned_minutes}m")
+    if actual_minutes is not None:
+        details.append(f"actual {actual_minutes}m")
+    detail_str = f" ({', '.join(details)})" if details else ""
+    focus_desc = focus_text or "(no description)"
+    if status_str:
+        return f"- {time_str} – {focus_desc} — {status_str}{detail_str}"
+    return f"- {time_str} – {focus_desc}{detail_str}"
+
+
+def append_to_note(path: str, lines: list[str]) -> None:
+    """Append lines to a Markdown note on disk in a single locked write.
+
+    The file is opened with ``O_APPEND`` and locked with ``flock`` where
+    available, so concurrent writers (another instance, a sync client)
+    never interleave partial lines. A newline is inserted first if the
+    file does not already end with one.
+
+    Args:
+        path: Absolute path of the note
+        lines: Lines to append, without trailing newlines
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = "".join(f"{line}\n" for line in lines).encode("utf-8")
+    fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        size = os.fstat(fd).st_size
+        if size:
+            os.lseek(fd, size - 1, os.SEEK_SET)
+            if os.read(fd, 1) != b"\n":
+                data = b"\n" + data
+        os.write(fd, data)
+    finally:
+        # Closing the descriptor also releases the lock
+        os.close(fd)
+
+
+def sessions_note_path(sessions_subpath: str, date_str: str) -> str:
+    """Return the vault-relative path of the sessions note for a ``YYYY-MM-DD`` date."""
+    filename = f"{date_str} - Pomodoro Sessions.md"
+    return f"{sessions_subpath}/{filename}" if sessions_subpath else filename
+
+
+def session_line_key(line: str) -> str:
+    """Return a session line without its minutes details.
+
+    Session logs in the legacy text format do not record planned and
+    actual minutes, so lines are matched on time, text and status only.
+    """
+    return _MINUTES_SUFFIX.sub("", line.rstrip("\n"))
+
+
+def backfill_sessions(records, vault_path: str, sessions_subpath: str = "") -> tuple[int, int]:
+    """Write historical session records into the dated sessions notes of a vault.
+
+    Records are streamed and grouped by day, so only one day's lines are
+    held in memory. Each day's new lines go out in a single append. Lines
+    already present in the note are skipped, matched on time, text and
+    status (see ``session_line_key``) and counted, so repeated identical
+    entries are kept and running the backfill again is a no-op.
+
+    Args:
+        records: Session records in chronological order
+        vault_path: Vault folder on disk
+        sessions_subpath: Folder inside the vault holding the sessions notes
+
+    Returns:
+        tuple[int, int]: Number of notes written and number of lines added
+    """
+    notes_written = 0
+    lines_added = 0
+
+    def write_day(date_str, lines):
+        path = os.path.join(os.path.expanduser(vault_path), sessions_note_path(sessions_subpath, date_str))
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                existing = Counter(session_line_key(line) for line in file)
+        except FileNotFoundError:
+            existing = Counter()
+        # Append only the surplus of each line over the copies already in the note
+        new_lines = []
+        for line in lines:
+            key = session_line_key(line)
+            if existing[key] > 0:
+                existing[key] -= 1
+            else:
+                new_lines.append(line)
+        if new_lines:
+            append_to_note(path, new_lines)
+        return len(new_lines)
+
+    current_date = None
+    lines: list[str] = []
+    for record in records:
+        if record.date != current_date:
+            if lines:
+                added = write_day(current_date, lines)
+                notes_written += bool(added)
+                lines_added += added
+            current_date = record.date
+            lines = []
+        lines.append(
+            format_session_line(
+                record.timestamp[11:16],
+                record.focus_text,
+                None,
+                planned_minutes=record.planned_minutes,
+                actual_minutes=record.actual_minutes,
+                status=record.status,
+            )
+        )
+    if lines:
+        added = write_day(current_date, lines)
+        notes_written += bool(added)
+        lines_added += added
+    return notes_written, lines_added
+
+
 class NotesManager:
     """Manager for integrating with note-taking systems."""
 
@@ -25,40 +190,125 @@ class NotesManager:
         self.config = config
         self.enabled = config.is_obsidian_enabled()
         self.obsidian_settings = config.get_obsidian_settings()
+        # Session lines waiting to be appended, keyed by (vault, filepath)
+        self._pending: dict[tuple[str, str], list[str]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        self._events_received = 0
+        self._urls_dispatched = 0
+        self._files_appended = 0
+        self._launcher = None
+        config.add_listener(self._on_config_changed)
+        atexit.register(self.flush)
+
+    def _on_config_changed(self, section: str) -> None:
+        """Pick up changed Obsidian settings."""
+        if section == "obsidian":
+            self.enabled = self.config.is_obsidian_enabled()
+            self.obsidian_settings = self.config.get_obsidian_settings()
 
     def _open_obsidian_url(self, url: str) -> None:
-        """Open an Obsidian URL without inheriting the console when possible.
+        """Open an Obsidian URL on the background launcher.
 
-        On Windows, prefer ShellExecute via os.startfile or a detached process
-        to avoid Obsidian (Electron) updater logs appearing in our console.
+        The opener process is started by ``UrlLauncher`` on its own thread,
+        so callers on the UI thread never fork the Qt process.
         """
+        with self._pending_lock:
+            if self._launcher is None:
+                from .launcher import UrlLauncher
+
+                self._launcher = UrlLauncher()
+        self._launcher.submit(url)
+
+    def _append_debounce(self) -> float:
+        value = (self.obsidian_settings or {}).get("append_debounce_seconds", DEFAULT_APPEND_DEBOUNCE)
         try:
-            if sys.platform.startswith("win"):
-                try:
-                    os.startfile(url)  # type: ignore[attr-defined]
-                    return
-                except Exception:
-                    creationflags = 0x00000008 | 0x00000010  # DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
-                    with open(os.devnull, "w") as devnull:
-                        subprocess.Popen(
-                            ["cmd", "/c", "start", "", url],
-                            stdout=devnull,
-                            stderr=devnull,
-                            creationflags=creationflags,
-                        )
-                    return
-            elif sys.platform == "darwin":
-                with open(os.devnull, "w") as devnull:
-                    subprocess.Popen(["open", url], stdout=devnull, stderr=devnull)
-                return
-            else:
-                # Linux/Unix
-                with open(os.devnull, "w") as devnull:
-                    subprocess.Popen(["xdg-open", url], stdout=devnull, stderr=devnull)
-                return
-        except Exception:
-            # Fallback to webbrowser if platform-specific approach fails
-            webbrowser.open(url)
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return DEFAULT_APPEND_DEBOUNCE
+
+    def _queue_append(self, vault: str, filepath: str, line: str) -> None:
+        """Queue a line for ``filepath``, starting the debounce window if needed."""
+        with self._pending_lock:
+            self._events_received += 1
+            self._pending.setdefault((vault, filepath), []).append(line)
+            delay = self._append_debounce()
+            if delay and self._flush_timer is None:
+                self._flush_timer = threading.Timer(delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if not delay:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send all queued session lines now, one append per target file."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        vault_path = (self.obsidian_settings or {}).get("vault_path") or ""
+        for (vault, filepath), lines in pending.items():
+            if vault_path and self._append_direct(vault_path, filepath, lines):
+                continue
+            if not vault:
+                logger.warning(f"Obsidian vault_name not set; dropped {len(lines)} session line(s) for {filepath}")
+                continue
+            try:
+                url = (
+                    "obsidian://adv-uri?vault="
+                    + urllib.parse.quote(vault)
+                    + "&filepath="
+                    + urllib.parse.quote(filepath)
+                    + "&data="
+                    + urllib.parse.quote("\n".join(lines))
+                    + "&mode=append&silent=true"
+                )
+                self._open_obsidian_url(url)
+                with self._pending_lock:
+                    self._urls_dispatched += 1
+                logger.info(f"Recorded {len(lines)} session line(s) to Obsidian via Advanced URI")
+            except Exception as e:
+                logger.error(f"Error recording session to Obsidian via Advanced URI: {e}")
+
+    def _append_direct(self, vault_path: str, filepath: str, lines: list[str]) -> bool:
+        """Append lines straight to the note file inside a local vault.
+
+        Returns:
+            bool: True on success; False means the caller should fall back to the URI
+        """
+        try:
+            append_to_note(os.path.join(os.path.expanduser(vault_path), filepath), lines)
+            with self._pending_lock:
+                self._files_appended += 1
+            logger.info(f"Recorded {len(lines)} session line(s) to {filepath} in {vault_path}")
+            return True
+        except OSError as e:
+            logger.error(f"Error writing session to vault {vault_path}, falling back to Advanced URI: {e}")
+            return False
+
+    def close(self) -> None:
+        """Flush queued session lines and wait for launched URLs; call when the application exits."""
+        self.flush()
+        atexit.unregister(self.flush)
+        if self._launcher is not None:
+            self._launcher.close()
+
+    def get_dispatch_stats(self) -> dict:
+        """
+        Get counters for the session append queue.
+
+        Returns:
+            dict: ``events_received``, ``urls_dispatched``, ``files_appended``
+            (direct vault writes) and ``pending`` lines
+        """
+        with self._pending_lock:
+            return {
+                "events_received": self._events_received,
+                "urls_dispatched": self._urls_dispatched,
+                "files_appended": self._files_appended,
+                "pending": sum(len(lines) for lines in self._pending.values()),
+            }
 
     def record_pomodoro_session(
         self,
@@ -74,50 +324,33 @@ class NotesManager:
 
         Uses obsidian://adv-uri with mode=append to write into a file
         "YYYY-MM-DD - Pomodoro Sessions.md" under the configured
-        `sessions_notes_path` in the given `vault_name`.
+        `sessions_notes_path` in the given `vault_name`. Entries are queued
+        and lines for the same file within `append_debounce_seconds` are
+        sent as one multi-line append. When `vault_path` points at the vault
+        folder on disk, the lines are appended to the file directly instead,
+        and `vault_name` is only needed if that write fails.
         """
         if not self.enabled:
             return False
         try:
-            date_str = datetime.datetime.now().strftime("%Y-%m-%d")
-            time_str = datetime.datetime.now().strftime("%H:%M")
-            if status is None:
-                if success is None:
-                    status_str = ""
-                else:
-                    status_str = "success" if success else ("early stop" if early else "failed")
-            else:
-                status_str = status
-            details: list[str] = []
-            if planned_minutes is not None:
-                details.append(f"planned {planned_minutes}m")
-            if actual_minutes is not None:
-                details.append(f"actual {actual_minutes}m")
-            detail_str = f" ({', '.join(details)})" if details else ""
-            focus_desc = focus_text or "(no description)"
-            if status_str:
-                line = f"- {time_str} – {focus_desc} — {status_str}{detail_str}"
-            else:
-                line = f"- {time_str} – {focus_desc}{detail_str}"
-
+            now = datetime.datetime.now()
+            line = format_session_line(
+                now.strftime("%H:%M"),
+                focus_text,
+                success,
+                early=early,
+                planned_minutes=planned_minutes,
+                actual_minutes=actual_minutes,
+                status=status,
+            )
             sessions_subpath = (self.obsidian_settings or {}).get("sessions_notes_path") or ""
-            filepath = f"{sessions_subpath}/{date_str} - Pomodoro Sessions.md" if sessions_subpath else f"{date_str} - Pomodoro Sessions.md"
+            filepath = sessions_note_path(sessions_subpath, now.strftime("%Y-%m-%d"))
             vault = (self.obsidian_settings or {}).get("vault_name") or ""
-            if not vault:
+            if not vault and not (self.obsidian_settings or {}).get("vault_path"):
                 logger.warning("Obsidian vault_name not set; cannot record session via Advanced URI")
                 return False
 
-            url = (
-                "obsidian://adv-uri?vault="
-                + urllib.parse.quote(vault)
-                + "&filepath="
-                + urllib.parse.quote(filepath)
-                + "&data="
-                + urllib.parse.quote(line)
-                + "&mode=append&silent=true"
-            )
-            self._open_obsidian_url(url)
-            logger.info("Recorded session to Obsidian via Advanced URI")
+            self._queue_append(vault, filepath, line)
             return True
         except Exception as e:
             logger.error(f"Error recording session to Obsidian via Advanced URI: {e}")
@@ -0,0 +1,177 @@
+"""
+Session record format for the Pomodoro Timer application.
+Defines the structured JSON Lines records written to the sessions log and
+a streaming reader that also understands the legacy plain-text lines.
+"""
+import json
+
+KIND_SESSION = "session"
+KIND_EVENT = "event"
+
+# Line prefixes written for each kind, in both formats
+_KIND_PREFIXES = {
+    KIND_SESSION: ("Session ", '{"kind":"session"'),
+    KIND_EVENT: ("Event at ", '{"kind":"event"'),
+}
+
+_FIELDS = ("kind", "timestamp", "number", "focus_text", "planned_minutes", "actual_minutes", "status")
+
+
+class SessionRecord:
+    """A single completed session or event from the sessions log."""
+
+    __slots__ = _FIELDS
+
+    def __init__(
+        self,
+        kind,
+        timestamp,
+        number=None,
+        focus_text="",
+        planned_minutes=None,
+        actual_minutes=None,
+        status=None,
+    ):
+        """
+        Initialize the record.
+
+        Args:
+            kind: ``"session"`` or ``"event"``
+            timestamp: Local time as ``YYYY-MM-DD HH:MM:SS``
+            number: Session number (sessions only)
+            focus_text: Focus description, or the message for events
+            planned_minutes: Planned duration in minutes
+            actual_minutes: Actual duration in minutes
+            status: ``"success"``, ``"failed"`` or a free-form status
+        """
+        self.kind = kind
+        self.timestamp = timestamp
+        self.number = number
+        self.focus_text = focus_text
+        self.planned_minutes = planned_minutes
+        self.actual_minutes = actual_minutes
+        self.status = status
+
+    def __repr__(self):
+        return f"SessionRecord({self.kind!r}, {self.timestamp!r}, number={self.number!r}, focus_text={self.focus_text!r}, status={self.status!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, SessionRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _FIELDS)
+
+    @property
+    def date(self):
+        """The ``YYYY-MM-DD`` part of the timestamp."""
+        return self.timestamp[:10]
+
+    @property
+    def success(self):
+        """Whether this is a successfully completed session."""
+        return self.kind == KIND_SESSION and self.status == "success"
+
+    def to_json(self):
+        """Serialize the record as a single JSON line (without newline)."""
+        return json.dumps(
+            {name: getattr(self, name) for name in _FIELDS},
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, line):
+        """Create a record from a JSON line."""
+        data = json.loads(line)
+        return cls(
+            data["kind"],
+            data["timestamp"],
+            data.get("number"),
+            data.get("focus_text") or "",
+            data.get("planned_minutes"),
+            data.get("actual_minutes"),
+            data.get("status"),
+        )
+
+    @classmethod
+    def from_legacy(cls, line):
+        """
+        Create a record from a legacy plain-text log line.
+
+        Returns:
+            SessionRecord | None: The record, or None if the line is not recognised
+        """
+        line = line.rstrip("\n")
+        if line.startswith("Session "):
+            head, sep, rest = line.partition(" completed at ")
+            if not sep:
+                return None
+            try:
+                number = int(head[len("Session "):])
+            except ValueError:
+                number = None
+            tail = rest[22:] if rest[19:22] == " - " else ""
+            status = None
+            if tail == "success" or tail == "failed":
+                tail, status = "", tail
+            elif tail.endswith(" - success") or tail.endswith(" - failed"):
+                tail, _, status = tail.rpartition(" - ")
+            return cls(KIND_SESSION, rest[:19], number, tail, status=status)
+        if line.startswith("Event at "):
+            message = line[31:] if line[28:31] == " - " else ""
+            return cls(KIND_EVENT, line[9:28], focus_text=message)
+        return None
+
+
+def parse_line(line):
+    """
+    Parse one sessions log line in either format.
+
+    Returns:
+        SessionRecord | None: The record, or None for blank or unrecognised lines
+    """
+    if line.startswith("{"):
+        try:
+            return SessionRecord.from_json(line)
+        except (ValueError, KeyError):
+            return None
+    return SessionRecord.from_legacy(line)
+
+
+def line_date(line):
+    """Return the ``YYYY-MM-DD`` date of a log line in either format, or None."""
+    if line.startswith("{"):
+        pos = line.find('"timestamp":"')
+        if pos < 0:
+            return None
+        return line[pos + 13:pos + 23]
+    pos = line.find(" at ")
+    if pos < 0:
+        return None
+    return line[pos + 4:pos + 14]
+
+
+def iter_records(lines, kind=None):
+    """
+    Parse log lines into records, one pass and one parse per line.
+
+    Args:
+        lines: Iterable of log lines (JSON Lines or legacy format, mixed freely)
+        kind: Only yield records of this kind (``"session"`` or ``"event"``);
+            other lines are skipped by their prefix without being parsed
+
+    Yields:
+        SessionRecord: Parsed records; unrecognised lines are skipped
+    """
+    if kind is None:
+        for line in lines:
+            record = parse_line(line)
+            if record is not None:
+                yield record
+        return
+
+    prefixes = _KIND_PREFIXES[kind]
+    for line in lines:
+        if not line.startswith(prefixes):
+            continue
+        record = parse_line(line)
+        if record is not None and record.kind == kind:
+            yield record
@@ -0,0 +1,217 @@
+"""
+Resource synchronisation for the Pomodoro Timer application.
+Copies the packaged icons and sounds into the user data directory, recording
+what was copied in a stamp file. Launch only reads the stamp; the file list,
+size and mtime fingerprints of both sides are checked on a background thread.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+
+from .utils import get_resource_path
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_DIRS = ("icons", "sounds")
+STAMP_FILE = ".resources-stamp.json"
+
+
+def _package_version():
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("pomodoro-timer")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _default_source_dirs():
+    return {name: get_resource_path(name) for name in RESOURCE_DIRS}
+
+
+def _list_resources(source_dirs):
+    """Yield ``(relative, source_path)`` for every packaged resource file."""
+    for name, source_dir in source_dirs.items():
+        if not os.path.isdir(source_dir):
+            continue
+        for filename in sorted(os.listdir(source_dir)):
+            src_path = os.path.join(source_dir, filename)
+            if os.path.isfile(src_path):
+                yield f"{name}/{filename}", src_path
+
+
+def _stat_state(paths):
+    """
+    Fingerprint files by path, size and mtime without reading them.
+
+    Args:
+        paths: Iterable of ``(relative, absolute)`` paths
+
+    Returns:
+        str: Hash over the listing; missing files are part of it
+    """
+    digest = hashlib.sha256()
+    for relative, path in paths:
+        try:
+            stat = os.stat(path)
+            digest.update(f"{relative}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        except OSError:
+            digest.update(f"{relative}:missing\n".encode())
+    return digest.hexdigest()
+
+
+def _user_paths(user_data_dir, relatives):
+    return [(relative, os.path.join(user_data_dir, *relative.split("/"))) for relative in sorted(relatives)]
+
+
+def _content_hash(files):
+    return hashlib.sha256(
+        "\n".join(f"{path}:{digest}" for path, digest in sorted(files.items())).encode()
+    ).hexdigest()
+
+
+def _read_stamp(user_data_dir):
+    try:
+        with open(os.path.join(user_data_dir, STAMP_FILE), "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def resources_up_to_date(user_data_dir, version=None):
+    """
+    Check the stamp written by the last successful sync.
+
+    Only the stamp itself is read: its version must match the package and its
+    content hash must match the files it lists. Nothing else is probed, so
+    this is cheap enough to run on every launch.
+
+    Args:
+        user_data_dir: User data directory holding the stamp
+        version: Package version to compare with (defaults to the installed one)
+
+    Returns:
+        bool: True if the resources were synced for this package version
+    """
+    stamp = _read_stamp(user_data_dir)
+    if not stamp or stamp.get("version") != (version or _package_version()):
+        return False
+    files = stamp.get("files")
+    return isinstance(files, dict) and stamp.get("content_hash") == _content_hash(files)
+
+
+def resources_changed(user_data_dir, source_dirs=None):
+    """
+    Check whether the packaged files or the user's copies changed since the last sync.
+
+    The file list, sizes and mtimes of both sides are compared with the
+    fingerprints in the stamp, so a development checkout edited without a
+    version bump, or a deleted or edited user copy, is noticed. This stats
+    every resource file and is meant for the background thread.
+
+    Args:
+        user_data_dir: User data directory holding the stamp
+        source_dirs: Mapping of resource directory name to source path
+            (defaults to the packaged ``icons`` and ``sounds`` directories)
+
+    Returns:
+        bool: True if a sync is needed
+    """
+    stamp = _read_stamp(user_data_dir)
+    if source_dirs is None:
+        source_dirs = _default_source_dirs()
+    if stamp.get("source_state") != _stat_state(_list_resources(source_dirs)):
+        return True
+    return stamp.get("user_state") != _stat_state(_user_paths(user_data_dir, stamp.get("files", {})))
+
+
+def sync_resources(user_data_dir, source_dirs=None, version=None):
+    """
+    Copy new and updated packaged resources into the user data directory.
+
+    Missing files are copied. A file that already exists is only replaced
+    when the packaged version changed and the user's copy still matches the
+    previously packaged content, so user customisations are kept.
+
+    Args:
+        user_data_dir: Destination user data directory
+        source_dirs: Mapping of resource directory name to source path
+            (defaults to the packaged ``icons`` and ``sounds`` directories)
+        version: Package version recorded in the stamp
+
+    Returns:
+        list[str]: Relative paths of the files that were copied
+    """
+    if source_dirs is None:
+        source_dirs = _default_source_dirs()
+    previous = _read_stamp(user_data_dir).get("files", {})
+    sources = list(_list_resources(source_dirs))
+    files = {}
+    copied = []
+
+    for relative, src_path in sources:
+        name, filename = relative.split("/", 1)
+        user_dir = os.path.join(user_data_dir, name)
+        os.makedirs(user_dir, exist_ok=True)
+        digest = _hash_file(src_path)
+        files[relative] = digest
+        dst_path = os.path.join(user_dir, filename)
+
+        if os.path.exists(dst_path):
+            old_digest = previous.get(relative)
+            if old_digest in (None, digest) or _hash_file(dst_path) != old_digest:
+                continue
+        tmp_path = f"{dst_path}.tmp"
+        shutil.copy2(src_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+        copied.append(relative)
+
+    stamp = {
+        "version": version or _package_version(),
+        "content_hash": _content_hash(files),
+        "source_state": _stat_state(sources),
+        "user_state": _stat_state(_user_paths(user_data_dir, files)),
+        "files": files,
+    }
+    tmp_stamp = os.path.join(user_data_dir, f"{STAMP_FILE}.tmp")
+    with open(tmp_stamp, "w") as file:
+        json.dump(stamp, file, indent=2)
+    os.replace(tmp_stamp, os.path.join(user_data_dir, STAMP_FILE))
+    if copied:
+        logger.info(f"Copied {len(copied)} resource file(s) to {user_data_dir}")
+    return copied
+
+
+def sync_resources_in_background(user_data_dir):
+    """
+    Check the stamp and sync the resources on a daemon thread.
+
+    Call this after the window is shown: nothing is touched on the calling
+    thread, and the copy runs only when the stamp is stale or
+    ``resources_changed`` finds drift.
+
+    Returns:
+        threading.Thread: The started thread
+    """
+    def run():
+        try:
+            if resources_up_to_date(user_data_dir) and not resources_changed(user_data_dir):
+                return
+            sync_resources(user_data_dir)
+        except Exception as e:
+            logger.error(f"Error syncing resources: {e}")
+
+    thread = threading.Thread(target=run, name="pomodoro-resource-sync", daemon=True)
+    thread.start()
+    return thread
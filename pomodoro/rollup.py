@@ -0,0 +1,174 @@
+"""
+Persisted daily and weekly session rollups for the Pomodoro Timer application.
+Keeps per-day and per-ISO-week counters so statistics are simple lookups.
+"""
+import datetime
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_VERSION = 2
+
+# Bytes hashed at the start of the log and before the summarised offset
+FINGERPRINT_BYTES = 64
+
+
+def week_key(date):
+    """Return the ISO week key (``YYYY-Www``) for a ``YYYY-MM-DD`` date."""
+    year, week, _ = datetime.date.fromisoformat(date).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def log_fingerprint(path, size):
+    """
+    Identify a log file up to ``size`` bytes.
+
+    Args:
+        path: Path to the log
+        size: Offset the fingerprint covers
+
+    Returns:
+        str | None: Inode plus a hash of the first bytes and of the bytes
+        just before ``size``, or None if the file cannot be read that far
+    """
+    try:
+        with open(path, "rb") as file:
+            inode = os.fstat(file.fileno()).st_ino
+            head = file.read(min(size, FINGERPRINT_BYTES))
+            file.seek(max(0, size - FINGERPRINT_BYTES))
+            tail = file.read(min(size, FINGERPRINT_BYTES))
+    except OSError:
+        return None
+    if len(tail) < min(size, FINGERPRINT_BYTES):
+        return None
+    digest = hashlib.sha1(head + b"\0" + tail).hexdigest()[:16]
+    return f"{inode}:{digest}"
+
+
+class RollupCache:
+    """Per-day and per-week session counters validated against the log."""
+
+    def __init__(self, log_file, cache_file=None):
+        """
+        Initialize an empty rollup cache.
+
+        Args:
+            log_file: Path to the sessions log the rollup summarises
+            cache_file: Path to the cache file (defaults to ``<log_file>.rollup.json``)
+        """
+        self.log_file = log_file
+        self.cache_file = cache_file or f"{log_file}.rollup.json"
+        self.loaded = False
+        self.dirty = False
+        self.size = 0
+        self.mtime = 0.0
+        self.fingerprint = None
+        self.days = {}
+        self.weeks = {}
+        self._week_cache = (None, None)
+
+    def load(self):
+        """
+        Read the persisted cache.
+
+        Returns:
+            bool: True if a cache file of the current version was read
+        """
+        self.loaded = True
+        try:
+            with open(self.cache_file, "r") as file:
+                data = json.load(file)
+            if data.get("version") != ROLLUP_VERSION:
+                raise ValueError("unsupported rollup version")
+            self.size = data["size"]
+            self.mtime = data["mtime"]
+            self.fingerprint = data.get("fingerprint")
+            self.days = data["days"]
+            self.weeks = data["weeks"]
+            return True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Discarding unreadable session rollup: {e}")
+        self.clear()
+        return False
+
+    def clear(self):
+        """Forget all counters."""
+        self.size = 0
+        self.mtime = 0.0
+        self.fingerprint = None
+        self.days = {}
+        self.weeks = {}
+        self.dirty = True
+
+    def matches(self, size):
+        """Whether the log's first ``self.size`` bytes are still the ones summarised."""
+        return 0 < self.size <= size and self.fingerprint == log_fingerprint(self.log_file, self.size)
+
+    def invalidate(self):
+        """Forget all counters and delete the persisted cache, e.g. after the log was rewritten."""
+        self.clear()
+        self.loaded = True
+        try:
+            os.remove(self.cache_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error removing session rollup: {e}")
+
+    def apply(self, record):
+        """Fold one session record into its day and week buckets."""
+        date = record.date
+        cached_date, key = self._week_cache
+        if cached_date != date:
+            key = week_key(date)
+            self._week_cache = (date, key)
+        success = record.status == "success"
+        for bucket_map, bucket_key in ((self.days, date), (self.weeks, key)):
+            bucket = bucket_map.get(bucket_key)
+            if bucket is None:
+                bucket = bucket_map[bucket_key] = {
+                    "count": 0, "successes": 0, "failures": 0, "focus_areas": [],
+                }
+            bucket["count"] += 1
+            bucket["successes" if success else "failures"] += 1
+            if record.focus_text and record.focus_text not in bucket["focus_areas"]:
+                bucket["focus_areas"].append(record.focus_text)
+        self.dirty = True
+
+    def day(self, date):
+        """Return the bucket for a ``YYYY-MM-DD`` date, or None."""
+        return self.days.get(date)
+
+    def week(self, key):
+        """Return the bucket for a ``YYYY-Www`` week key, or None."""
+        return self.weeks.get(key)
+
+    def save(self):
+        """Persist the cache atomically, stamped with the log's current mtime and fingerprint."""
+        if not self.dirty or not os.path.exists(self.log_file):
+            return
+        try:
+            self.mtime = os.stat(self.log_file).st_mtime
+            self.fingerprint = log_fingerprint(self.log_file, self.size)
+            tmp_path = f"{self.cache_file}.tmp"
+            with open(tmp_path, "w") as file:
+                json.dump(
+                    {
+                        "version": ROLLUP_VERSION,
+                        "size": self.size,
+                        "mtime": self.mtime,
+                        "fingerprint": self.fingerprint,
+                        "days": self.days,
+                        "weeks": self.weeks,
+                    },
+                    file,
+                )
+            os.replace(tmp_path, self.cache_file)
+            self.dirty = False
+        except Exception as e:
+            logger.error(f"Error saving session rollup: {e}")
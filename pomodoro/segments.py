@@ -0,0 +1,274 @@
+"""
+Monthly log segments for the Pomodoro Timer application.
+Rolls finished months out of the active sessions log into gzip-compressed
+segments and keeps a manifest of per-segment counters and time ranges.
+
+A roll is recorded in the manifest as pending before the active log is
+replaced, and segments are only appended to after that, so a roll cut short
+by a crash is finished on the next ``roll()`` without writing lines twice.
+"""
+import gzip
+import json
+import logging
+import os
+
+from .records import KIND_SESSION, line_date, parse_line
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+class LogSegments:
+    """Compressed monthly segments of a sessions log plus their manifest."""
+
+    def __init__(self, log_file):
+        """
+        Initialize the segment set for an active log file.
+
+        Args:
+            log_file: Path to the active (current month) sessions log
+        """
+        self.log_file = log_file
+        self.directory = os.path.dirname(os.path.abspath(log_file))
+        stem, ext = os.path.splitext(os.path.basename(log_file))
+        self._stem = stem
+        self._ext = ext or ".log"
+        self.manifest_file = os.path.join(self.directory, f"{stem}.manifest.json")
+        self.pending = None
+        self.segments = self._load_manifest()
+
+    def segment_path(self, month):
+        """Return the path of the compressed segment for ``month`` (``YYYY-MM``)."""
+        return os.path.join(self.directory, f"{self._stem}.{month}{self._ext}.gz")
+
+    def session_count(self):
+        """Return the number of sessions in all closed segments."""
+        return sum(segment["sessions"] for segment in self.segments)
+
+    def success_count(self):
+        """Return the number of successful sessions in all closed segments."""
+        return sum(segment["successes"] for segment in self.segments)
+
+    def needs_roll(self, current_month):
+        """Check whether the active log starts before ``current_month``."""
+        try:
+            with open(self.log_file, "r", encoding="utf-8", errors="replace") as file:
+                for line in file:
+                    date = line_date(line)
+                    if date is not None:
+                        return date[:7] < current_month
+        except FileNotFoundError:
+            pass
+        return False
+
+    def roll(self, current_month):
+        """
+        Move entries older than ``current_month`` into compressed segments.
+
+        The active log is streamed once; older lines go to their month's
+        segment and the remainder becomes the new active log. A roll left
+        pending by an earlier crash is finished first.
+
+        Args:
+            current_month: Month (``YYYY-MM``) that stays in the active log
+
+        Returns:
+            int: Number of lines moved into segments
+        """
+        active_tmp = f"{self.log_file}.rolling"
+        recovered = self._finish_pending(active_tmp)
+        if not self.needs_roll(current_month):
+            return recovered
+        written = {}
+        moved = 0
+        month = None
+        out = None
+        out_month = None
+        try:
+            with open(self.log_file, "r", encoding="utf-8", errors="replace") as src, \
+                    open(active_tmp, "w", encoding="utf-8") as active:
+                for line in src:
+                    date = line_date(line)
+                    if date is not None:
+                        month = date[:7]
+                    if month is None or month >= current_month:
+                        active.write(line)
+                        continue
+                    if month != out_month:
+                        if out is not None:
+                            out.close()
+                        # Out-of-order months append another gzip member
+                        mode = "at" if month in written else "wt"
+                        out = gzip.open(f"{self.segment_path(month)}.tmp", mode, encoding="utf-8")
+                        out_month = month
+                        written.setdefault(
+                            month, {"sessions": 0, "successes": 0, "first": None, "last": None}
+                        )
+                    stats = written[month]
+                    out.write(line)
+                    moved += 1
+                    record = parse_line(line)
+                    if record is not None:
+                        if record.kind == KIND_SESSION:
+                            stats["sessions"] += 1
+                            if record.success:
+                                stats["successes"] += 1
+                        if stats["first"] is None:
+                            stats["first"] = record.timestamp
+                        stats["last"] = record.timestamp
+            if out is not None:
+                out.close()
+                out = None
+
+            # Record the roll, then switch the active log: from here on the
+            # moved lines exist only in the segment temporaries
+            self.pending = {"moved": moved, "months": {}}
+            for month, stats in written.items():
+                path = self.segment_path(month)
+                base_size = os.path.getsize(path) if os.path.exists(path) else None
+                self.pending["months"][month] = {"stats": stats, "base_size": base_size}
+            self.save_manifest()
+            os.replace(active_tmp, self.log_file)
+        except BaseException:
+            if self.pending is not None:
+                # The active log is unchanged; drop the recorded roll
+                self.pending = None
+                self.save_manifest()
+            for month in written:
+                self._remove(f"{self.segment_path(month)}.tmp")
+            raise
+        finally:
+            if out is not None:
+                out.close()
+            self._remove(active_tmp)
+        self._commit_pending()
+        logger.info(f"Rolled {moved} log lines into {len(written)} segment(s)")
+        return recovered + moved
+
+    def _finish_pending(self, active_tmp):
+        """
+        Finish or discard a roll interrupted by a crash.
+
+        Returns:
+            int: Number of lines moved by a roll that was finished here
+        """
+        if self.pending is None:
+            # Leftovers of a roll that never reached the manifest
+            self._remove(active_tmp)
+            return 0
+        if os.path.exists(active_tmp):
+            # The active log was never replaced and still has every line
+            for month in self.pending["months"]:
+                self._remove(f"{self.segment_path(month)}.tmp")
+            self._remove(active_tmp)
+            self.pending = None
+            self.save_manifest()
+            return 0
+        moved = self.pending["moved"]
+        logger.info("Finishing an interrupted log segment roll")
+        self._commit_pending()
+        return moved
+
+    def _commit_pending(self):
+        """Move the pending segment temporaries into place and update the manifest."""
+        for month, entry in self.pending["months"].items():
+            self._commit_segment(month, entry["stats"], entry["base_size"])
+        self.pending = None
+        self.save_manifest()
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def iter_lines(self, start_date=None, end_date=None):
+        """
+        Iterate over lines of closed segments overlapping a date range.
+
+        Only segments whose time range overlaps the requested range are
+        opened.
+
+        Yields:
+            str: Log lines in segment and file order
+        """
+        for segment in self.segments:
+            first = (segment["first"] or "")[:10]
+            last = (segment["last"] or "9999-12-31")[:10]
+            if end_date is not None and first > end_date:
+                continue
+            if start_date is not None and last < start_date:
+                continue
+            with gzip.open(os.path.join(self.directory, segment["file"]), "rt", encoding="utf-8", errors="replace") as file:
+                for line in file:
+                    date = line_date(line)
+                    if date is not None:
+                        if start_date is not None and date < start_date:
+                            continue
+                        # Out-of-order rolls append later gzip members, so
+                        # a segment is not necessarily sorted
+                        if end_date is not None and date > end_date:
+                            continue
+                    yield line
+
+    def save_manifest(self):
+        """Persist the manifest atomically."""
+        tmp_path = f"{self.manifest_file}.tmp"
+        with open(tmp_path, "w") as file:
+            data = {"version": MANIFEST_VERSION, "segments": self.segments}
+            if self.pending is not None:
+                data["pending"] = self.pending
+            json.dump(data, file, indent=2)
+        os.replace(tmp_path, self.manifest_file)
+
+    def _commit_segment(self, month, stats, base_size):
+        """
+        Add a pending segment temporary to the segment for ``month``.
+
+        A missing temporary means it was already moved into place before a
+        crash; appending truncates back to ``base_size`` first, so repeating
+        the step never duplicates lines.
+        """
+        path = self.segment_path(month)
+        tmp_path = f"{path}.tmp"
+        existing = next((s for s in self.segments if s["month"] == month), None)
+        if os.path.exists(tmp_path):
+            if base_size is None:
+                os.replace(tmp_path, path)
+            else:
+                # A segment for this month already exists; gzip members concatenate
+                with open(path, "r+b") as dst, open(tmp_path, "rb") as src:
+                    dst.truncate(base_size)
+                    dst.seek(base_size)
+                    while True:
+                        chunk = src.read(1 << 20)
+                        if not chunk:
+                            break
+                        dst.write(chunk)
+                os.remove(tmp_path)
+        if existing is None:
+            self.segments.append({"month": month, "file": os.path.basename(path), **stats})
+            self.segments.sort(key=lambda s: s["month"])
+            return
+        existing["sessions"] += stats["sessions"]
+        existing["successes"] += stats["successes"]
+        if stats["first"] and (existing["first"] is None or stats["first"] < existing["first"]):
+            existing["first"] = stats["first"]
+        if stats["last"] and (existing["last"] is None or stats["last"] > existing["last"]):
+            existing["last"] = stats["last"]
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_file, "r") as file:
+                data = json.load(file)
+            if data.get("version") != MANIFEST_VERSION:
+                raise ValueError("unsupported manifest version")
+            self.pending = data.get("pending")
+            return data["segments"]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.error(f"Error reading segment manifest: {e}")
+            return []
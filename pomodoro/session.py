@@ -6,26 +6,120 @@ import datetime
 import os
 import logging
 
+from .log_writer import BufferedLogWriter
+from .records import KIND_EVENT, KIND_SESSION, SessionRecord, iter_records, line_date
+from .segments import LogSegments
+from .rollup import RollupCache, week_key
+from .session_index import DayOffsetIndex, ends_at_line_boundary
+
 logger = logging.getLogger(__name__)
 
 class SessionManager:
     """Manager for tracking and logging pomodoro sessions."""
     
-    def __init__(self, log_file=None):
+    def __init__(
+        self,
+        log_file=None,
+        db_file=None,
+        log_format="text",
+        flush_policy=None,
+        flush_interval=1.0,
+        fsync_policy="never",
+        segmented=False,
+        read_only=False,
+    ):
         """
         Initialize the session manager.
         
         Args:
             log_file: Path to the session log file (defaults to pomodoro_sessions.log in current directory)
+            db_file: Optional path to a SQLite session store. When given, sessions
+                and events are stored there instead of the text log, and an
+                existing text log is imported once.
+            log_format: Format for new text log entries, ``"text"`` for the
+                legacy one-line format or ``"jsonl"`` for JSON Lines records.
+                Both formats can always be read back.
+            flush_policy: If set, text log entries are written behind by a
+                background thread (see ``BufferedLogWriter``) using this flush
+                policy; if None, every entry is written synchronously.
+            flush_interval: Batch window in seconds for the ``"batch"`` policy
+            fsync_policy: When buffered entries are forced to disk
+            segmented: Roll finished months of the text log into compressed
+                segments tracked by a manifest (see ``LogSegments``)
+            read_only: Only read the history: nothing in the data directory
+                is created, imported, rolled or re-indexed, the session count
+                is not computed and logging is refused
         """
+        if log_format not in ("text", "jsonl"):
+            raise ValueError("log_format must be 'text' or 'jsonl'")
+        self.log_format = log_format
         self.log_file = log_file or "pomodoro_sessions.log"
+        self.read_only = read_only
         
         # Create directory for log file if it doesn't exist
         log_dir = os.path.dirname(self.log_file)
-        if log_dir and not os.path.exists(log_dir):
+        if log_dir and not read_only and not os.path.exists(log_dir):
             os.makedirs(log_dir, exist_ok=True)
-            
-        self.session_count = self._get_session_count()
+
+        self.store = None
+        self.index = None
+        self.writer = None
+        self.segments = None
+        self.rollup = None
+        if read_only and db_file and not os.path.exists(db_file):
+            # Nothing was imported yet, so the text log still holds the history
+            db_file = None
+        if db_file:
+            from .session_store import SqliteSessionStore
+
+            self.store = SqliteSessionStore(db_file, read_only=read_only)
+            if not read_only and os.path.exists(self.log_file) and not self.store.has_imported(self.log_file):
+                try:
+                    self.store.import_text_log(self.log_file)
+                except Exception as e:
+                    logger.error(f"Error importing session log: {e}")
+        else:
+            self._writer_options = {
+                "flush_policy": flush_policy,
+                "flush_interval": flush_interval,
+                "fsync_policy": fsync_policy,
+            }
+            self.rollup = RollupCache(self.log_file)
+            if segmented:
+                self.segments = LogSegments(self.log_file)
+                self._active_month = datetime.datetime.now().strftime("%Y-%m")
+                if not read_only:
+                    self._roll_segments()
+            self._open_text_log()
+
+        self.session_count = None if read_only else self._get_session_count()
+
+    @classmethod
+    def from_settings(cls, settings, data_dir, **overrides):
+        """
+        Create a session manager from the ``sessions`` configuration section.
+
+        Args:
+            settings: The ``sessions`` settings dictionary
+            data_dir: Directory holding the session log (and database)
+            **overrides: Constructor arguments taking precedence over settings
+
+        Returns:
+            SessionManager: The configured session manager
+        """
+        db_file = None
+        if settings.get("backend") == "sqlite":
+            db_file = os.path.join(data_dir, "pomodoro_sessions.db")
+        options = {
+            "db_file": db_file,
+            "log_format": settings.get("format", "text"),
+            "flush_policy": settings.get("flush_policy"),
+            "flush_interval": settings.get("flush_interval_seconds", 1.0),
+            "fsync_policy": settings.get("fsync_policy", "never"),
+            "segmented": settings.get("segmented", False),
+        }
+        options.update(overrides)
+        return cls(os.path.join(data_dir, "pomodoro_sessions.log"), **options)
 
     def _get_session_count(self):
         """
@@ -35,22 +129,34 @@ class SessionManager:
             int: Number of sessions found in the log file
         """
         try:
-            if not os.path.exists(self.log_file):
-                return 0
-                
-            with open(self.log_file, "r") as file:
-                return sum(1 for line in file if "Session" in line and "completed" in line)
+            if self.store is not None:
+                return self.store.session_count()
+
+            count = sum(1 for _ in iter_records(self._iter_active_lines(), KIND_SESSION))
+            if self.segments is not None:
+                count += self.segments.session_count()
+            return count
         except Exception as e:
             logger.error(f"Error reading session count: {e}")
             return 0
     
-    def log_session(self, focus_text="", success=True):
+    def log_session(
+        self,
+        focus_text="",
+        success=True,
+        planned_minutes=None,
+        actual_minutes=None,
+        status=None,
+    ):
         """
         Log a completed pomodoro session.
 
         Args:
             focus_text: Text describing what was focused on during the session
             success: Whether the session was completed successfully
+            planned_minutes: Planned focus duration in minutes
+            actual_minutes: Minutes actually spent before the session ended
+            status: Status override (defaults to "success" or "failed")
 
         Returns:
             int: Updated session count
@@ -58,14 +164,16 @@ class SessionManager:
         try:
             self.session_count += 1
             timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            with open(self.log_file, "a") as file:
-                log_entry = f"Session {self.session_count} completed at {timestamp}"
-                if focus_text:
-                    log_entry += f" - {focus_text}"
-                log_entry += " - success" if success else " - failed"
-                file.write(log_entry + "\n")
-                
+            record = SessionRecord(
+                KIND_SESSION,
+                timestamp,
+                self.session_count,
+                focus_text,
+                planned_minutes,
+                actual_minutes,
+                status or ("success" if success else "failed"),
+            )
+            self._write_record(record)
             logger.info(f"Logged session {self.session_count}")
             return self.session_count
         except Exception as e:
@@ -80,11 +188,184 @@ class SessionManager:
         """
         try:
             timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            with open(self.log_file, "a") as file:
-                file.write(f"Event at {timestamp} - {message}\n")
+            self._write_record(SessionRecord(KIND_EVENT, timestamp, focus_text=message))
         except Exception as e:
             logger.error(f"Error logging event: {e}")
 
+    def _write_record(self, record):
+        """Store a record in the configured backend."""
+        if self.read_only:
+            raise ValueError("session manager is read-only")
+        if self.store is not None:
+            self.store.add(record)
+            return
+        if self.segments is not None and record.date[:7] != self._active_month:
+            self._active_month = record.date[:7]
+            self._roll_segments()
+            self._open_text_log()
+        if self.log_format == "jsonl":
+            entry = record.to_json()
+        elif record.kind == KIND_SESSION:
+            entry = f"Session {record.number} completed at {record.timestamp}"
+            if record.focus_text:
+                entry += f" - {record.focus_text}"
+            entry += f" - {record.status}"
+        else:
+            entry = f"Event at {record.timestamp} - {record.focus_text}"
+        offset, end = self._append_line(entry, record.date)
+
+        # Keep a loaded rollup current in O(1); otherwise it catches up lazily
+        rollup = self.rollup
+        if rollup is not None and rollup.loaded and offset == rollup.size:
+            if record.kind == KIND_SESSION:
+                rollup.apply(record)
+            rollup.size = end
+            rollup.dirty = True
+
+    def _open_text_log(self):
+        """Load the day index and start the write-behind writer for the active log."""
+        self.index = DayOffsetIndex(self.log_file)
+        try:
+            # A read-only reader uses the index only if it is current
+            if not self.index.load(refresh=not self.read_only):
+                self.index = None
+        except Exception as e:
+            logger.error(f"Error loading session index: {e}")
+            self.index = None
+        if self._writer_options["flush_policy"] is not None and not self.read_only:
+            self.writer = BufferedLogWriter(self.log_file, **self._writer_options)
+            self._log_size = os.path.getsize(self.log_file)
+
+    def _roll_segments(self):
+        """Move finished months out of the active log into compressed segments."""
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        try:
+            moved = self.segments.roll(self._active_month)
+        except Exception as e:
+            logger.error(f"Error rolling session log segments: {e}")
+            moved = None
+        if moved != 0 and self.rollup is not None:
+            # The active log was (or may have been) rewritten under the rollup
+            self.rollup.invalidate()
+
+    def _append_line(self, entry, date):
+        """Append one line to the text log and keep the day index current."""
+        if self.writer is not None:
+            data = (entry + "\n").encode("utf-8")
+            offset = self._log_size
+            self._log_size += len(data)
+            self.writer.write(data)
+            end = self._log_size
+        else:
+            # Binary, like the writer path: UTF-8 whatever the locale, and
+            # tell() gives the byte offsets the day index stores
+            with open(self.log_file, "ab") as file:
+                offset = file.tell()
+                file.write((entry + "\n").encode("utf-8"))
+                end = file.tell()
+        if self.index is not None:
+            self.index.note_append(date, offset, end)
+        return offset, end
+
+    def _ensure_rollup(self):
+        """Validate the rollup cache against the log, catching up or rebuilding it."""
+        self.flush()
+        rollup = self.rollup
+        if not rollup.loaded:
+            rollup.load()
+        try:
+            stat = os.stat(self.log_file)
+            size, mtime = stat.st_size, stat.st_mtime
+        except FileNotFoundError:
+            size, mtime = 0, 0.0
+        if size == rollup.size and (rollup.dirty or mtime == rollup.mtime):
+            return
+
+        # Only trust the counters for the log's head if it is the same file
+        # with the same bytes up to the summarised offset
+        if rollup.size < size and rollup.matches(size) and ends_at_line_boundary(self.log_file, rollup.size):
+            records = iter_records(self._iter_active_tail(rollup.size), KIND_SESSION)
+        else:
+            rollup.clear()
+            records = self.iter_records(kind=KIND_SESSION)
+        for record in records:
+            rollup.apply(record)
+        rollup.size = size
+        rollup.dirty = True
+        rollup.save()
+
+    def _iter_active_tail(self, offset):
+        with open(self.log_file, "r", encoding="utf-8", errors="replace") as file:
+            file.seek(offset)
+            yield from file
+
+    def iter_lines(self, start_date=None, end_date=None):
+        """
+        Iterate over text log lines within a date range.
+
+        Closed segments are only opened when they overlap the range, and the
+        day index is used to seek straight to the first line of
+        ``start_date`` in the active log; reading stops at the first line
+        after ``end_date``.
+
+        Args:
+            start_date: First date to include (``YYYY-MM-DD``), or None
+            end_date: Last date to include (``YYYY-MM-DD``), or None
+
+        Yields:
+            str: Log lines in file order
+        """
+        self.flush()
+        if self.segments is not None:
+            yield from self.segments.iter_lines(start_date, end_date)
+        yield from self._iter_active_lines(start_date, end_date)
+
+    def _iter_active_lines(self, start_date=None, end_date=None):
+        if not os.path.exists(self.log_file):
+            return
+        offset = 0
+        if start_date is not None and self.index is not None:
+            offset = self.index.offset_for(start_date)
+            if offset is None:
+                return
+        with open(self.log_file, "r", encoding="utf-8", errors="replace") as file:
+            # Index offsets always point at line starts, where byte offsets
+            # are valid text-mode positions
+            file.seek(offset)
+            if start_date is None and end_date is None:
+                yield from file
+                return
+            for line in file:
+                date = line_date(line)
+                if date is not None:
+                    if end_date is not None and date > end_date:
+                        break
+                    if start_date is not None and date < start_date:
+                        continue
+                yield line
+
+    def iter_records(self, start_date=None, end_date=None, kind=None):
+        """
+        Iterate over parsed session and event records within a date range.
+
+        Works for both the SQLite store and the text log; text logs may mix
+        JSON Lines and legacy entries.
+
+        Args:
+            start_date: First date to include (``YYYY-MM-DD``), or None
+            end_date: Last date to include (``YYYY-MM-DD``), or None
+            kind: Only yield records of this kind, or None for all
+
+        Yields:
+            SessionRecord: Records in chronological order
+        """
+        if self.store is not None:
+            yield from self.store.iter_records(start_date, end_date, kind)
+        else:
+            yield from iter_records(self.iter_lines(start_date, end_date), kind)
+
     def get_session_count(self):
         """
         Get the current session count.
@@ -94,6 +375,24 @@ class SessionManager:
         """
         return self.session_count
 
+    def flush(self):
+        """Wait until all queued log entries have been written."""
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self):
+        """Flush pending entries and release resources held by the session manager."""
+        if self.writer is not None:
+            self.writer.close()
+        if self.store is not None:
+            self.store.close()
+        if self.read_only:
+            return
+        if self.index is not None:
+            self.index.save()
+        if self.rollup is not None and self.rollup.loaded:
+            self.rollup.save()
+
     def get_daily_stats(self):
         """
         Get statistics for sessions completed today.
@@ -102,22 +401,46 @@ class SessionManager:
             dict: Statistics including count and focus areas
         """
         today = datetime.datetime.now().strftime("%Y-%m-%d")
-        count = 0
-        focus_areas = set()
         
         try:
-            if not os.path.exists(self.log_file):
+            if self.store is not None:
+                return self.store.daily_stats(today)
+
+            self._ensure_rollup()
+            bucket = self.rollup.day(today)
+            if bucket is None:
                 return {"count": 0, "focus_areas": []}
-                
-            with open(self.log_file, "r") as file:
-                for line in file:
-                    if today in line and "Session" in line and "completed" in line:
-                        count += 1
-                        if " - " in line:
-                            focus = line.split(" - ", 1)[1].strip()
-                            focus_areas.add(focus)
-            
-            return {"count": count, "focus_areas": list(focus_areas)}
+            return {"count": bucket["count"], "focus_areas": list(bucket["focus_areas"])}
         except Exception as e:
             logger.error(f"Error getting daily stats: {e}")
             return {"count": 0, "focus_areas": []}
+
+    def get_weekly_stats(self):
+        """
+        Get statistics for sessions completed this ISO week.
+
+        Returns:
+            dict: Statistics including count and focus areas
+        """
+        today = datetime.datetime.now().strftime("%Y-%m-%d")
+
+        try:
+            if self.store is not None:
+                monday = datetime.date.fromisoformat(today)
+                monday -= datetime.timedelta(days=monday.weekday())
+                focus_areas = []
+                count = 0
+                for record in self.store.iter_records(monday.isoformat(), today, KIND_SESSION):
+                    count += 1
+                    if record.focus_text and record.focus_text not in focus_areas:
+                        focus_areas.append(record.focus_text)
+                return {"count": count, "focus_areas": focus_areas}
+
+            self._ensure_rollup()
+            bucket = self.rollup.week(week_key(today))
+            if bucket is None:
+                return {"count": 0, "focus_areas": []}
+            return {"count": bucket["count"], "focus_areas": list(bucket["focus_areas"])}
+        except Exception as e:
+            logger.error(f"Error getting weekly stats: {e}")
+            return {"count": 0, "focus_areas": []}
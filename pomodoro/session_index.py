@@ -0,0 +1,180 @@
+"""
+Sidecar day index for the plain-text sessions log.
+Maps each date to the byte offset of its first line so readers can seek
+straight to the region they need.
+"""
+import bisect
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+
+def _line_date(line):
+    """Return the ``YYYY-MM-DD`` date of a raw (bytes) log line, or None."""
+    if line.startswith(b"{"):
+        pos = line.find(b'"timestamp":"')
+        start = pos + 13
+    else:
+        pos = line.find(b" at ")
+        start = pos + 4
+    if pos < 0:
+        return None
+    date = line[start:start + 10]
+    if len(date) != 10 or date[4:5] != b"-" or date[7:8] != b"-":
+        return None
+    return date.decode("ascii", "replace")
+
+
+def ends_at_line_boundary(path, offset):
+    """Check whether ``offset`` in ``path`` is the start of a line."""
+    if offset == 0:
+        return True
+    with open(path, "rb") as file:
+        file.seek(offset - 1)
+        return file.read(1) == b"\n"
+
+
+class DayOffsetIndex:
+    """Byte-offset index of the first log line for every date."""
+
+    def __init__(self, log_file, index_file=None):
+        """
+        Initialize the index.
+
+        Args:
+            log_file: Path to the plain-text sessions log
+            index_file: Path to the sidecar file (defaults to ``<log_file>.idx``)
+        """
+        self.log_file = log_file
+        self.index_file = index_file or f"{log_file}.idx"
+        self.size = 0
+        self.mtime = 0.0
+        self.days = {}
+        self._dates = []
+
+    def load(self, refresh=True):
+        """
+        Load the sidecar index, refreshing it if it does not match the log.
+
+        A log that only grew since the index was written is caught up by
+        scanning the new tail; any other mismatch triggers a full rebuild.
+
+        Args:
+            refresh: Scan the log to repair a missing or stale index; when
+                False such an index is just reported as unusable
+
+        Returns:
+            bool: Whether the index matches the log
+        """
+        try:
+            stat = os.stat(self.log_file)
+        except FileNotFoundError:
+            self._reset()
+            return True
+
+        try:
+            with open(self.index_file, "r") as file:
+                data = json.load(file)
+            if data.get("version") != INDEX_VERSION:
+                raise ValueError("unsupported index version")
+            self.size = data["size"]
+            self.mtime = data["mtime"]
+            self.days = data["days"]
+            self._dates = sorted(self.days)
+        except FileNotFoundError:
+            if not refresh:
+                return False
+            self.rebuild()
+            return True
+        except Exception as e:
+            logger.warning(f"Discarding unreadable session index: {e}")
+            if not refresh:
+                return False
+            self.rebuild()
+            return True
+
+        if stat.st_size == self.size and stat.st_mtime == self.mtime:
+            return True
+        if not refresh:
+            return False
+        if stat.st_size > self.size and ends_at_line_boundary(self.log_file, self.size):
+            self._scan(self.size)
+        else:
+            self.rebuild()
+        return True
+
+    def rebuild(self):
+        """Rebuild the index with a single streaming pass over the log."""
+        self._reset()
+        if os.path.exists(self.log_file):
+            self._scan(0)
+
+    def note_append(self, date, offset, end):
+        """
+        Record an appended line.
+
+        Args:
+            date: Date of the appended line (``YYYY-MM-DD``)
+            offset: Byte offset the line was written at
+            end: Byte offset just after the line
+        """
+        if offset != self.size:
+            # Someone else wrote to the log; let the next load catch up
+            return
+        self.size = end
+        if date not in self.days:
+            self.days[date] = offset
+            bisect.insort(self._dates, date)
+            self.save()
+
+    def offset_for(self, date):
+        """
+        Return the offset of the first line dated on or after ``date``.
+
+        Returns:
+            int | None: Byte offset, or None if no such line exists
+        """
+        pos = bisect.bisect_left(self._dates, date)
+        if pos == len(self._dates):
+            return None
+        return self.days[self._dates[pos]]
+
+    def save(self):
+        """Persist the index atomically next to the log."""
+        if not os.path.exists(self.log_file):
+            return
+        try:
+            self.mtime = os.stat(self.log_file).st_mtime
+            tmp_path = f"{self.index_file}.tmp"
+            with open(tmp_path, "w") as file:
+                json.dump(
+                    {"version": INDEX_VERSION, "size": self.size, "mtime": self.mtime, "days": self.days},
+                    file,
+                )
+            os.replace(tmp_path, self.index_file)
+        except Exception as e:
+            logger.error(f"Error saving session index: {e}")
+
+    def _reset(self):
+        self.size = 0
+        self.mtime = 0.0
+        self.days = {}
+        self._dates = []
+
+    def _scan(self, offset):
+        last_date = self._dates[-1] if self._dates else None
+        with open(self.log_file, "rb") as file:
+            file.seek(offset)
+            for line in file:
+                date = _line_date(line)
+                if date is not None and date != last_date and date not in self.days:
+                    self.days[date] = offset
+                    last_date = date
+                offset += len(line)
+        self.size = offset
+        self._dates = sorted(self.days)
+        self.save()
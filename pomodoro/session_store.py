@@ -0,0 +1,189 @@
+"""
+SQLite-backed session store for the Pomodoro Timer application.
+Keeps sessions and events in an indexed table so counts and daily
+statistics do not require scanning the whole history.
+"""
+import datetime
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+
+from .records import SessionRecord, parse_line
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    number INTEGER,
+    focus_text TEXT,
+    planned_minutes INTEGER,
+    actual_minutes INTEGER,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_kind_ts ON entries (kind, ts);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_INSERT = (
+    "INSERT INTO entries (kind, ts, number, focus_text, planned_minutes, actual_minutes, status) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Rows are inserted in batches while importing so memory stays flat
+_IMPORT_BATCH = 5000
+
+
+def _row(record):
+    return (
+        record.kind,
+        record.timestamp,
+        record.number,
+        record.focus_text,
+        record.planned_minutes,
+        record.actual_minutes,
+        record.status,
+    )
+
+
+class SqliteSessionStore:
+    """Indexed storage for completed sessions and events."""
+
+    def __init__(self, db_file, read_only=False):
+        """
+        Open (and create if needed) the session database.
+
+        Args:
+            db_file: Path to the SQLite database file
+            read_only: Open an existing database for reading only
+        """
+        self.db_file = db_file
+        if read_only:
+            self._conn = sqlite3.connect(f"{pathlib.Path(db_file).absolute().as_uri()}?mode=ro", uri=True)
+            return
+        db_dir = os.path.dirname(db_file)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._conn = sqlite3.connect(db_file)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def add(self, record):
+        """Insert a session or event record."""
+        with self._conn:
+            self._conn.execute(_INSERT, _row(record))
+
+    def session_count(self):
+        """Return the number of completed sessions."""
+        row = self._conn.execute(
+            "SELECT COUNT(*) FROM entries WHERE kind = 'session'"
+        ).fetchone()
+        return row[0]
+
+    def daily_stats(self, date):
+        """
+        Return session statistics for a single day.
+
+        Args:
+            date: Date string in ``YYYY-MM-DD`` format
+
+        Returns:
+            dict: Statistics including count and focus areas
+        """
+        start = f"{date} 00:00:00"
+        end = (datetime.date.fromisoformat(date) + datetime.timedelta(days=1)).isoformat()
+        count, areas = self._conn.execute(
+            "SELECT COUNT(*), json_group_array(DISTINCT focus_text) FROM entries "
+            "WHERE kind = 'session' AND ts >= ? AND ts < ?",
+            (start, end),
+        ).fetchone()
+        focus_areas = [area for area in json.loads(areas) if area]
+        return {"count": count, "focus_areas": focus_areas}
+
+    def iter_records(self, start_date=None, end_date=None, kind=None):
+        """
+        Iterate over stored records in timestamp order.
+
+        Args:
+            start_date: First date to include (``YYYY-MM-DD``), or None
+            end_date: Last date to include (``YYYY-MM-DD``), or None
+            kind: Only yield records of this kind, or None for all
+
+        Yields:
+            SessionRecord: Stored sessions and events
+        """
+        low = start_date or ""
+        high = (end_date or "9999-12-31") + "~"
+        query = (
+            "SELECT kind, ts, number, focus_text, planned_minutes, actual_minutes, status "
+            "FROM entries WHERE ts >= ? AND ts < ?"
+        )
+        params = [low, high]
+        if kind is not None:
+            query += " AND kind = ?"
+            params.append(kind)
+        cursor = self._conn.execute(query + " ORDER BY ts, id", params)
+        for row in cursor:
+            yield SessionRecord(*row)
+
+    def has_imported(self, log_file):
+        """Check whether a text log was already imported."""
+        row = self._conn.execute(
+            "SELECT 1 FROM meta WHERE key = ?", (f"imported:{os.path.abspath(log_file)}",)
+        ).fetchone()
+        return row is not None
+
+    def import_text_log(self, log_file):
+        """
+        Import an existing plain-text sessions log.
+
+        The file is streamed line by line and inserted in batches, so the
+        import runs in constant memory regardless of the log size. A log is
+        only ever imported once per database.
+
+        Args:
+            log_file: Path to the plain-text sessions log
+
+        Returns:
+            int: Number of imported entries
+        """
+        if self.has_imported(log_file):
+            return 0
+
+        imported = 0
+        with self._conn, open(log_file, "r", encoding="utf-8", errors="replace") as file:
+            batch = []
+            for line in file:
+                record = parse_line(line)
+                if record is None:
+                    continue
+                batch.append(_row(record))
+                if len(batch) >= _IMPORT_BATCH:
+                    self._insert_rows(batch)
+                    imported += len(batch)
+                    batch = []
+            if batch:
+                self._insert_rows(batch)
+                imported += len(batch)
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                (f"imported:{os.path.abspath(log_file)}", str(imported)),
+            )
+        logger.info(f"Imported {imported} entries from {log_file}")
+        return imported
+
+    def _insert_rows(self, rows):
+        self._conn.executemany(_INSERT, rows)
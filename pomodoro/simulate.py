@@ -0,0 +1,341 @@
+"""
+Virtual-time simulation for the Pomodoro Timer application.
+Drives the timer engine (or the full window under the Qt offscreen platform)
+through many focus/rest/pause/exit cycles on a virtual clock, and measures
+how long the session log, the Obsidian notes and the sound triggers take.
+"""
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+
+from .engine import TimerEngine
+
+logger = logging.getLogger(__name__)
+
+# Sink methods whose latency is measured, by sink name
+TIMED_METHODS = {
+    "session": ("log_session", "log_event"),
+    "notes": ("record_pomodoro_session",),
+    "sound": ("play_focus_end", "play_rest_end"),
+}
+
+
+class VirtualClock:
+    """A monotonic clock that only moves when advanced."""
+
+    def __init__(self, start=0.0):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial reading in seconds
+        """
+        self.now = float(start)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        """Move the clock forward by ``seconds``."""
+        self.now += max(0.0, seconds)
+
+
+class TimedSink:
+    """Proxy that times calls to selected methods of a sink.
+
+    Every other attribute is passed through to the wrapped object, so the
+    proxy can stand in for the sink anywhere.
+    """
+
+    def __init__(self, target, name, methods, latencies):
+        """
+        Wrap a sink.
+
+        Args:
+            target: The sink to wrap
+            name: Prefix for the recorded measurement names
+            methods: Method names to time
+            latencies: Dict of measurement name to a list of seconds, filled in place
+        """
+        self._target = target
+        for method in methods:
+            samples = latencies.setdefault(f"{name}.{method}", [])
+            setattr(self, method, self._timed(getattr(target, method), samples))
+
+    @staticmethod
+    def _timed(func, samples):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                samples.append(time.perf_counter() - start)
+
+        return wrapper
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+def _percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize_latencies(samples):
+    """
+    Summarize latency samples.
+
+    Args:
+        samples: Durations in seconds
+
+    Returns:
+        dict: ``calls``, ``total_ms`` and ``mean``/``p50``/``p95``/``p99``/``max`` in microseconds
+    """
+    if not samples:
+        return {"calls": 0, "total_ms": 0.0}
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "calls": len(ordered),
+        "total_ms": round(total * 1e3, 3),
+        "mean_us": round(total / len(ordered) * 1e6, 1),
+        "p50_us": round(_percentile(ordered, 0.50) * 1e6, 1),
+        "p95_us": round(_percentile(ordered, 0.95) * 1e6, 1),
+        "p99_us": round(_percentile(ordered, 0.99) * 1e6, 1),
+        "max_us": round(ordered[-1] * 1e6, 1),
+    }
+
+
+class Simulation:
+    """Run timer cycles on a virtual clock against real sinks.
+
+    Every cycle starts a focus session. Every ``pause_every``-th focus is
+    paused halfway for a minute, every ``abandon_every``-th one is stopped
+    early, and the rest run into a full rest period. Every
+    ``exit_every``-th cycle also records an application exit.
+    """
+
+    def __init__(self, engine, clock, tick=None, pause_every=3, abandon_every=7, exit_every=50, seed=0):
+        """
+        Initialize the simulation.
+
+        Args:
+            engine: Timer engine using ``clock``
+            clock: The engine's virtual clock
+            tick: Callable handling a wakeup (defaults to ``engine.update``;
+                the window's ``update_timer`` in Qt mode)
+            pause_every: Pause every n-th focus session (0 to never pause)
+            abandon_every: Stop every n-th focus session early (0 to never)
+            exit_every: Record an application exit every n-th cycle (0 to never)
+            seed: Seed for the answers to "was the session successful?"
+        """
+        self.engine = engine
+        self.clock = clock
+        self.tick = tick or engine.update
+        self.pause_every = pause_every
+        self.abandon_every = abandon_every
+        self.exit_every = exit_every
+        self._rng = random.Random(seed)
+        self.wakeups = 0
+        engine.ask_success = self._answer
+
+    def _answer(self):
+        return self._rng.random() < 0.8
+
+    def _every(self, n, cycle):
+        return n > 0 and cycle % n == 0
+
+    def _run_for(self, seconds):
+        """Advance the clock by ``seconds`` at the engine's own wakeups."""
+        end = self.clock.now + seconds
+        while self.engine.running:
+            delay = self.engine.next_wakeup(visible=False)
+            if self.clock.now + delay > end:
+                break
+            self.clock.advance(delay)
+            self.wakeups += 1
+            self.tick()
+        self.clock.now = max(self.clock.now, end)
+
+    def _run_until_idle(self):
+        while self.engine.running:
+            self.clock.advance(self.engine.next_wakeup(visible=False))
+            self.wakeups += 1
+            self.tick()
+
+    def run_cycle(self, cycle):
+        """Run one focus (and usually rest) cycle."""
+        engine = self.engine
+        engine.start_focus(f"Simulated task {cycle}", engine.pomodoro_time // 60, engine.rest_time // 60)
+        if self._every(self.pause_every, cycle):
+            self._run_for(engine.time_left / 2)
+            engine.pause()
+            self.clock.advance(60)
+            engine.pause()
+        if self._every(self.abandon_every, cycle):
+            self._run_for(engine.time_left / 2)
+            engine.reset()
+        else:
+            self._run_until_idle()
+        if self._every(self.exit_every, cycle):
+            engine.record_exit()
+
+    def run(self, cycles):
+        """Run ``cycles`` cycles."""
+        for cycle in range(1, cycles + 1):
+            self.run_cycle(cycle)
+
+
+def _make_config(data_dir, sound_backend):
+    from .config import Config
+
+    config = Config(os.path.join(data_dir, "config.json"), environ={})
+    config.set_values("sounds", {"backend": sound_backend})
+    vault_path = os.path.join(data_dir, "vault")
+    os.makedirs(vault_path, exist_ok=True)
+    config.set_values("obsidian", {"enabled": True, "vault_path": vault_path})
+    return config
+
+
+def run_simulation(
+    cycles=1000,
+    data_dir=None,
+    sound_backend="null",
+    qt=False,
+    seed=0,
+    pause_every=3,
+    abandon_every=7,
+    exit_every=50,
+):
+    """
+    Simulate timer cycles and measure the downstream sinks.
+
+    The session log, the Obsidian notes (written to a vault folder inside
+    ``data_dir``) and the sound manager are the real implementations,
+    configured from a fresh configuration in ``data_dir``.
+
+    Args:
+        cycles: Number of focus cycles to run
+        data_dir: Directory for the configuration, session log and vault
+            (a temporary directory when None)
+        sound_backend: Audio backend for the sound manager
+        qt: Drive the full ``PomodoroTimer`` window on the Qt offscreen platform
+        seed: Seed for the simulated session outcomes
+        pause_every: Pause every n-th focus session
+        abandon_every: Stop every n-th focus session early
+        exit_every: Record an application exit every n-th cycle
+
+    Returns:
+        dict: Simulation report (see ``format_report``)
+    """
+    if data_dir is None:
+        with tempfile.TemporaryDirectory(prefix="pomodoro-simulate-") as tmp:
+            return run_simulation(cycles, tmp, sound_backend, qt, seed, pause_every, abandon_every, exit_every)
+
+    from .notes import NotesManager
+    from .session import SessionManager
+    from .sound import SoundManager
+
+    config = _make_config(data_dir, sound_backend)
+    latencies = {}
+    sound_manager = SoundManager(config)
+    notes_manager = NotesManager(config)
+    session_manager = SessionManager.from_settings(config.get_session_settings(), data_dir)
+    sinks = {
+        "session": session_manager,
+        "notes": notes_manager,
+        "sound": sound_manager,
+    }
+    timed = {name: TimedSink(sink, name, TIMED_METHODS[name], latencies) for name, sink in sinks.items()}
+    sound_manager.start()
+
+    clock = VirtualClock()
+    window = app = None
+    if qt:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+
+        from .ui.main_window import PomodoroTimer
+
+        app = QApplication.instance() or QApplication([])
+        window = PomodoroTimer(config, timed["sound"], timed["notes"], timed["session"], clock=clock)
+        engine = window.engine
+        tick = window.update_timer
+    else:
+        engine = TimerEngine(config, timed["sound"], timed["notes"], timed["session"], clock=clock)
+        tick = engine.update
+    simulation = Simulation(engine, clock, tick, pause_every, abandon_every, exit_every, seed)
+
+    start = time.perf_counter()
+    simulation.run(cycles)
+    wall = time.perf_counter() - start
+
+    shutdown = {}
+    if window is not None:
+        window.timer.stop()
+        window.deleteLater()
+        app.processEvents()
+    for name, close in (
+        ("sound", sound_manager.close),
+        ("notes", notes_manager.close),
+        ("session", session_manager.close),
+        ("config", config.flush),
+    ):
+        began = time.perf_counter()
+        close()
+        shutdown[name] = round((time.perf_counter() - began) * 1e3, 3)
+
+    calls = sum(len(samples) for samples in latencies.values())
+    return {
+        "mode": "qt" if qt else "engine",
+        "cycles": cycles,
+        "wakeups": simulation.wakeups,
+        "wall_seconds": round(wall, 3),
+        "virtual_hours": round(clock.now / 3600, 1),
+        "speedup": round(clock.now / wall) if wall else None,
+        "cycles_per_second": round(cycles / wall, 1) if wall else None,
+        "sink_calls_per_second": round(calls / wall, 1) if wall else None,
+        "sound_backend": sound_manager.backend_name,
+        "notes": notes_manager.get_dispatch_stats(),
+        "sinks": {name: summarize_latencies(samples) for name, samples in sorted(latencies.items())},
+        "shutdown_ms": shutdown,
+    }
+
+
+def format_report(report, output_format="table"):
+    """
+    Render a simulation report.
+
+    Args:
+        report: Report returned by ``run_simulation``
+        output_format: ``"table"`` or ``"json"``
+
+    Returns:
+        str: The rendered report
+    """
+    if output_format == "json":
+        return json.dumps(report, indent=2)
+    lines = [
+        f"Simulated {report['cycles']} cycles ({report['virtual_hours']} h) in "
+        f"{report['wall_seconds']} s [{report['mode']}, sound: {report['sound_backend']}]",
+        f"{report['cycles_per_second']} cycles/s, {report['sink_calls_per_second']} sink calls/s, "
+        f"{report['wakeups']} wakeups, {report['speedup']}x real time",
+        "",
+        f"{'Sink':<32} {'calls':>7} {'mean us':>9} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9} {'max us':>9}",
+    ]
+    for name, stats in report["sinks"].items():
+        if not stats["calls"]:
+            lines.append(f"{name:<32} {0:>7}")
+            continue
+        lines.append(
+            f"{name:<32} {stats['calls']:>7} {stats['mean_us']:>9} {stats['p50_us']:>9} "
+            f"{stats['p95_us']:>9} {stats['p99_us']:>9} {stats['max_us']:>9}"
+        )
+    lines.append("")
+    lines.append("Shutdown: " + ", ".join(f"{name} {ms} ms" for name, ms in report["shutdown_ms"].items()))
+    return "\n".join(lines)
@@ -4,62 +4,190 @@ Handles loading and playing sound files with volume control.
 """
 import os
 import logging
+import queue
+import threading
 
-# Suppress the default pygame support message
-os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
-
-import pygame
 from .utils import get_resource_path
 
 logger = logging.getLogger(__name__)
 
 class SoundManager:
-    """Manager for playing application sounds with volume control."""
+    """Manager for playing application sounds with volume control.
+
+    All audio work happens on a dedicated worker thread. The audio backend
+    (see ``audio_backends``) is only chosen and opened when the worker
+    starts, so a slow audio device never delays the first paint, and play
+    requests are queued so the UI thread never waits on audio. Alert sounds
+    are prepared once per file and volume, e.g. decoded into in-memory
+    buffers by the pygame backend. If no audio device is available, playing
+    a sound does nothing.
+    """
 
-    def __init__(self, config):
-        """Initialize the sound manager."""
+    def __init__(self, config, headless=False):
+        """Initialize the sound manager without touching the audio device.
+
+        Args:
+            config: Application configuration
+            headless: Whether the timer runs without a window, which keeps
+                the ``"auto"`` backend away from pygame
+        """
         self.config = config
-        self._init_mixer()
+        self.headless = headless
+        self._cache = {}
+        self._backend = None
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        config.add_listener(self._on_config_changed)
+
+    @property
+    def backend_name(self):
+        """Name of the opened audio backend, or None before the worker opened one."""
+        return self._backend.name if self._backend is not None else None
+
+    def start(self):
+        """
+        Start the audio worker if it is not running yet.
+
+        The worker opens the audio backend and prepares the configured sounds
+        before serving queued play requests.
+
+        Returns:
+            threading.Thread: The worker thread
+        """
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="pomodoro-audio", daemon=True)
+                self._thread.start()
+            return self._thread
+
+    def close(self, timeout=1.0):
+        """Stop the audio worker, waiting at most ``timeout`` seconds."""
+        with self._thread_lock:
+            thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+
+    def _submit(self, command):
+        self.start()
+        self._queue.put(command)
+
+    def _run(self):
+        """Worker loop: open the backend, warm the cache, then serve commands."""
+        available = self._init_backend()
+        if available:
+            self.warm_cache()
+        while True:
+            command = self._queue.get()
+            if command is None:
+                break
+            if not available:
+                continue
+            action, *args = command
+            try:
+                if action == "play":
+                    self._play_sound(*args)
+                elif action == "warm":
+                    self.warm_cache()
+            except Exception as e:
+                logger.error(f"Error in audio worker: {e}")
+        if self._backend is not None:
+            try:
+                self._backend.close()
+            except Exception as e:
+                logger.error(f"Error closing audio backend: {e}")
+
+    def _init_backend(self):
+        """
+        Open the configured audio backend.
+
+        Returns:
+            bool: True if a backend that can actually play sound was opened
+        """
+        from .audio_backends import NullBackend, open_backend
 
-    def _init_mixer(self):
-        """Initialize the pygame mixer."""
         try:
-            pygame.mixer.init()
-            logger.info("Sound system initialized successfully")
+            self._backend = open_backend(self.config.get_sound_backend(), self.headless)
         except Exception as e:
             logger.error(f"Failed to initialize sound system: {e}")
+            self._backend = NullBackend()
+        if isinstance(self._backend, NullBackend):
+            logger.warning("No audio output available, sounds are disabled")
+            return False
+        return True
+
+    def _on_config_changed(self, section):
+        """Refresh prepared sounds when sound settings change."""
+        if section == "sounds" and self._thread is not None:
+            self._queue.put(("warm",))
+
+    def warm_cache(self):
+        """Prepare the configured focus-end and rest-end sounds."""
+        for sound_file, volume in (
+            (self.config.get_focus_sound(), self.config.get_focus_volume()),
+            (self.config.get_rest_sound(), self.config.get_rest_volume()),
+        ):
+            self._get_sound(sound_file, volume)
 
     def play_focus_end(self):
-        """Play the focus end sound."""
-        sound_file = self.config.get_focus_sound()
-        volume = self.config.get_focus_volume()
-        self._play_sound(sound_file, volume)
+        """Queue the focus end sound."""
+        self._submit(("play", self.config.get_focus_sound(), self.config.get_focus_volume()))
 
     def play_rest_end(self):
-        """Play the rest end sound."""
-        sound_file = self.config.get_rest_sound()
-        volume = self.config.get_rest_volume()
-        self._play_sound(sound_file, volume)
-        
+        """Queue the rest end sound."""
+        self._submit(("play", self.config.get_rest_sound(), self.config.get_rest_volume()))
+
+    def _get_sound(self, sound_file, volume):
+        """
+        Return a prepared sound handle for a file and volume, loading it if needed.
+
+        Handles are cached by (path, mtime, volume) so an edited file or a
+        volume change is picked up automatically.
+
+        Returns:
+            object | None: The backend's sound handle, or None if unavailable
+        """
+        if self._backend is None:
+            return None
+        actual_sound_file = get_resource_path(sound_file)
+        try:
+            mtime = os.path.getmtime(actual_sound_file)
+        except OSError:
+            logger.warning(f"Sound file not found: {sound_file} (tried: {actual_sound_file})")
+            return None
+
+        key = (actual_sound_file, mtime, volume)
+        sound = self._cache.get(key)
+        if sound is not None:
+            return sound
+
+        try:
+            sound = self._backend.load(actual_sound_file, volume)
+        except Exception as e:
+            logger.error(f"Error loading sound {actual_sound_file}: {e}")
+            return None
+        if sound is None:
+            return None
+        # Drop stale entries for the same file
+        for stale in [k for k in self._cache if k[0] == actual_sound_file]:
+            del self._cache[stale]
+        self._cache[key] = sound
+        return sound
+
     def _play_sound(self, sound_file, volume):
         """
-        Play a sound file with the specified volume.
-        
+        Play a sound file with the specified volume on the calling thread.
+
         Args:
             sound_file: Path to the sound file
             volume: Volume level (0.0 to 1.0)
         """
         try:
-            # Try to get a valid resource path for the sound file
-            actual_sound_file = get_resource_path(sound_file)
-            
-            if not os.path.exists(actual_sound_file):
-                logger.warning(f"Sound file not found: {sound_file} (tried: {actual_sound_file})")
-                return
-                
-            pygame.mixer.music.load(actual_sound_file)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play()
-            logger.debug(f"Playing sound: {actual_sound_file} at volume: {volume}")
+            sound = self._get_sound(sound_file, volume)
+            if sound is not None:
+                self._backend.play(sound)
+                logger.debug(f"Playing sound: {sound_file} at volume: {volume}")
         except Exception as e:
             logger.error(f"Error playing sound {sound_file}: {e}")
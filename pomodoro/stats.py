@@ -0,0 +1,182 @@
+"""
+Session statistics for the Pomodoro Timer application.
+Aggregates session records in a single streaming pass with bounded memory.
+"""
+import datetime
+import json
+
+PERIODS = ("day", "week", "month")
+
+
+class StatsAggregator:
+    """Streaming aggregation of completed session records."""
+
+    def __init__(self, period="day", limit=7):
+        """
+        Initialize the aggregator.
+
+        Args:
+            period: Granularity of the per-period totals (``day``, ``week`` or ``month``)
+            limit: Number of most recent periods to keep, or None for all
+        """
+        if period not in PERIODS:
+            raise ValueError(f"period must be one of {PERIODS}")
+        self.period = period
+        self.limit = limit
+        self.sessions = 0
+        self.successes = 0
+        self.focus_minutes = 0
+        self.timed_sessions = 0
+        self.hours = [0] * 24
+        self.periods = {}
+        self.longest_streak = (0, None, None)
+        self._streak_start = None
+        self._streak_day = None
+        self._date = None
+        self._key = None
+        self._bucket = None
+
+    def add(self, record):
+        """Fold one session record into the totals."""
+        date = record.date
+        if date != self._date:
+            self._date = date
+            key = self._period_key(date)
+            if key != self._key:
+                self._key = key
+                self._bucket = self.periods.get(key)
+                if self._bucket is None:
+                    self._bucket = self.periods[key] = [0, 0, 0, 0]
+                    if self.limit is not None and len(self.periods) > self.limit:
+                        del self.periods[next(iter(self.periods))]
+
+        minutes = record.actual_minutes if record.actual_minutes is not None else record.planned_minutes
+        bucket = self._bucket
+        bucket[0] += 1
+        self.sessions += 1
+        # Legacy text log lines do not record minutes at all
+        if minutes is not None:
+            bucket[2] += minutes
+            bucket[3] += 1
+            self.focus_minutes += minutes
+            self.timed_sessions += 1
+        self.hours[int(record.timestamp[11:13])] += 1
+
+        if record.status == "success":
+            bucket[1] += 1
+            self.successes += 1
+            if date != self._streak_day:
+                self._extend_streak(date)
+
+    def result(self):
+        """
+        Return the aggregated statistics.
+
+        Returns:
+            dict: Totals, success rate, focus minutes, longest streak,
+            busiest hours and per-period totals. Focus minutes are None
+            when none of the sessions recorded their duration, and
+            ``sessions_with_minutes`` tells how many did.
+        """
+        days, start, end = self.longest_streak
+        busiest = sorted(range(24), key=lambda hour: (-self.hours[hour], hour))[:3]
+        return {
+            "sessions": self.sessions,
+            "successes": self.successes,
+            "failures": self.sessions - self.successes,
+            "success_rate": round(self.successes / self.sessions, 4) if self.sessions else 0.0,
+            "focus_minutes": self.focus_minutes if self.timed_sessions or not self.sessions else None,
+            "sessions_with_minutes": self.timed_sessions,
+            "longest_streak": {"days": days, "start": start, "end": end},
+            "busiest_hours": [
+                {"hour": hour, "sessions": self.hours[hour]} for hour in busiest if self.hours[hour]
+            ],
+            "period": self.period,
+            "periods": [
+                {"period": key, "sessions": total, "successes": ok, "focus_minutes": minutes if timed else None}
+                for key, (total, ok, minutes, timed) in self.periods.items()
+            ],
+        }
+
+    def _period_key(self, date):
+        if self.period == "day":
+            return date
+        if self.period == "month":
+            return date[:7]
+        year, week, _ = datetime.date.fromisoformat(date).isocalendar()
+        return f"{year}-W{week:02d}"
+
+    def _extend_streak(self, date):
+        day = datetime.date.fromisoformat(date)
+        previous = self._streak_day
+        if previous is not None and datetime.date.fromisoformat(previous) + datetime.timedelta(days=1) == day:
+            length = (day - datetime.date.fromisoformat(self._streak_start)).days + 1
+        else:
+            self._streak_start = date
+            length = 1
+        self._streak_day = date
+        if length > self.longest_streak[0]:
+            self.longest_streak = (length, self._streak_start, date)
+
+
+def compute_stats(records, period="day", limit=7):
+    """
+    Aggregate session records.
+
+    Args:
+        records: Iterable of session records in chronological order
+        period: Granularity of the per-period totals
+        limit: Number of most recent periods to report, or None for all
+
+    Returns:
+        dict: See ``StatsAggregator.result``
+    """
+    aggregator = StatsAggregator(period, limit)
+    add = aggregator.add
+    for record in records:
+        add(record)
+    return aggregator.result()
+
+
+def _or_dash(value):
+    return "-" if value is None else value
+
+
+def _format_minutes(stats):
+    if stats["focus_minutes"] is None:
+        return "n/a (not recorded by the text log format, see sessions.format)"
+    if stats["sessions_with_minutes"] < stats["sessions"]:
+        return f"{stats['focus_minutes']} (from {stats['sessions_with_minutes']} of {stats['sessions']} sessions)"
+    return str(stats["focus_minutes"])
+
+
+def format_table(stats):
+    """Render statistics as a plain-text table."""
+    streak = stats["longest_streak"]
+    lines = [
+        f"Sessions        {stats['sessions']}",
+        f"Successful      {stats['successes']} ({stats['success_rate'] * 100:.1f}%)",
+        f"Failed          {stats['failures']}",
+        f"Focus minutes   {_format_minutes(stats)}",
+    ]
+    if streak["days"]:
+        lines.append(f"Longest streak  {streak['days']} day(s) ({streak['start']} to {streak['end']})")
+    else:
+        lines.append("Longest streak  0 days")
+    if stats["busiest_hours"]:
+        hours = ", ".join(f"{h['hour']:02d}:00 ({h['sessions']})" for h in stats["busiest_hours"])
+        lines.append(f"Busiest hours   {hours}")
+
+    if stats["periods"]:
+        lines.append("")
+        lines.append(f"{stats['period'].capitalize():<12}{'Sessions':>10}{'Success':>10}{'Minutes':>10}")
+        for row in stats["periods"]:
+            lines.append(
+                f"{row['period']:<12}{row['sessions']:>10}{row['successes']:>10}{_or_dash(row['focus_minutes']):>10}"
+            )
+    return "\n".join(lines)
+
+
+def format_json(stats):
+    """Render statistics as JSON."""
+    return json.dumps(stats, indent=2)
@@ -115,6 +115,10 @@ class PomodoroConfigDialog(QDialog):
         # Sessions notes path
         self.sessions_path_edit = QLineEdit(obsidian_settings.get("sessions_notes_path", ""))
         notes_layout.addRow("Sessions notes path:", self.sessions_path_edit)
+        # Local vault folder for direct session writes
+        self.vault_path_edit = QLineEdit(obsidian_settings.get("vault_path", ""))
+        self.vault_path_edit.setPlaceholderText("Optional: write sessions directly to this folder")
+        notes_layout.addRow("Vault folder:", self.vault_path_edit)
         self.notes_tab.setLayout(notes_layout)
 
     def accept(self):
@@ -137,6 +141,7 @@ class PomodoroConfigDialog(QDialog):
             daily_path=self.daily_path_edit.text(),
             weekly_path=self.weekly_path_edit.text(),
             sessions_path=self.sessions_path_edit.text(),
+            vault_path=self.vault_path_edit.text(),
         )
         
         # End batch mode and save all changes at once
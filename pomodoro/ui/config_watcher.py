@@ -0,0 +1,57 @@
+"""
+Configuration file watcher for the Pomodoro Timer application.
+"""
+import logging
+import os
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigWatcher(QObject):
+    """Reload the configuration when ``config.json`` changes on disk.
+
+    Change notifications are debounced, and ``Config.reload`` skips the
+    read when the file's mtime and size did not change, so bursts of
+    events and the application's own saves cost almost nothing.
+    """
+
+    def __init__(self, config, parent=None, delay_ms=200):
+        """
+        Start watching the configuration file.
+
+        Args:
+            config: Application configuration
+            parent: Owning QObject
+            delay_ms: Debounce delay before reloading
+        """
+        super().__init__(parent)
+        self.config = config
+        self._watcher = QFileSystemWatcher(self)
+        # Watch the directory too: editors and atomic saves replace the file,
+        # which drops the file watch
+        self._watcher.addPath(os.path.dirname(os.path.abspath(config.config_path)))
+        self._watch_file()
+        self._watcher.fileChanged.connect(self._schedule_reload)
+        self._watcher.directoryChanged.connect(self._schedule_reload)
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(delay_ms)
+        self._reload_timer.timeout.connect(self._reload)
+
+    def _watch_file(self):
+        path = self.config.config_path
+        if os.path.exists(path) and path not in self._watcher.files():
+            self._watcher.addPath(path)
+
+    def _schedule_reload(self, _path=None):
+        self._reload_timer.start()
+
+    def _reload(self):
+        self._watch_file()
+        try:
+            self.config.reload()
+        except Exception as e:
+            logger.error(f"Error applying configuration changes: {e}")
@@ -0,0 +1,60 @@
+"""
+Qt event loop integration for the control socket.
+"""
+import logging
+
+from PyQt6.QtCore import QObject, QSocketNotifier
+
+logger = logging.getLogger(__name__)
+
+
+class ControlNotifier(QObject):
+    """Serve a ``ControlServer`` from the Qt event loop.
+
+    The listening socket and each client connection get a read
+    ``QSocketNotifier``, so commands are handled on the UI thread between
+    events and never block it.
+    """
+
+    def __init__(self, server, parent=None):
+        """
+        Start serving.
+
+        Args:
+            server: A listening ``pomodoro.control.ControlServer``
+            parent: Owning QObject
+        """
+        super().__init__(parent)
+        self.server = server
+        self._connections = {}
+        self._listener = QSocketNotifier(server.fileno(), QSocketNotifier.Type.Read, self)
+        self._listener.activated.connect(self._accept)
+
+    def _accept(self, *_):
+        conn = self.server.accept()
+        if conn is None:
+            return
+        notifier = QSocketNotifier(conn.fileno(), QSocketNotifier.Type.Read, self)
+        notifier.activated.connect(lambda *_: self._read(conn))
+        self._connections[conn] = notifier
+
+    def _read(self, conn):
+        notifier = self._connections.get(conn)
+        if notifier is None:
+            return
+        # Disable before the server closes the socket so the notifier never
+        # watches a reused file descriptor
+        notifier.setEnabled(False)
+        if self.server.read(conn):
+            del self._connections[conn]
+            notifier.deleteLater()
+        else:
+            notifier.setEnabled(True)
+
+    def close(self):
+        """Stop serving and remove the socket file."""
+        self._listener.setEnabled(False)
+        for notifier in self._connections.values():
+            notifier.setEnabled(False)
+        self._connections.clear()
+        self.server.close()
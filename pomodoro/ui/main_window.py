@@ -2,6 +2,8 @@
 Main window component for the Pomodoro Timer application.
 """
 import logging
+import math
+import time
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,10 +12,12 @@ from PyQt6.QtWidgets import (
     QApplication,
     QMessageBox,
 )
-from PyQt6.QtCore import QTimer, Qt, QPoint, QRect
+from PyQt6.QtCore import QEvent, QTimer, Qt, QPoint, QRect
 from PyQt6.QtGui import QIcon, QMouseEvent
 
+from ..engine import TimerEngine
 from .config_dialog import PomodoroConfigDialog
+from .config_watcher import ConfigWatcher
 from .focus_dialog import FocusSessionDialog
 from .components import TimerLabel, FocusLabel, PomodoroButton
 
@@ -22,7 +26,7 @@ logger = logging.getLogger(__name__)
 class PomodoroTimer(QWidget):
     """Main window for the Pomodoro Timer application."""
 
-    def __init__(self, config, sound_manager, notes_manager, session_manager):
+    def __init__(self, config, sound_manager, notes_manager, session_manager, clock=time.monotonic):
         """
         Initialize the main window.
         
@@ -31,6 +35,7 @@ class PomodoroTimer(QWidget):
             sound_manager: Sound manager instance
             notes_manager: Notes manager instance
             session_manager: Session manager instance
+            clock: Monotonic clock for the timer engine (injectable for simulations)
         """
         super().__init__()
 
@@ -39,22 +44,29 @@ class PomodoroTimer(QWidget):
         self.notes_manager = notes_manager
         self.session_manager = session_manager
         
-        # Set up timer settings from config
-        self.pomodoro_time = config.get_focus_period() * 60  # minutes to seconds
-        self.rest_time = config.get_rest_period() * 60  # minutes to seconds
-        self.time_left = self.pomodoro_time
+        # The focus/rest state machine; the window only displays it
+        self.engine = TimerEngine(
+            config,
+            sound_manager,
+            notes_manager,
+            session_manager,
+            clock=clock,
+            ask_success=self.ask_session_success,
+        )
+        self.engine.add_listener(self._on_engine_event)
           # State variables
-        self.running = False
-        self.is_rest_period = False
         self.dragging = False
         self.resizing = False
-        self.focus_text = ""
         self.drag_start_position = QPoint(0, 0)
         self.resize_start_position = QPoint(0, 0)
         self.original_geometry = QRect(0, 0, 0, 0)
         
         self.initUI()
 
+        # Apply settings changed in the dialog or in config.json while running
+        self.config.add_listener(self._on_config_changed)
+        self.config_watcher = ConfigWatcher(self.config, self)
+
     def initUI(self):
         """Initialize the user interface."""
         self.setWindowTitle("")  # Remove application name from title bar
@@ -78,10 +90,82 @@ class PomodoroTimer(QWidget):
         # Create the layouts and widgets
         self._create_layout()
         
-        # Set up the timer
+        # Set up the timer: a single-shot wakeup for the next visible change
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.update_timer)
 
+    # Engine state, exposed for the UI code and for tests
+
+    @property
+    def running(self):
+        return self.engine.running
+
+    @property
+    def is_rest_period(self):
+        return self.engine.is_rest_period
+
+    @property
+    def focus_text(self):
+        return self.engine.focus_text
+
+    @property
+    def time_left(self):
+        """Remaining seconds of the current period."""
+        return self.engine.time_left
+
+    @property
+    def countdown(self):
+        return self.engine.countdown
+
+    def _on_engine_event(self, event, **data):
+        """Bring the display and the wakeup timer in line with the engine."""
+        self.update_focus_label()
+        self._show_time_left()
+        self.pause_button.setText("Continue" if self.engine.paused else "Pause")
+        if self.engine.running:
+            self._schedule_tick()
+        else:
+            self.timer.stop()
+
+    def _schedule_tick(self):
+        """Schedule the next wakeup.
+
+        While the window is visible this is when the displayed second changes,
+        using a coarse timer the OS may batch with other wakeups. When the
+        window is hidden or minimized nothing is shown, so a single precise
+        wakeup is scheduled at the deadline instead.
+        """
+        visible = self.isVisible() and not self.isMinimized()
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer if visible else Qt.TimerType.PreciseTimer)
+        delay = self.engine.next_wakeup(visible)
+        self.timer.start(max(1, math.ceil(delay * 1000)))
+
+    def _show_time_left(self):
+        mins, secs = divmod(self.time_left, 60)
+        self.timer_label.setText(f"{mins:02d}:{secs:02d}")
+
+    def showEvent(self, event):
+        """Resume per-second updates when the window becomes visible."""
+        super().showEvent(event)
+        if self.running:
+            self._show_time_left()
+            self._schedule_tick()
+
+    def hideEvent(self, event):
+        """Drop to a single wakeup at the deadline while hidden."""
+        super().hideEvent(event)
+        if self.running:
+            self._schedule_tick()
+
+    def changeEvent(self, event):
+        """Reschedule wakeups when the window is minimized or restored."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and self.running:
+            if not self.isMinimized():
+                self._show_time_left()
+            self._schedule_tick()
+
     def _create_layout(self):
         """Create the main layout and widgets."""
         # Main layout
@@ -121,9 +205,21 @@ class PomodoroTimer(QWidget):
         # Settings button
         self.settings_button = PomodoroButton("Settings", self)
         self.settings_button.clicked.connect(self.open_settings)
-        self.grid_layout.addWidget(self.settings_button, 1, 1)        # Add note buttons only if obsidian is enabled
+        self.grid_layout.addWidget(self.settings_button, 1, 1)
+
+        # Exit button, placed by _update_obsidian_buttons
+        self.exit_button = PomodoroButton("Exit", self)
+        self.exit_button.clicked.connect(self.close)
+
         self.obsidian_row = None
-        if self.notes_manager.is_enabled():
+        self.daily_button = None
+        self.weekly_button = None
+        self._update_obsidian_buttons()
+
+    def _update_obsidian_buttons(self):
+        """Add or remove the Obsidian note buttons in place."""
+        enabled = self.notes_manager.is_enabled()
+        if enabled and self.daily_button is None:
             # Daily button
             self.daily_button = PomodoroButton("Daily", self)
             self.daily_button.clicked.connect(self.notes_manager.open_daily_note)
@@ -134,13 +230,24 @@ class PomodoroTimer(QWidget):
             self.weekly_button.clicked.connect(self.notes_manager.open_weekly_note)
             self.grid_layout.addWidget(self.weekly_button, 2, 1)
             self.obsidian_row = 2
+        elif not enabled and self.daily_button is not None:
+            for button in (self.daily_button, self.weekly_button):
+                self.grid_layout.removeWidget(button)
+                button.deleteLater()
+            self.daily_button = None
+            self.weekly_button = None
+            self.obsidian_row = None
 
-        # Exit button
-        self.exit_button = PomodoroButton("Exit", self)
-        self.exit_button.clicked.connect(self.close)
-        row = 3 if self.notes_manager.is_enabled() else 2
+        self.grid_layout.removeWidget(self.exit_button)
+        row = 3 if enabled else 2
         self.grid_layout.addWidget(self.exit_button, row, 0, 1, 2)  # span both columns
-    
+
+    def _on_config_changed(self, section):
+        """Apply changed configuration sections to the running window."""
+        # Timer changes arrive through the engine's "changed" event
+        if section == "obsidian":
+            self._update_obsidian_buttons()
+
     def mousePressEvent(self, a0: QMouseEvent | None):
         """Handle mouse press events for dragging and resizing."""
         if a0 and a0.button() == Qt.MouseButton.LeftButton:
@@ -170,11 +277,7 @@ class PomodoroTimer(QWidget):
             self.resizing = False
             
             # Save the new position and size in the config
-            ui_settings = self.config.get_ui_settings()
-            ui_settings["start_position"]["x"] = self.x()
-            ui_settings["start_position"]["y"] = self.y()
-            ui_settings["window_size"]["width"] = self.width()
-            ui_settings["window_size"]["height"] = self.height()
+            self.config.set_window_geometry(self.x(), self.y(), self.width(), self.height())
             
             a0.accept()
 
@@ -196,161 +299,22 @@ class PomodoroTimer(QWidget):
         dialog = FocusSessionDialog(self.config, self)
         if dialog.exec():
             text, focus_len, rest_len = dialog.get_values()
-            self.focus_text = text
-            # Update config and internal timers
-            self.config.set_focus_period(focus_len)
-            self.config.set_rest_period(rest_len)
-            self.pomodoro_time = focus_len * 60
-            self.rest_time = rest_len * 60
-
-            self.update_focus_label()
-            self.time_left = self.pomodoro_time
-            self.is_rest_period = False
-            self.start_timer()
-            # Log to Obsidian that a focus session started
-            if self.notes_manager.is_enabled():
-                self.notes_manager.record_pomodoro_session(
-                    focus_text=f"Started Focus: {self.focus_text}",
-                    success=None,
-                    planned_minutes=focus_len,
-                )
-            # Mirror action in sessions log
-            try:
-                self.session_manager.log_event(f"Started Focus: {self.focus_text}")
-            except Exception:
-                pass
+            self.engine.start_focus(text, focus_len, rest_len)
 
     def start_rest(self):
         """Start a rest session."""
-        self.focus_text = ""
-        self.focus_label.setText("")
-        self.time_left = self.rest_time
-        self.is_rest_period = True
-        self.start_timer()
-        # Log to Obsidian that a rest session started
-        if self.notes_manager.is_enabled():
-            self.notes_manager.record_pomodoro_session(
-                focus_text="Started Rest",
-                success=None,
-                planned_minutes=self.config.get_rest_period(),
-            )
-        # Mirror action in sessions log
-        try:
-            self.session_manager.log_event("Started Rest")
-        except Exception:
-            pass
-
-    def start_timer(self):
-        """Start the timer."""
-        if not self.running:
-            self.running = True
-            self.timer.start(1000)  # Update every second
-            self.pause_button.setText("Pause")
+        self.engine.start_rest()
 
     def pause_timer(self):
         """Pause or resume the timer."""
-        if self.running:
-            self.running = False
-            self.timer.stop()
-            self.pause_button.setText("Continue")
-            # If user pauses during a focus period and stops early, offer to log
-            if not self.is_rest_period and self.focus_text:
-                # Treat pause as potential early stop if user clicks Rest next
-                self._early_stop_candidate = True
-            # Log pause event to Obsidian
-            if self.notes_manager.is_enabled():
-                label = "Paused Focus" if not self.is_rest_period else "Paused Rest"
-                self.notes_manager.record_pomodoro_session(
-                    focus_text=label,
-                    success=None,
-                )
-            # Mirror pause in sessions log
-            try:
-                label = "Paused Focus" if not self.is_rest_period else "Paused Rest"
-                self.session_manager.log_event(label)
-            except Exception:
-                pass
-        else:
-            self.running = True
-            self.timer.start(1000)
-            self.pause_button.setText("Pause")
-            # Log resume/continue to Obsidian and sessions log
-            label = (
-                f"Continued Focus: {self.focus_text}" if not self.is_rest_period else "Continued Rest"
-            )
-            if self.notes_manager.is_enabled():
-                self.notes_manager.record_pomodoro_session(
-                    focus_text=label,
-                    success=None,
-                )
-            try:
-                self.session_manager.log_event(label)
-            except Exception:
-                pass
+        self.engine.pause()
 
     def update_timer(self):
         """Update the timer display and handle timer completion."""
-        if self.running:
-            mins, secs = divmod(self.time_left, 60)
-            self.timer_label.setText(f"{mins:02d}:{secs:02d}")
-            
-            if self.time_left > 0:
-                self.time_left -= 1
-            else:
-                self.running = False
-                self.timer.stop()
-                
-                if not self.is_rest_period:
-                    # Focus period ended
-                    self.sound_manager.play_focus_end()
-                    success = self.ask_session_success()
-                    self.session_manager.log_session(self.focus_text, success)
-                    # Record to Obsidian vault if enabled
-                    if self.notes_manager.is_enabled():
-                        planned = self.config.get_focus_period()
-                        self.notes_manager.record_pomodoro_session(
-                            focus_text=self.focus_text,
-                            success=bool(success),
-                            early=False,
-                            planned_minutes=planned,
-                            actual_minutes=planned,
-                        )
-                    self.start_rest_period()
-                else:
-                    # Rest period ended
-                    self.sound_manager.play_rest_end()
-                    self.reset_timer()
-
-    def start_rest_period(self):
-        """Start the rest period after a focus period."""
-        self.is_rest_period = True
-        self.time_left = self.rest_time
-        mins, secs = divmod(self.time_left, 60)
-        self.timer_label.setText(f"{mins:02d}:{secs:02d}")
-        self.running = True
-        self.timer.start(1000)
-
-    def reset_timer(self):
-        """Reset the timer to initial state."""
-        self.running = False
-        self.timer.stop()
-        # If a focus was in progress and user reset before completion, mark early stop
-        if not self.is_rest_period and self.focus_text and self.time_left > 0:
-            planned = self.config.get_focus_period()
-            actual = (self.pomodoro_time - self.time_left) // 60
-            self.session_manager.log_session(self.focus_text, False)
-            if self.notes_manager.is_enabled():
-                self.notes_manager.record_pomodoro_session(
-                    focus_text=self.focus_text,
-                    success=False,
-                    early=True,
-                    planned_minutes=planned,
-                    actual_minutes=int(actual),
-                )
-        self.time_left = self.pomodoro_time if not self.is_rest_period else self.rest_time
-        mins, secs = divmod(self.time_left, 60)
-        self.timer_label.setText(f"{mins:02d}:{secs:02d}")
-        self.pause_button.setText("Pause")
+        if self.engine.running:
+            self._show_time_left()
+            if not self.engine.update():
+                self._schedule_tick()
 
     def update_focus_label(self):
         """Update the focus text label."""
@@ -370,70 +334,27 @@ class PomodoroTimer(QWidget):
         result = box.exec()
         return result == QMessageBox.StandardButton.Yes
 
+    def bring_to_front(self):
+        """Show, restore and activate the window."""
+        self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
     def open_settings(self):
-        """Open the settings dialog."""
+        """Open the settings dialog.
+
+        Accepted changes reach the window, the sound manager and the notes
+        manager through the configuration listeners; no restart is needed.
+        """
         dialog = PomodoroConfigDialog(self.config, self)
-        if dialog.exec():
-            # Update timer values from config
-            self.pomodoro_time = self.config.get_focus_period() * 60
-            self.rest_time = self.config.get_rest_period() * 60
-            
-            # Reset timer display if not running
-            if not self.running:
-                self.time_left = self.pomodoro_time if not self.is_rest_period else self.rest_time
-                mins, secs = divmod(self.time_left, 60)
-                self.timer_label.setText(f"{mins:02d}:{secs:02d}")
-            
-            # Update notes manager enabled state
-            if self.notes_manager.enabled != self.config.is_obsidian_enabled():
-                self.notes_manager.enabled = self.config.is_obsidian_enabled()
-                # Restart the application to apply the changes
-                self.close()
-                app = QApplication.instance()
-                if app:
-                    app.quit()  # Exit with restart code
+        dialog.exec()
 
     def closeEvent(self, event):
         """Log an event when the application is closed.
 
         Includes whether a session was in progress and remaining time.
         """
-        try:
-            if self.running:
-                if self.is_rest_period:
-                    self.session_manager.log_event("Exited during Rest")
-                    if self.notes_manager.is_enabled():
-                        self.notes_manager.record_pomodoro_session(
-                            focus_text="Exited during Rest",
-                            success=None,
-                        )
-                else:
-                    mins = int(self.time_left // 60)
-                    if self.focus_text:
-                        self.session_manager.log_event(
-                            f"Exited during Focus: {self.focus_text} (remaining {mins}m)"
-                        )
-                        if self.notes_manager.is_enabled():
-                            self.notes_manager.record_pomodoro_session(
-                                focus_text=f"Exited during Focus: {self.focus_text} (remaining {mins}m)",
-                                success=None,
-                            )
-                    else:
-                        self.session_manager.log_event(
-                            f"Exited during Focus (remaining {mins}m)"
-                        )
-                        if self.notes_manager.is_enabled():
-                            self.notes_manager.record_pomodoro_session(
-                                focus_text=f"Exited during Focus (remaining {mins}m)",
-                                success=None,
-                            )
-            else:
-                self.session_manager.log_event("Exited application")
-                if self.notes_manager.is_enabled():
-                    self.notes_manager.record_pomodoro_session(
-                        focus_text="Exited application",
-                        success=None,
-                    )
-        except Exception:
-            pass
+        self.engine.record_exit()
+        # Make sure write-behind log entries reach the disk before exiting
+        self.session_manager.flush()
         super().closeEvent(event)
@@ -2,17 +2,82 @@
 Utilities for the Pomodoro Timer application.
 """
 import os
+import shutil
 import sys
-import importlib.resources as resources
 import logging
+import threading
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for memoized resource paths (icons, sounds, config)
+RESOURCE_CACHE_SIZE = 64
+
+_resource_cache = OrderedDict()
+_resource_cache_lock = threading.Lock()
+_resource_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_user_data_dir():
+    """
+    Get (and create) the per-user data directory.
+
+    Returns:
+        str: Directory holding logs, session history and copied resources
+    """
+    try:
+        import appdirs
+        data_dir = appdirs.user_data_dir("pomodoro-timer", "pomodoro")
+    except ImportError:
+        data_dir = os.path.expanduser("~/.pomodoro-timer")
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
+
+
+def get_user_config_dir():
+    """
+    Get (and create) the per-user configuration directory.
+
+    Returns:
+        str: Directory holding ``config.json``
+    """
+    try:
+        import appdirs
+        config_dir = appdirs.user_config_dir("pomodoro-timer", "pomodoro")
+    except ImportError:
+        config_dir = os.path.expanduser("~/.pomodoro-timer/config")
+    os.makedirs(config_dir, exist_ok=True)
+    return config_dir
+
+
+def get_config_path():
+    """
+    Get the configuration file to use.
+
+    The packaged default is copied to the user configuration directory on
+    first use; if that is not possible the packaged file is used directly.
+
+    Returns:
+        str: Path to ``config.json``
+    """
+    user_config_path = os.path.join(get_user_config_dir(), "config.json")
+    default_config_path = get_resource_path("config.json")
+
+    # If user config doesn't exist, but default does, copy it
+    if not os.path.exists(user_config_path) and os.path.exists(default_config_path):
+        shutil.copy2(default_config_path, user_config_path)
+
+    # Use user config if it exists, otherwise fall back to package config
+    return user_config_path if os.path.exists(user_config_path) else default_config_path
+
 
 def get_resource_path(resource_name):
     """
     Get the appropriate path for a resource file.
     Works both when running from source and when installed as a package.
+
+    Resolved paths are memoized in a small LRU cache; a cached path is
+    dropped as soon as it no longer exists.
     
     Args:
         resource_name: Resource name/path (e.g., 'icons/pomodoro.png')
@@ -20,12 +85,63 @@ def get_resource_path(resource_name):
     Returns:
         str: Absolute path to the resource
     """
+    with _resource_cache_lock:
+        path = _resource_cache.get(resource_name)
+        if path is not None:
+            if os.path.exists(path):
+                _resource_cache.move_to_end(resource_name)
+                _resource_cache_stats["hits"] += 1
+                return path
+            del _resource_cache[resource_name]
+        _resource_cache_stats["misses"] += 1
+
+    path = _resolve_resource_path(resource_name)
+    if path is None:
+        logger.warning(f"Resource not found: {resource_name}")
+        return resource_name  # Return the original path as a fallback
+
+    with _resource_cache_lock:
+        _resource_cache[resource_name] = path
+        _resource_cache.move_to_end(resource_name)
+        while len(_resource_cache) > RESOURCE_CACHE_SIZE:
+            _resource_cache.popitem(last=False)
+    return path
+
+
+def invalidate_resource_path(resource_name=None):
+    """
+    Drop memoized resource paths.
+
+    Args:
+        resource_name: Resource to forget, or None to clear the whole cache
+    """
+    with _resource_cache_lock:
+        if resource_name is None:
+            _resource_cache.clear()
+        else:
+            _resource_cache.pop(resource_name, None)
+
+
+def get_resource_cache_stats():
+    """
+    Get resource resolver cache counters.
+
+    Returns:
+        dict: ``hits``, ``misses`` and current ``size`` of the cache
+    """
+    with _resource_cache_lock:
+        return {**_resource_cache_stats, "size": len(_resource_cache)}
+
+
+def _resolve_resource_path(resource_name):
+    """Look up a resource on disk, returning None if it cannot be found."""
     # Split the resource name into directory and filename
     parts = os.path.normpath(resource_name).split(os.sep)
     resource_dir = parts[0]  # 'icons' or 'sounds'
     resource_file = os.path.join(*parts[1:]) if len(parts) > 1 else parts[0]    # First try to find the resource in the package data
     try:
         # Try using importlib.resources (Python 3.9+)
+        import importlib.resources as resources
         path = resources.files('pomodoro').joinpath(f"../{resource_name}")
         if path.is_file():
             return str(path)
@@ -46,5 +162,4 @@ def get_resource_path(resource_name):
     if os.path.exists(resource_name):
         return os.path.abspath(resource_name)
     
-    logger.warning(f"Resource not found: {resource_name}")
-    return resource_name  # Return the original path as a fallback
+    return None
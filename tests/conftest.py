@@ -0,0 +1,50 @@
+import pytest
+
+
+class FakeConfig:
+    def __init__(self, focus=25, rest=5):
+        self.focus = focus
+        self.rest = rest
+
+    def get_focus_period(self):
+        return self.focus
+
+    def get_rest_period(self):
+        return self.rest
+
+    def set_focus_period(self, minutes):
+        self.focus = minutes
+
+    def set_rest_period(self, minutes):
+        self.rest = minutes
+
+    def add_listener(self, callback):
+        pass
+
+
+class FakeSinks:
+    """Stands in for the sound, notes and session managers."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        if name == "is_enabled":
+            return lambda: False
+        return lambda *args, **kwargs: self.calls.append(name)
+
+
+@pytest.fixture
+def sinks():
+    return FakeSinks()
+
+
+@pytest.fixture
+def make_engine(sinks):
+    """Build a ``TimerEngine`` on a fake configuration and the shared ``sinks``."""
+    from pomodoro.engine import TimerEngine
+
+    def make(**kwargs):
+        return TimerEngine(FakeConfig(), sinks, sinks, sinks, **kwargs)
+
+    return make
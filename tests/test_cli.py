@@ -0,0 +1,16 @@
+import pytest
+
+from pomodoro.cli import parse_args
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["run", "--headless", "--focus", "50", "--rest", "10"],
+        ["--focus", "50", "--rest", "10", "run", "--headless"],
+        ["--focus", "50", "run", "--headless", "--rest", "10"],
+    ],
+)
+def test_run_accepts_durations_before_or_after_the_command(argv):
+    args = parse_args(argv)
+    assert (args.command, args.headless, args.focus, args.rest) == ("run", True, 50, 10)
@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from pomodoro.config import Config, DEFAULT_CONFIG
 
 
@@ -27,6 +29,18 @@ def test_ensure_defaults_on_partial_config(tmp_path):
     assert "sounds" in c.config and "focus_end" in c.config["sounds"]
 
 
+def test_padded_nested_defaults_are_not_shared(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    # A section present without its nested sub-dicts gets them padded in
+    cfg_path.write_text(json.dumps({"sounds": {"backend": "null"}}))
+    expected = DEFAULT_CONFIG["sounds"]["focus_end"]["volume"]
+
+    c = Config(config_path=str(cfg_path))
+    c.config["sounds"]["focus_end"]["volume"] = 0.1
+
+    assert DEFAULT_CONFIG["sounds"]["focus_end"]["volume"] == expected
+
+
 def test_setters_persist_values(tmp_path):
     cfg_path = tmp_path / "persist" / "config.json"
     c = Config(config_path=str(cfg_path))
@@ -38,3 +52,104 @@ def test_setters_persist_values(tmp_path):
     assert c2.get_focus_period() == 30
     assert c2.get_rest_period() == 7
 
+
+
+def test_listeners_notified_with_changed_section(tmp_path):
+    c = Config(config_path=str(tmp_path / "config.json"))
+    seen = []
+    c.add_listener(seen.append)
+    c.set_sound_settings("focus_end", volume=0.3)
+    c.set_focus_period(20)
+    c.remove_listener(seen.append)
+    c.set_rest_period(4)
+    assert seen == ["sounds", "timer"]
+
+
+def _count_writes(monkeypatch):
+    import pomodoro.config as config_module
+
+    writes = []
+    real_replace = config_module.os.replace
+
+    def counting_replace(src, dst):
+        writes.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(config_module.os, "replace", counting_replace)
+    return writes
+
+
+def test_typical_session_skips_unchanged_writes(tmp_path, monkeypatch):
+    cfg_path = tmp_path / "config.json"
+    Config(config_path=str(cfg_path))
+    writes = _count_writes(monkeypatch)
+
+    c = Config(config_path=str(cfg_path))
+    # Every focus start re-applies the current durations
+    for _ in range(3):
+        c.set_focus_period(c.get_focus_period())
+        c.set_rest_period(c.get_rest_period())
+    assert writes == []
+
+    c.set_focus_period(50)
+    c.set_focus_period(50)
+    assert len(writes) == 1
+    assert not list(tmp_path.glob("*.tmp"))
+    assert json.loads(cfg_path.read_text())["timer"]["focus_period_minutes"] == 50
+
+
+def test_delayed_saves_are_coalesced(tmp_path, monkeypatch):
+    cfg_path = tmp_path / "config.json"
+    c = Config(config_path=str(cfg_path), save_delay=60)
+    writes = _count_writes(monkeypatch)
+
+    c.set_focus_period(40)
+    c.set_rest_period(8)
+    c.set_sound_settings("focus_end", volume=0.2)
+    assert writes == []
+
+    c.flush()
+    assert len(writes) == 1
+    assert Config(config_path=str(cfg_path)).get_rest_period() == 8
+
+
+def test_reload_applies_only_changed_sections(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    c = Config(config_path=str(cfg_path))
+    seen = []
+    c.add_listener(seen.append)
+    c.set_focus_period(35)
+    assert c.reload() == []  # Our own write
+
+    data = json.loads(cfg_path.read_text())
+    data["obsidian"]["enabled"] = not data["obsidian"]["enabled"]
+    data["timer"]["rest_period_minutes"] = 9
+    cfg_path.write_text(json.dumps(data, indent=4))
+
+    assert sorted(c.reload()) == ["obsidian", "timer"]
+    assert c.get_rest_period() == 9
+    assert c.get_focus_period() == 35
+    assert sorted(seen) == ["obsidian", "timer", "timer"]
+    assert c.reload() == []
+
+
+def test_overrides_are_layered_but_never_saved(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    c = Config(config_path=str(cfg_path), environ={"POMODORO_REST_MINUTES": "12"})
+    c.set_cli_overrides({"timer": {"focus_period_minutes": 50}})
+    assert (c.get_focus_period(), c.get_rest_period()) == (50, 12)
+
+    # Re-applying the effective values (as every focus start does) saves nothing
+    c.set_focus_period(50)
+    c.set_rest_period(12)
+    c.set_sound_settings("focus_end", volume=0.4)
+    saved = json.loads(cfg_path.read_text())["timer"]
+    assert saved == DEFAULT_CONFIG["timer"]
+
+    # An explicit new value replaces the override and is persisted
+    c.set_focus_period(45)
+    assert c.get_focus_period() == 45
+    assert json.loads(cfg_path.read_text())["timer"]["focus_period_minutes"] == 45
+
+    with pytest.raises(AttributeError):
+        c.snapshot.focus_period = 1
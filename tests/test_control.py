@@ -0,0 +1,79 @@
+import select
+import threading
+
+import pytest
+
+from pomodoro.control import AlreadyRunningError, ControlServer, handle_request, send_command
+
+
+def test_handle_request_maps_commands_onto_engine(make_engine):
+    engine = make_engine()
+
+    assert handle_request(engine, {"command": "pause"})["ok"] is False
+    reply = handle_request(engine, {"command": "start", "text": "Write docs", "focus": 50})
+    assert reply["ok"] and reply["status"]["state"] == "focus"
+    assert (reply["status"]["focus_text"], reply["status"]["time_left"]) == ("Write docs", 50 * 60)
+    assert handle_request(engine, {"command": "pause"})["status"]["state"] == "paused"
+    assert handle_request(engine, {"command": "rest"})["status"]["state"] == "rest"
+    assert handle_request(engine, {"command": "stop"}) == {"ok": False, "error": "unknown command: 'stop'"}
+
+
+def test_control_socket_round_trip_and_single_instance(tmp_path, make_engine):
+    path = str(tmp_path / "control.sock")
+    engine = make_engine()
+    server = ControlServer(engine, path=path)
+    server.listen()
+    stop = threading.Event()
+
+    def serve():
+        connections = []
+        while not stop.is_set():
+            readable, _, _ = select.select([server, *connections], [], [], 0.05)
+            for item in readable:
+                if item is server:
+                    conn = server.accept()
+                    if conn is not None:
+                        connections.append(conn)
+                elif server.read(item):
+                    connections.remove(item)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        reply = send_command("start", path=path, text="Review", focus=30)
+        assert reply["ok"] and reply["status"]["time_left"] == 30 * 60
+        assert send_command("status", path=path)["status"]["state"] == "focus"
+        with pytest.raises(AlreadyRunningError):
+            ControlServer(engine, path=path).listen()
+    finally:
+        stop.set()
+        thread.join()
+        server.close()
+    assert send_command("status", path=path) is None
+
+
+def test_commands_wait_for_a_finishing_period_and_do_not_persist(make_engine):
+    engine = make_engine()
+    replies = []
+    engine.ask_success = lambda: replies.append(handle_request(engine, {"command": "start", "text": "Next"})) or True
+    engine.start_focus("First", 0, 5)
+
+    assert engine.update()
+    assert replies[0]["ok"] is False and engine.is_rest_period and engine.running
+
+    saved = []
+    engine.config.set_focus_period = saved.append
+    handle_request(engine, {"command": "start", "text": "Once", "focus": 50})
+    assert saved == [] and engine.time_left == 50 * 60
+
+
+def test_busy_owner_still_counts_as_running(tmp_path, make_engine):
+    path = str(tmp_path / "control.sock")
+    server = ControlServer(make_engine(), path=path)
+    server.listen()
+    try:
+        # Nobody serves the socket, like an instance blocked in a dialog
+        with pytest.raises(AlreadyRunningError):
+            ControlServer(make_engine(), path=path).listen()
+    finally:
+        server.close()
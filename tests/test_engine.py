@@ -0,0 +1,74 @@
+import math
+import random
+
+from pomodoro.engine import Countdown
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_no_drift_over_simulated_eight_hour_day():
+    clock = FakeClock()
+    rng = random.Random(42)
+    day = 8 * 60 * 60
+    countdown = Countdown(day, clock=clock)
+    countdown.start()
+    deadline = clock.now + day
+    wakeups = 0
+
+    while not countdown.expired():
+        # Coarse timers fire up to 5% early or late
+        clock.now += countdown.next_wakeup() * rng.uniform(0.95, 1.05)
+        wakeups += 1
+        if wakeups in (5000, 20000):
+            # Suspend or a blocking modal dialog: wakeups are simply missed
+            clock.now += 90.5
+        assert countdown.remaining_seconds() == max(0, math.ceil(round(deadline - clock.now, 6)))
+
+    # Expiry is noticed at the first wakeup after the deadline
+    assert 0 <= clock.now - deadline < 0.15
+    # One wakeup per displayed second, minus the seconds slept through
+    assert wakeups <= day - 2 * 90 + 1
+
+
+def test_hidden_countdown_wakes_only_at_deadline():
+    clock = FakeClock()
+    countdown = Countdown(25 * 60, clock=clock)
+    countdown.start()
+    clock.now += countdown.next_wakeup(visible=False)
+    assert countdown.expired()
+
+
+def test_pause_keeps_remaining_time():
+    clock = FakeClock()
+    countdown = Countdown(25 * 60, clock=clock)
+    countdown.start()
+    clock.now += 10 * 60 + 0.4
+    countdown.pause()
+    clock.now += 3600
+    assert countdown.remaining_seconds() == 15 * 60
+    countdown.start()
+    clock.now += 0.6
+    assert countdown.remaining_seconds() == 15 * 60 - 1
+    assert math.isclose(countdown.until_display_change(), 1.0)
+
+
+def test_engine_runs_focus_and_rest_without_qt(make_engine, sinks):
+    clock = FakeClock()
+    engine = make_engine(clock=clock, ask_success=lambda: True)
+    events = []
+    engine.add_listener(lambda event, **data: events.append(event))
+
+    engine.start_focus("Write tests", 1, 1)
+    while engine.running:
+        clock.now += engine.next_wakeup(visible=False)
+        engine.update()
+
+    assert events == ["focus_started", "focus_finished", "rest_started", "rest_finished"]
+    assert sinks.calls == ["log_event", "play_focus_end", "log_session", "play_rest_end"]
+    assert engine.next_wakeup() is None and engine.time_left == 60
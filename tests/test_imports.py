@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("PyQt6", "pygame")
+
+# Generous ceiling for the cumulative import time of the CLI module (microseconds)
+CLI_IMPORT_BUDGET_US = 150_000
+
+
+def _import_times(code, tmp_path):
+    env = dict(os.environ)
+    env["XDG_DATA_HOME"] = str(tmp_path / "data")
+    env["XDG_CONFIG_HOME"] = str(tmp_path / "config")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue
+    return times
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--version"], ["--help"], ["stats", "--format", "json"], ["status"]],
+)
+def test_cli_fast_paths_do_not_load_qt_or_pygame(tmp_path, argv):
+    code = (
+        "import contextlib, io\n"
+        "from pomodoro.cli import main\n"
+        "with contextlib.suppress(SystemExit), contextlib.redirect_stdout(io.StringIO()):\n"
+        f"    main({argv!r})\n"
+    )
+    times = _import_times(code, tmp_path)
+    assert "pomodoro.cli" in times
+    loaded = [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+    assert loaded == []
+
+
+def test_cli_import_budget(tmp_path):
+    times = _import_times("import pomodoro.cli", tmp_path)
+    assert times["pomodoro.cli"] < CLI_IMPORT_BUDGET_US
+
+
+def test_headless_runner_does_not_load_qt(tmp_path):
+    times = _import_times("import pomodoro.headless", tmp_path)
+    assert "pomodoro.headless" in times
+    assert [name for name in times if name.split(".")[0] == "PyQt6"] == []
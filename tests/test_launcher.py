@@ -0,0 +1,47 @@
+import os
+import shutil
+import sys
+import time
+
+import pytest
+
+from pomodoro.launcher import UrlLauncher
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX openers only")
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_urls_are_opened_in_order_by_worker(tmp_path):
+    out = tmp_path / "urls.txt"
+    command = ["sh", "-c", f'echo "$0" >> "{out}"']
+    launcher = UrlLauncher(command=command, max_concurrent=1)
+    for i in range(5):
+        launcher.submit(f"obsidian://open?file={i}")
+    launcher.close(timeout=5)
+
+    assert _wait_until(lambda: launcher.get_stats()["running"] == 0)
+    assert out.read_text().split() == [f"obsidian://open?file={i}" for i in range(5)]
+    assert launcher.get_stats() == {"launched": 5, "timed_out": 0, "running": 0}
+
+
+@pytest.mark.skipif(shutil.which("sleep") is None, reason="needs sleep")
+def test_slow_opener_is_detached_and_never_killed(tmp_path):
+    pid_file = tmp_path / "pid"
+    launcher = UrlLauncher(command=["sh", "-c", f'echo $$ > "{pid_file}"; exec sleep "$0"'], timeout=0.2)
+    launcher.submit("2")
+
+    assert _wait_until(lambda: launcher.get_stats()["timed_out"] == 1)
+    started = time.monotonic()
+    launcher.close()
+    assert time.monotonic() - started < 0.5
+
+    pid = int(pid_file.read_text())
+    # Still alive, in a session of its own
+    assert os.getsid(pid) == pid
+    assert _wait_until(lambda: launcher.get_stats()["running"] == 0)
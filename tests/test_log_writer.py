@@ -0,0 +1,42 @@
+import pytest
+
+from pomodoro.log_writer import BufferedLogWriter
+from pomodoro.session import SessionManager
+
+
+@pytest.mark.parametrize("policy", ["entry", "batch", "close"])
+def test_flush_makes_entries_visible(tmp_path, policy):
+    path = tmp_path / "out.log"
+    writer = BufferedLogWriter(str(path), flush_policy=policy, flush_interval=60)
+    writer.write(b"one\n")
+    writer.write(b"two\n")
+    assert writer.flush(timeout=5)
+    assert path.read_bytes() == b"one\ntwo\n"
+    writer.close()
+    writer.close()  # idempotent
+    with pytest.raises(ValueError):
+        writer.write(b"three\n")
+
+
+def test_close_writes_everything(tmp_path):
+    path = tmp_path / "out.log"
+    writer = BufferedLogWriter(str(path), flush_policy="close", fsync_policy="close")
+    for i in range(1000):
+        writer.write(f"{i}\n".encode())
+    writer.close()
+    assert len(path.read_text().splitlines()) == 1000
+
+
+def test_session_manager_write_behind(tmp_path):
+    log_path = tmp_path / "sessions.log"
+    sm = SessionManager(log_file=str(log_path), flush_policy="batch", flush_interval=60)
+    sm.log_session("A", success=True)
+    sm.log_event("Paused Focus")
+    # Readers flush pending entries before scanning the log
+    assert sm.get_daily_stats()["count"] == 1
+    sm.log_session("B", success=False)
+    sm.close()
+
+    sm2 = SessionManager(log_file=str(log_path))
+    assert sm2.get_session_count() == 2
+    assert sm2.index.size == log_path.stat().st_size
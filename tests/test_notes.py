@@ -0,0 +1,117 @@
+import urllib.parse
+
+from pomodoro.config import Config
+from pomodoro.notes import NotesManager
+
+
+def _manager(tmp_path, debounce):
+    config = Config(config_path=str(tmp_path / "config.json"))
+    config.set_values("obsidian", {"append_debounce_seconds": debounce})
+    manager = NotesManager(config)
+    manager.enabled = True
+    urls = []
+    manager._open_obsidian_url = urls.append
+    return manager, urls
+
+
+def test_lines_for_same_file_are_coalesced(tmp_path):
+    manager, urls = _manager(tmp_path, 60)
+    manager.record_pomodoro_session(focus_text="Write", success=None, status="paused")
+    manager.record_pomodoro_session(focus_text="Write", success=None, status="resumed")
+    manager.record_pomodoro_session(focus_text="Write", success=True, planned_minutes=25)
+    assert urls == []
+
+    manager.close()
+
+    assert len(urls) == 1
+    data = urllib.parse.parse_qs(urllib.parse.urlparse(urls[0]).query)["data"][0]
+    lines = data.split("\n")
+    assert len(lines) == 3
+    assert lines[-1].endswith("Write — success (planned 25m)")
+    assert manager.get_dispatch_stats() == {
+        "events_received": 3, "urls_dispatched": 1, "files_appended": 0, "pending": 0,
+    }
+
+
+def test_zero_debounce_dispatches_immediately(tmp_path):
+    manager, urls = _manager(tmp_path, 0)
+    manager.record_pomodoro_session(focus_text="Read", success=False, early=True)
+    assert len(urls) == 1
+    assert "early%20stop" in urls[0]
+    manager.close()
+
+
+def test_vault_path_appends_directly(tmp_path):
+    manager, urls = _manager(tmp_path, 60)
+    vault = tmp_path / "vault"
+    manager.obsidian_settings["vault_path"] = str(vault)
+    manager.obsidian_settings["sessions_notes_path"] = "Sessions"
+    manager.record_pomodoro_session(focus_text="Plan", success=None, status="started")
+    manager.record_pomodoro_session(focus_text="Plan", success=True)
+    manager.flush()
+    manager.record_pomodoro_session(focus_text="Review", success=False)
+    manager.close()
+
+    assert urls == []
+    (note,) = (vault / "Sessions").iterdir()
+    assert note.name.endswith(" - Pomodoro Sessions.md")
+    lines = note.read_text(encoding="utf-8").splitlines()
+    assert [line.split(" – ", 1)[1] for line in lines] == [
+        "Plan — started", "Plan — success", "Review — failed",
+    ]
+    assert manager.get_dispatch_stats()["files_appended"] == 2
+
+
+def test_vault_path_does_not_need_vault_name(tmp_path):
+    manager, urls = _manager(tmp_path, 0)
+    manager.obsidian_settings["vault_name"] = ""
+    manager.obsidian_settings["vault_path"] = str(tmp_path / "vault")
+    assert manager.record_pomodoro_session(focus_text="Plan", success=True)
+    (note,) = (tmp_path / "vault").rglob("*.md")
+    assert note.read_text(encoding="utf-8").endswith("Plan — success\n")
+
+    # Without a vault name there is no URI to fall back to
+    manager.obsidian_settings["vault_path"] = str(note)
+    assert manager.record_pomodoro_session(focus_text="Plan", success=True)
+    manager.close()
+    assert urls == [] and manager.get_dispatch_stats()["files_appended"] == 1
+
+
+def test_backfill_is_idempotent(tmp_path):
+    from pomodoro.notes import backfill_sessions
+    from pomodoro.records import SessionRecord
+
+    records = [
+        SessionRecord("session", "2024-03-01 09:00:00", 1, "Write", 25, 25, "success"),
+        SessionRecord("session", "2024-03-01 09:30:00", 2, "Write", 25, 10, "failed"),
+        SessionRecord("session", "2024-03-02 10:00:00", 3, "", None, None, "success"),
+    ]
+    vault = tmp_path / "vault"
+
+    assert backfill_sessions(iter(records), str(vault), "Sessions") == (2, 3)
+    assert backfill_sessions(iter(records), str(vault), "Sessions") == (0, 0)
+
+    note = vault / "Sessions" / "2024-03-01 - Pomodoro Sessions.md"
+    assert note.read_text(encoding="utf-8").splitlines() == [
+        "- 09:00 – Write — success (planned 25m, actual 25m)",
+        "- 09:30 – Write — failed (planned 25m, actual 10m)",
+    ]
+
+
+def test_backfill_keeps_duplicates_and_matches_live_lines(tmp_path):
+    from pomodoro.notes import backfill_sessions
+    from pomodoro.records import SessionRecord
+
+    note = tmp_path / "vault" / "2024-03-01 - Pomodoro Sessions.md"
+    note.parent.mkdir()
+    # Written live, with the minutes the legacy text log does not keep
+    note.write_text("- 09:00 – Write — success (planned 25m, actual 25m)\n", encoding="utf-8")
+    records = [
+        SessionRecord("session", "2024-03-01 09:00:00", 1, "Write", None, None, "success"),
+        SessionRecord("session", "2024-03-01 09:40:00", 2, "Read", None, None, "failed"),
+        SessionRecord("session", "2024-03-01 09:40:30", 3, "Read", None, None, "failed"),
+    ]
+
+    assert backfill_sessions(iter(records), str(tmp_path / "vault")) == (1, 2)
+    assert backfill_sessions(iter(records), str(tmp_path / "vault")) == (0, 0)
+    assert note.read_text(encoding="utf-8").splitlines()[1:] == ["- 09:40 – Read — failed"] * 2
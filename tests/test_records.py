@@ -0,0 +1,41 @@
+from pomodoro.records import SessionRecord, iter_records, line_date, parse_line
+from pomodoro.session import SessionManager
+
+
+def test_legacy_lines_parse_without_substring_confusion():
+    record = parse_line(
+        "Session 3 completed at 2025-09-06 10:00:00 - Session completed at 2024-01-01 - success\n"
+    )
+    assert record.kind == "session"
+    assert record.number == 3
+    assert record.date == "2025-09-06"
+    assert record.focus_text == "Session completed at 2024-01-01"
+    assert record.success
+
+    event = parse_line("Event at 2025-09-06 10:05:00 - Session 9 completed\n")
+    assert event.kind == "event"
+    assert event.focus_text == "Session 9 completed"
+    assert parse_line("garbage\n") is None
+
+
+def test_json_roundtrip():
+    record = SessionRecord("session", "2025-09-06 10:00:00", 4, 'Fix "bug"', 25, 20, "failed")
+    line = record.to_json()
+    assert line_date(line) == "2025-09-06"
+    assert parse_line(line + "\n") == record
+
+
+def test_jsonl_log_counts_and_mixed_formats(tmp_path):
+    log_path = tmp_path / "sessions.log"
+    log_path.write_text("Session 1 completed at 2025-01-01 09:00:00 - Old - success\n")
+
+    sm = SessionManager(log_file=str(log_path), log_format="jsonl")
+    assert sm.get_session_count() == 1
+    sm.log_event("Started Focus: Session completed")
+    assert sm.log_session("New", success=False, planned_minutes=25, actual_minutes=10) == 2
+
+    records = list(iter_records(log_path.read_text().splitlines()))
+    assert [r.kind for r in records] == ["session", "event", "session"]
+    assert records[2].actual_minutes == 10
+    assert SessionManager(log_file=str(log_path)).get_session_count() == 2
+    assert sm.get_daily_stats() == {"count": 1, "focus_areas": ["New"]}
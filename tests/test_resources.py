@@ -0,0 +1,77 @@
+import json
+
+from pomodoro.resources import STAMP_FILE, resources_changed, resources_up_to_date, sync_resources
+
+
+def _make_package(tmp_path):
+    sounds = tmp_path / "pkg" / "sounds"
+    sounds.mkdir(parents=True)
+    (sounds / "focus_end.mp3").write_bytes(b"v1")
+    (sounds / "rest_end.mp3").write_bytes(b"rest")
+    return {"sounds": str(sounds)}
+
+
+def test_sync_writes_stamp_and_skips_when_current(tmp_path):
+    source_dirs = _make_package(tmp_path)
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    assert not resources_up_to_date(str(data_dir), version="1.0")
+
+    copied = sync_resources(str(data_dir), source_dirs, version="1.0")
+    assert copied == ["sounds/focus_end.mp3", "sounds/rest_end.mp3"]
+    stamp = json.loads((data_dir / STAMP_FILE).read_text())
+    assert stamp["version"] == "1.0" and len(stamp["content_hash"]) == 64
+    assert resources_up_to_date(str(data_dir), version="1.0")
+    assert not resources_up_to_date(str(data_dir), version="1.1")
+
+
+def test_sync_copies_only_changed_unmodified_files(tmp_path):
+    source_dirs = _make_package(tmp_path)
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    sync_resources(str(data_dir), source_dirs, version="1.0")
+
+    # User customised one sound; the package updates both
+    (data_dir / "sounds" / "rest_end.mp3").write_bytes(b"mine")
+    pkg = tmp_path / "pkg" / "sounds"
+    (pkg / "focus_end.mp3").write_bytes(b"v2")
+    (pkg / "rest_end.mp3").write_bytes(b"rest2")
+
+    copied = sync_resources(str(data_dir), source_dirs, version="1.1")
+    assert copied == ["sounds/focus_end.mp3"]
+    assert (data_dir / "sounds" / "focus_end.mp3").read_bytes() == b"v2"
+    assert (data_dir / "sounds" / "rest_end.mp3").read_bytes() == b"mine"
+
+
+def test_launch_check_reads_only_the_stamp(tmp_path):
+    source_dirs = _make_package(tmp_path)
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    sync_resources(str(data_dir), source_dirs, version="1.0")
+
+    # Drift is left to the background check
+    (data_dir / "sounds" / "focus_end.mp3").unlink()
+    assert resources_up_to_date(str(data_dir), version="1.0")
+
+    stamp = json.loads((data_dir / STAMP_FILE).read_text())
+    stamp["files"]["sounds/focus_end.mp3"] = "0" * 64
+    (data_dir / STAMP_FILE).write_text(json.dumps(stamp))
+    assert not resources_up_to_date(str(data_dir), version="1.0")
+
+
+def test_missing_or_changed_files_are_resynced_without_a_version_bump(tmp_path):
+    source_dirs = _make_package(tmp_path)
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    sync_resources(str(data_dir), source_dirs, version="1.0")
+    assert not resources_changed(str(data_dir), source_dirs)
+
+    # A deleted user copy is noticed and restored
+    (data_dir / "sounds" / "focus_end.mp3").unlink()
+    assert resources_changed(str(data_dir), source_dirs)
+    assert sync_resources(str(data_dir), source_dirs, version="1.0") == ["sounds/focus_end.mp3"]
+    assert not resources_changed(str(data_dir), source_dirs)
+
+    # A development checkout changed a packaged file under the same version
+    (tmp_path / "pkg" / "sounds" / "new.mp3").write_bytes(b"new")
+    assert resources_changed(str(data_dir), source_dirs)
@@ -0,0 +1,80 @@
+import datetime
+import os
+
+from pomodoro.rollup import week_key
+from pomodoro.session import SessionManager
+
+
+def test_rollup_updates_on_log_and_persists(tmp_path):
+    log_path = tmp_path / "sessions.log"
+    sm = SessionManager(log_file=str(log_path))
+    sm.log_session("A", success=True)
+    assert sm.get_daily_stats() == {"count": 1, "focus_areas": ["A"]}
+
+    # Loaded rollup is updated in place, without rescanning the log
+    sm.log_session("B", success=False)
+    sm.log_session("A", success=True)
+    today = datetime.date.today().isoformat()
+    assert sm.rollup.day(today)["successes"] == 2
+    assert sm.rollup.week(week_key(today))["failures"] == 1
+    assert sm.get_weekly_stats()["count"] == 3
+    sm.close()
+    assert os.path.exists(sm.rollup.cache_file)
+
+    sm2 = SessionManager(log_file=str(log_path))
+    assert sorted(sm2.get_daily_stats()["focus_areas"]) == ["A", "B"]
+
+
+def test_rollup_catches_up_and_rebuilds(tmp_path):
+    log_path = tmp_path / "sessions.log"
+    sm = SessionManager(log_file=str(log_path))
+    sm.log_session("A", success=True)
+    assert sm.get_daily_stats()["count"] == 1
+    sm.close()
+
+    # Another writer appended to the log: the tail is folded in
+    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with open(log_path, "a") as file:
+        file.write(f"Session 2 completed at {now} - C - success\n")
+    assert SessionManager(log_file=str(log_path)).get_daily_stats()["count"] == 2
+
+    # The log was rewritten: the cache is rebuilt from scratch
+    log_path.write_text(f"Session 1 completed at {now} - D - failed\n")
+    assert SessionManager(log_file=str(log_path)).get_daily_stats() == {
+        "count": 1, "focus_areas": ["D"],
+    }
+
+
+def test_rewritten_log_that_grew_is_rebuilt(tmp_path):
+    log_path = tmp_path / "sessions.log"
+    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    log_path.write_text(f"Session 1 completed at {now} - A - success\n")
+    sm = SessionManager(log_file=str(log_path))
+    assert sm.get_daily_stats()["count"] == 1
+    sm.close()
+
+    # Same first line length, different content, and longer overall
+    log_path.write_text(
+        f"Session 1 completed at {now} - B - success\n"
+        f"Session 2 completed at {now} - C - success\n"
+    )
+    assert SessionManager(log_file=str(log_path)).get_daily_stats() == {
+        "count": 2, "focus_areas": ["B", "C"],
+    }
+
+
+def test_segment_roll_invalidates_rollup(tmp_path):
+    log_path = tmp_path / "sessions.log"
+    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    log_path.write_text(f"Session 1 completed at {now} - A - success\n")
+    sm = SessionManager(log_file=str(log_path))
+    assert sm.get_daily_stats()["count"] == 1
+    sm.close()
+
+    # An older month in front of today's entries is rolled into a segment
+    with open(log_path, "w") as file:
+        file.write("Session 1 completed at 2000-01-01 09:00:00 - Old - success\n")
+        for number, text in ((2, "X"), (3, "Y"), (4, "Z")):
+            file.write(f"Session {number} completed at {now} - {text} - success\n")
+    sm = SessionManager(log_file=str(log_path), segmented=True)
+    assert sm.get_daily_stats() == {"count": 3, "focus_areas": ["X", "Y", "Z"]}
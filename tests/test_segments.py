@@ -0,0 +1,126 @@
+import datetime
+import gzip
+
+import pytest
+
+from pomodoro import segments as segments_module
+from pomodoro.session import SessionManager
+
+HISTORY = [
+    "Session 1 completed at 2024-11-03 09:00:00 - A - success\n",
+    "Event at 2024-11-03 09:30:00 - Paused Focus\n",
+    "Session 2 completed at 2024-11-20 10:00:00 - B - failed\n",
+    "Session 3 completed at 2024-12-01 11:00:00 - C - success\n",
+]
+
+
+def test_roll_into_monthly_segments(tmp_path):
+    log_path = tmp_path / "pomodoro_sessions.log"
+    log_path.write_text("".join(HISTORY))
+
+    sm = SessionManager(log_file=str(log_path), segmented=True)
+    assert sm.get_session_count() == 3
+    assert log_path.read_text() == ""
+
+    manifest = sm.segments.segments
+    assert [s["month"] for s in manifest] == ["2024-11", "2024-12"]
+    assert manifest[0]["sessions"] == 2 and manifest[0]["successes"] == 1
+    assert manifest[0]["first"] == "2024-11-03 09:00:00"
+    with gzip.open(tmp_path / "pomodoro_sessions.2024-11.log.gz", "rt") as file:
+        assert file.read() == "".join(HISTORY[:3])
+
+    sm.log_session("D", success=True)
+    sm.close()
+
+    # Restart: count comes from the manifest plus the active month only
+    sm2 = SessionManager(log_file=str(log_path), segmented=True)
+    assert sm2.get_session_count() == 4
+    today = datetime.date.today().isoformat()
+    assert sm2.get_daily_stats()["focus_areas"] == ["D"]
+    assert [r.number for r in sm2.iter_records(today, today)] == [4]
+
+
+def test_range_query_opens_only_overlapping_segments(tmp_path, monkeypatch):
+    log_path = tmp_path / "pomodoro_sessions.log"
+    log_path.write_text("".join(HISTORY))
+    sm = SessionManager(log_file=str(log_path), segmented=True)
+
+    opened = []
+    real_open = segments_module.gzip.open
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(str(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(segments_module.gzip, "open", tracking_open)
+    records = list(sm.iter_records("2024-12-01", "2024-12-31"))
+    assert [r.number for r in records] == [3]
+    assert len(opened) == 1 and opened[0].endswith("2024-12.log.gz")
+
+
+LATE = [
+    "Session 4 completed at 2024-11-25 09:00:00 - D - success\n",
+    "Session 5 completed at 2024-10-02 09:00:00 - E - success\n",
+    "Session 6 completed at 2024-11-10 09:00:00 - F - success\n",
+]
+
+
+def _rolled(tmp_path):
+    log_path = tmp_path / "pomodoro_sessions.log"
+    log_path.write_text("".join(HISTORY))
+    segments_module.LogSegments(str(log_path)).roll("2025-01")
+    # Late entries for closed months arrive, out of order
+    log_path.write_text("".join(LATE))
+    return log_path
+
+
+def _november(tmp_path):
+    with gzip.open(tmp_path / "pomodoro_sessions.2024-11.log.gz", "rt") as file:
+        return file.read()
+
+
+def test_failed_roll_before_replace_is_not_duplicated(tmp_path, monkeypatch):
+    log_path = _rolled(tmp_path)
+    real_replace = segments_module.os.replace
+
+    def failing_replace(src, dst):
+        if dst == str(log_path):
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(segments_module.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        segments_module.LogSegments(str(log_path)).roll("2025-01")
+    monkeypatch.setattr(segments_module.os, "replace", real_replace)
+
+    segments = segments_module.LogSegments(str(log_path))
+    assert segments.pending is None
+    assert segments.roll("2025-01") == 3
+    assert _november(tmp_path) == "".join(HISTORY[:3] + [LATE[0], LATE[2]])
+    assert segments.session_count() == 6
+    # The late 2024-11-10 line follows later dates in the segment
+    assert len(list(segments.iter_lines("2024-11-01", "2024-11-15"))) == 3
+
+
+def test_crash_after_replace_is_finished_once(tmp_path, monkeypatch):
+    log_path = _rolled(tmp_path)
+
+    def crash(self):
+        raise RuntimeError("killed")
+
+    monkeypatch.setattr(segments_module.LogSegments, "_commit_pending", crash)
+    with pytest.raises(RuntimeError):
+        segments_module.LogSegments(str(log_path)).roll("2025-01")
+    monkeypatch.undo()
+    assert log_path.read_text() == ""
+
+    # The append into November also ran before the crash
+    segment = tmp_path / "pomodoro_sessions.2024-11.log.gz"
+    with open(segment, "ab") as dst:
+        dst.write((tmp_path / "pomodoro_sessions.2024-11.log.gz.tmp").read_bytes())
+
+    segments = segments_module.LogSegments(str(log_path))
+    assert segments.roll("2025-01") == 3
+    assert _november(tmp_path) == "".join(HISTORY[:3] + [LATE[0], LATE[2]])
+    assert segments.session_count() == 6
+    assert segments_module.LogSegments(str(log_path)).roll("2025-01") == 0
@@ -32,3 +32,23 @@ def test_daily_stats(tmp_path, monkeypatch):
     # Focus areas include suffixed status; ensure entries exist
     assert any("A" in f for f in stats["focus_areas"]) or any("B" in f for f in stats["focus_areas"]) 
 
+
+def test_unbuffered_log_is_utf8_under_any_locale(tmp_path, monkeypatch):
+    import builtins
+
+    from pomodoro import session
+
+    def latin1_open(file, mode="r", *args, **kwargs):
+        # Stand in for a non-UTF-8 locale
+        if "b" not in mode:
+            kwargs.setdefault("encoding", "latin-1")
+        return builtins.open(file, mode, *args, **kwargs)
+
+    monkeypatch.setattr(session, "open", latin1_open, raising=False)
+    log_path = tmp_path / "sessions.log"
+    sm = SessionManager(log_file=str(log_path), flush_policy=None)
+    sm.log_session("Café ☕", success=True)
+    sm.log_session("Naïve", success=True)
+
+    assert "Café ☕" in log_path.read_bytes().decode("utf-8")
+    assert sm.get_daily_stats()["focus_areas"] == ["Café ☕", "Naïve"]
@@ -0,0 +1,57 @@
+import datetime
+import os
+
+from pomodoro.session import SessionManager
+from pomodoro.session_index import DayOffsetIndex
+
+LINES = [
+    "Session 1 completed at 2025-01-01 09:00:00 - A - success\n",
+    "Event at 2025-01-01 09:30:00 - Paused Focus\n",
+    "Session 2 completed at 2025-01-02 10:00:00 - B - failed\n",
+    "Session 3 completed at 2025-01-04 11:00:00 - C - success\n",
+]
+
+
+def test_rebuild_maps_dates_to_offsets(tmp_path):
+    log_path = tmp_path / "sessions.log"
+    log_path.write_text("".join(LINES))
+    index = DayOffsetIndex(str(log_path))
+    index.load()
+
+    assert os.path.exists(index.index_file)
+    assert index.days["2025-01-01"] == 0
+    assert index.days["2025-01-02"] == len(LINES[0]) + len(LINES[1])
+    # Missing dates resolve to the next indexed date
+    assert index.offset_for("2025-01-03") == index.days["2025-01-04"]
+    assert index.offset_for("2025-01-05") is None
+
+
+def test_stale_index_is_caught_up_or_rebuilt(tmp_path):
+    log_path = tmp_path / "sessions.log"
+    log_path.write_text("".join(LINES[:2]))
+    DayOffsetIndex(str(log_path)).load()
+
+    # Appended tail is picked up
+    with open(log_path, "a") as file:
+        file.write(LINES[2])
+    index = DayOffsetIndex(str(log_path))
+    index.load()
+    assert "2025-01-02" in index.days
+
+    # Rewritten log triggers a full rebuild
+    log_path.write_text(LINES[3])
+    index = DayOffsetIndex(str(log_path))
+    index.load()
+    assert index.days == {"2025-01-04": 0}
+
+
+def test_iter_lines_uses_date_range(tmp_path):
+    log_path = tmp_path / "sessions.log"
+    log_path.write_text("".join(LINES))
+    sm = SessionManager(log_file=str(log_path))
+
+    assert list(sm.iter_lines("2025-01-02", "2025-01-03")) == [LINES[2]]
+    sm.log_event("Started Rest")
+    assert sm.index.size == os.path.getsize(log_path)
+    today = datetime.date.today().isoformat()
+    assert [line.rsplit(" - ", 1)[1] for line in sm.iter_lines(today)] == ["Started Rest\n"]
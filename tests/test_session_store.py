@@ -0,0 +1,35 @@
+from pomodoro.session import SessionManager
+from pomodoro.records import SessionRecord
+from pomodoro.session_store import SqliteSessionStore
+
+
+def test_sqlite_backend_imports_text_log_once(tmp_path):
+    log_path = tmp_path / "sessions.log"
+    db_path = tmp_path / "sessions.db"
+    sm = SessionManager(log_file=str(log_path))
+    sm.log_session("Deep Work", success=True)
+    sm.log_event("Paused Focus")
+    sm.log_session("Review", success=False)
+
+    sm_db = SessionManager(log_file=str(log_path), db_file=str(db_path))
+    assert sm_db.get_session_count() == 2
+    assert sm_db.log_session("Deep Work", success=True) == 3
+    stats = sm_db.get_daily_stats()
+    assert stats["count"] == 3
+    assert sorted(stats["focus_areas"]) == ["Deep Work", "Review"]
+    sm_db.close()
+
+    # Re-opening must not import the text log a second time
+    sm_db2 = SessionManager(log_file=str(log_path), db_file=str(db_path))
+    assert sm_db2.get_session_count() == 3
+    sm_db2.close()
+
+
+def test_store_daily_stats_is_per_day(tmp_path):
+    store = SqliteSessionStore(str(tmp_path / "s.db"))
+    store.add(SessionRecord("session", "2025-01-01 23:59:59", 1, "A", status="success"))
+    store.add(SessionRecord("session", "2025-01-02 00:00:00", 2, "B", status="failed"))
+    store.add(SessionRecord("event", "2025-01-02 00:10:00", focus_text="Paused Focus"))
+    assert store.daily_stats("2025-01-02") == {"count": 1, "focus_areas": ["B"]}
+    assert [r.number for r in store.iter_records("2025-01-02", "2025-01-02")] == [2, None]
+    store.close()
@@ -0,0 +1,25 @@
+import os
+
+from pomodoro.simulate import format_report, run_simulation, summarize_latencies
+
+
+def test_simulation_drives_every_sink(tmp_path):
+    report = run_simulation(cycles=21, data_dir=str(tmp_path), pause_every=3, abandon_every=7, exit_every=10)
+
+    sinks = report["sinks"]
+    # Every cycle logs one session, completed or stopped early
+    assert sinks["session.log_session"]["calls"] == 21
+    assert sinks["sound.play_focus_end"]["calls"] == 21 - 3
+    assert sinks["sound.play_rest_end"]["calls"] == 21 - 3
+    assert sinks["notes.record_pomodoro_session"]["calls"] > 21
+    assert report["notes"]["pending"] == 0
+    assert os.path.exists(tmp_path / "pomodoro_sessions.log")
+    assert os.listdir(tmp_path / "vault")
+    assert "session.log_session" in format_report(report)
+
+
+def test_summarize_latencies_percentiles():
+    stats = summarize_latencies([i / 1e6 for i in range(1, 101)])
+    assert stats["calls"] == 100
+    assert (stats["p50_us"], stats["p95_us"], stats["p99_us"], stats["max_us"]) == (50, 95, 99, 100)
+    assert summarize_latencies([]) == {"calls": 0, "total_ms": 0.0}
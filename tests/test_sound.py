@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+
+from pomodoro.config import Config
+from pomodoro.sound import SoundManager
+
+
+def test_play_is_queued_to_audio_worker(tmp_path, monkeypatch):
+    config = Config(config_path=str(tmp_path / "config.json"))
+    manager = SoundManager(config)
+    played = []
+    release = threading.Event()
+    monkeypatch.setattr(manager, "_init_backend", lambda: True)
+    monkeypatch.setattr(manager, "warm_cache", lambda: release.wait(5))
+    monkeypatch.setattr(
+        manager, "_play_sound", lambda *args: played.append((threading.current_thread().name, args))
+    )
+
+    # Returns immediately even though the worker is still busy
+    manager.play_focus_end()
+    assert played == []
+    release.set()
+    manager.close()
+
+    assert played == [("pomodoro-audio", (config.get_focus_sound(), config.get_focus_volume()))]
+
+
+def test_missing_audio_device_is_a_no_op(tmp_path, monkeypatch):
+    config = Config(config_path=str(tmp_path / "config.json"))
+    manager = SoundManager(config)
+    played = []
+    monkeypatch.setattr(manager, "_init_backend", lambda: False)
+    monkeypatch.setattr(manager, "_play_sound", lambda *args: played.append(args))
+
+    manager.play_focus_end()
+    manager.play_rest_end()
+    manager.close()
+
+    assert played == []
+    assert not manager._thread.is_alive()
+
+
+def test_backend_selection_falls_back_to_null(monkeypatch):
+    from pomodoro import audio_backends
+
+    assert isinstance(audio_backends.open_backend("null"), audio_backends.NullBackend)
+
+    monkeypatch.setattr(audio_backends.PygameBackend, "available", classmethod(lambda cls: False))
+    monkeypatch.setattr(audio_backends.SubprocessBackend, "available", classmethod(lambda cls: False))
+    monkeypatch.setattr(audio_backends.QtMultimediaBackend, "available", classmethod(lambda cls: False))
+    assert audio_backends.candidate_backends("auto") == [audio_backends.NullBackend]
+
+
+def test_auto_prefers_pygame_even_in_the_gui(monkeypatch):
+    import sys
+
+    from pomodoro import audio_backends
+
+    for backend in (audio_backends.PygameBackend, audio_backends.SubprocessBackend, audio_backends.QtMultimediaBackend):
+        monkeypatch.setattr(backend, "available", classmethod(lambda cls: True))
+    monkeypatch.setitem(sys.modules, "PyQt6.QtWidgets", sys.modules.get("PyQt6.QtWidgets", object()))
+    assert [backend.name for backend in audio_backends.candidate_backends("auto")] == [
+        "pygame", "qt", "subprocess", "null",
+    ]
+
+    with pytest.raises(RuntimeError):
+        audio_backends.QtMultimediaBackend().load("alert.wav", 0.5)
+
+
+def test_headless_auto_skips_pygame_unless_configured(monkeypatch):
+    from pomodoro import audio_backends
+
+    for backend in (audio_backends.PygameBackend, audio_backends.SubprocessBackend):
+        monkeypatch.setattr(backend, "available", classmethod(lambda cls: True))
+    assert [backend.name for backend in audio_backends.candidate_backends("auto", headless=True)] == [
+        "subprocess", "null",
+    ]
+    assert audio_backends.candidate_backends("pygame", headless=True)[0] is audio_backends.PygameBackend
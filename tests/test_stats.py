@@ -0,0 +1,64 @@
+import json
+
+from pomodoro import cli, utils
+from pomodoro.records import SessionRecord
+from pomodoro.stats import compute_stats
+
+
+def _session(ts, status="success", minutes=None):
+    return SessionRecord("session", ts, focus_text="x", actual_minutes=minutes, status=status)
+
+
+def test_compute_stats_streak_hours_and_periods():
+    records = [
+        _session("2025-01-01 09:00:00", minutes=25),
+        _session("2025-01-02 09:30:00", minutes=25),
+        _session("2025-01-02 14:00:00", status="failed", minutes=10),
+        _session("2025-01-03 09:10:00"),
+        _session("2025-01-05 09:00:00"),
+    ]
+    stats = compute_stats(records, period="day", limit=2)
+
+    assert stats["sessions"] == 5
+    assert stats["successes"] == 4
+    assert stats["success_rate"] == 0.8
+    assert stats["focus_minutes"] == 60
+    assert stats["longest_streak"] == {"days": 3, "start": "2025-01-01", "end": "2025-01-03"}
+    assert stats["busiest_hours"][0] == {"hour": 9, "sessions": 4}
+    assert [p["period"] for p in stats["periods"]] == ["2025-01-03", "2025-01-05"]
+
+    weekly = compute_stats(records, period="week", limit=None)
+    assert [(p["period"], p["sessions"]) for p in weekly["periods"]] == [("2025-W01", 5)]
+
+
+def test_stats_command_json(tmp_path, monkeypatch, capsys):
+    log_path = tmp_path / "pomodoro_sessions.log"
+    log_path.write_text(
+        "Session 1 completed at 2025-01-01 09:00:00 - A - success\n"
+        "Event at 2025-01-01 09:10:00 - Session completed - success\n"
+        "Session 2 completed at 2025-02-01 10:00:00 - B - failed\n"
+    )
+    monkeypatch.setattr(utils, "get_user_data_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(utils, "get_config_path", lambda: str(tmp_path / "config.json"))
+
+    cli.main(["stats", "--period", "month", "--format", "json"])
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["sessions"] == 2
+    assert [p["period"] for p in stats["periods"]] == ["2025-01", "2025-02"]
+
+    cli.main(["stats", "--since", "2025-02-01"])
+    assert "Sessions        1" in capsys.readouterr().out
+
+
+def test_stats_command_is_read_only_and_flags_missing_minutes(tmp_path, monkeypatch, capsys):
+    log_path = tmp_path / "pomodoro_sessions.log"
+    log_path.write_text("Session 1 completed at 2025-01-01 09:00:00 - A - success\n")
+    monkeypatch.setattr(utils, "get_user_data_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(utils, "get_config_path", lambda: str(tmp_path / "config.json"))
+
+    cli.main(["stats"])
+
+    assert "Focus minutes   n/a" in capsys.readouterr().out
+    # No sidecar index or rollup is written by a stats run
+    assert not [path for path in tmp_path.iterdir() if path.name.startswith("pomodoro_sessions.log.")]
+    assert compute_stats([_session("2025-01-01 09:00:00")])["focus_minutes"] is None
@@ -0,0 +1,48 @@
+import os
+
+from pomodoro import utils
+from pomodoro.config import Config
+
+
+def test_resource_cache_hits_and_eviction(tmp_path, monkeypatch):
+    utils.invalidate_resource_path()
+    resolved = []
+
+    def fake_resolve(name):
+        resolved.append(name)
+        path = tmp_path / name
+        return str(path) if path.exists() else None
+
+    monkeypatch.setattr(utils, "_resolve_resource_path", fake_resolve)
+    monkeypatch.setattr(utils, "RESOURCE_CACHE_SIZE", 2)
+    for name in ("a.mp3", "b.mp3", "c.mp3"):
+        (tmp_path / name).write_bytes(b"x")
+
+    before = utils.get_resource_cache_stats()
+    assert utils.get_resource_path("a.mp3") == str(tmp_path / "a.mp3")
+    assert utils.get_resource_path("a.mp3") == str(tmp_path / "a.mp3")
+    stats = utils.get_resource_cache_stats()
+    assert stats["hits"] - before["hits"] == 1
+    assert stats["misses"] - before["misses"] == 1
+
+    utils.get_resource_path("b.mp3")
+    utils.get_resource_path("c.mp3")  # evicts a.mp3
+    assert utils.get_resource_cache_stats()["size"] == 2
+    utils.get_resource_path("a.mp3")
+    assert resolved == ["a.mp3", "b.mp3", "c.mp3", "a.mp3"]
+
+    # A cached path that disappears is resolved again
+    os.remove(tmp_path / "c.mp3")
+    assert utils.get_resource_path("c.mp3") == "c.mp3"
+    assert resolved[-1] == "c.mp3"
+
+
+def test_config_sound_change_invalidates_cache(tmp_path, monkeypatch):
+    c = Config(config_path=str(tmp_path / "config.json"))
+    old = c.get_focus_sound()
+    monkeypatch.setattr(utils, "_resolve_resource_path", lambda name: str(tmp_path / "config.json"))
+    utils.get_resource_path(old)
+    assert old in utils._resource_cache
+
+    c.set_sound_settings("focus_end", file_path="sounds/other.mp3")
+    assert old not in utils._resource_cache